@@ -1,81 +1,527 @@
-from selenium.webdriver.support.ui import WebDriverWait
+import uuid
+import weakref
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.impact_map import ImpactMap
+from utils.locator_registry import LocatorRegistry, TextLocator
 from utils.logger import Logger
+from utils.network_capture import NetworkCapture
+from utils.step_timer import StepTimer
+from utils.wait_policy import WaitPolicy
+
+# Script que instrumenta fetch/XHR para contar peticiones pendientes; se registra
+# vía CDP para que corra al inicio de cada documento, antes que los de la página
+_INSTALAR_MONITOR_RED_JS = """
+(function() {
+    if (!window.__tlRed) {
+        var red = window.__tlRed = {pendientes: 0};
+        if (window.fetch) {
+            var fetchOriginal = window.fetch;
+            window.fetch = function() {
+                red.pendientes++;
+                return fetchOriginal.apply(this, arguments).then(
+                    function(r) { red.pendientes--; return r; },
+                    function(e) { red.pendientes--; throw e; }
+                );
+            };
+        }
+        var sendOriginal = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function() {
+            red.pendientes++;
+            this.addEventListener('loadend', function() { red.pendientes--; });
+            try {
+                return sendOriginal.apply(this, arguments);
+            } catch (e) {
+                red.pendientes--;
+                throw e;
+            }
+        };
+    }
+})();
+"""
+
+_MONITOR_RED_JS = _INSTALAR_MONITOR_RED_JS + "return window.__tlRed.pendientes;"
+
+# Script asíncrono: termina cuando el DOM no cambia durante arguments[0] ms
+_DOM_ESTABLE_JS = """
+var quietoMs = arguments[0], maximoMs = arguments[1], done = arguments[arguments.length - 1];
+var terminado = false, timer = null, limite = null;
+var observer = new MutationObserver(function() {
+    clearTimeout(timer);
+    timer = setTimeout(function() { fin(true); }, quietoMs);
+});
+function fin(estable) {
+    if (terminado) { return; }
+    terminado = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(limite);
+    done(estable);
+}
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+timer = setTimeout(function() { fin(true); }, quietoMs);
+limite = setTimeout(function() { fin(false); }, maximoMs);
+"""
+
+# Script asíncrono: termina cuando la posición de scroll se mantiene quieta
+_SCROLL_TERMINADO_JS = """
+var maximoMs = arguments[0], done = arguments[arguments.length - 1];
+var ultima = null, estables = 0, inicio = Date.now();
+(function chequear() {
+    var posicion = window.scrollX + ',' + window.scrollY;
+    estables = (posicion === ultima) ? estables + 1 : 0;
+    ultima = posicion;
+    if (estables >= 3) { return done(true); }
+    if (Date.now() - inicio > maximoMs) { return done(false); }
+    setTimeout(chequear, 50);
+})();
+"""
+
+# Índice de textos de la página: se arma una vez por carga (y por sección) y se
+# descarta cuando cambia el DOM, así las búsquedas repetidas no recorren todo el documento
+_INDICE_TEXTO_JS = """
+function visible(el) {
+    var estilo = window.getComputedStyle(el);
+    if (estilo.display === 'none' || estilo.visibility === 'hidden' || parseFloat(estilo.opacity) === 0) {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+if (!window.__tlTextos) {
+    window.__tlTextos = (function() {
+        var cache = {};
+        new MutationObserver(function() { cache = {}; }).observe(document.documentElement, {
+            childList: true, subtree: true, characterData: true
+        });
+        function entradas(scope) {
+            var clave = scope || '';
+            if (!cache[clave]) {
+                var raiz = scope ? document.getElementById(scope) : document.body;
+                var lista = [];
+                if (raiz) {
+                    var walker = document.createTreeWalker(raiz, NodeFilter.SHOW_TEXT);
+                    while (walker.nextNode()) {
+                        if (walker.currentNode.nodeValue.trim()) {
+                            lista.push([walker.currentNode.nodeValue, walker.currentNode.parentElement]);
+                        }
+                    }
+                }
+                cache[clave] = lista;
+            }
+            return cache[clave];
+        }
+        return {
+            buscar: function(texto, scope) {
+                var nodos = [];
+                entradas(scope).forEach(function(e) {
+                    if (e[0].indexOf(texto) !== -1 && nodos.indexOf(e[1]) === -1) { nodos.push(e[1]); }
+                });
+                return nodos;
+            }
+        };
+    })();
+}
+"""
+
+# Devuelve el primer elemento visible que contiene arguments[0] (dentro del id arguments[1]) o null
+_BUSCAR_TEXTO_JS = _INDICE_TEXTO_JS + """
+var nodos = window.__tlTextos.buscar(arguments[0], arguments[1]);
+for (var i = 0; i < nodos.length; i++) {
+    if (visible(nodos[i])) { return nodos[i]; }
+}
+return null;
+"""
+
+# Funciones para resolver en el navegador locators de Selenium y de texto ({by, value, scope})
+_LOCALIZAR_JS = _INDICE_TEXTO_JS + """
+function porXPath(expr, raiz) {
+    var snap = document.evaluate(expr, raiz || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodos = [];
+    for (var i = 0; i < snap.snapshotLength; i++) { nodos.push(snap.snapshotItem(i)); }
+    return nodos;
+}
+function porLinkText(texto, parcial) {
+    return Array.prototype.filter.call(document.getElementsByTagName('a'), function(a) {
+        var t = a.innerText.trim();
+        return parcial ? t.indexOf(texto) !== -1 : t === texto;
+    });
+}
+function buscar(c) {
+    switch (c.by) {
+        case 'texto': return window.__tlTextos.buscar(c.value, c.scope);
+        case 'xpath': return porXPath(c.value);
+        case 'css selector': return Array.prototype.slice.call(document.querySelectorAll(c.value));
+        case 'id': return Array.prototype.slice.call(document.querySelectorAll('[id="' + CSS.escape(c.value) + '"]'));
+        case 'name': return Array.prototype.slice.call(document.getElementsByName(c.value));
+        case 'class name': return Array.prototype.slice.call(document.getElementsByClassName(c.value));
+        case 'tag name': return Array.prototype.slice.call(document.getElementsByTagName(c.value));
+        case 'link text': return porLinkText(c.value, false);
+        case 'partial link text': return porLinkText(c.value, true);
+    }
+    throw new Error('Locator no soportado: ' + c.by);
+}
+"""
+
+# Script que evalúa un lote de locators/textos en un solo round trip
+_CONSULTA_LOTE_JS = _LOCALIZAR_JS + """
+var consultas = arguments[0], resultado = {};
+for (var i = 0; i < consultas.length; i++) {
+    var nodos = buscar(consultas[i]).filter(function(n) { return n; });
+    resultado[consultas[i].nombre] = {
+        presente: nodos.length > 0,
+        visible: nodos.some(visible)
+    };
+}
+return resultado;
+"""
+
+# Completa un formulario en un solo round trip. Si falta algún campo visible no toca
+# ninguno y devuelve los nombres faltantes. El valor se asigna con el setter nativo
+# (así lo detectan React y otros frameworks) y se disparan input y change
+_LLENAR_FORMULARIO_JS = _LOCALIZAR_JS + """
+var campos = arguments[0], elementos = [], faltantes = [];
+for (var i = 0; i < campos.length; i++) {
+    var el = buscar(campos[i]).filter(function(n) { return n && visible(n); })[0];
+    if (el) { elementos.push(el); } else { faltantes.push(campos[i].nombre); }
+}
+if (faltantes.length) { return faltantes; }
+for (var j = 0; j < elementos.length; j++) {
+    var el = elementos[j];
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : HTMLInputElement.prototype;
+    el.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, campos[j].valor);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+}
+return faltantes;
+"""
+
+# Verifica que el documento sea el que cargamos (mismo token y URL); si lo es, vuelve arriba
+_MISMA_PAGINA_JS = """
+var coincide = window.__tlToken === arguments[0]
+    && location.href.split('#')[0].replace(/\\/$/, '') === arguments[1];
+if (coincide) { window.scrollTo(0, 0); }
+return coincide;
+"""
+
+# Estado de navegación por driver: URL cargada, token del documento y si hubo interacción
+_NAVEGACION = weakref.WeakKeyDictionary()
+
+# Drivers que ya tienen registrado el monitor de red para cada documento nuevo
+_MONITOR_REGISTRADO = weakref.WeakSet()
+
+def _normalizar_url(url):
+    return url.split("#")[0].rstrip("/")
 
 class BasePage:
     """Clase base que contiene métodos genéricos para interactuar con la página."""
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10) # Espera explícita de 10 segundos
+        self.policy = WaitPolicy.actual() # Esperas implícitas/explícitas compartidas con los fixtures
         self.logger = Logger.get_logger(__name__)
+        ImpactMap.actual().usar_pagina(type(self))
+
+    def _abrir(self, url, force=False):
+        """Navega a url salvo que el driver ya tenga una copia limpia de esa página.
+
+        Una copia es limpia si es el mismo documento que cargamos (no hubo otra
+        navegación) y ningún page object interactuó con ella (click, type,
+        upload). En ese caso solo se vuelve al inicio de la página. Devuelve
+        True si hubo una carga real.
+        """
+        estado = _NAVEGACION.get(self.driver)
+        if not force and estado and not estado["sucia"] and estado["url"] == _normalizar_url(url):
+            if self.driver.execute_script(_MISMA_PAGINA_JS, estado["token"], estado["url"]):
+                self.wait_for_scroll_end()
+                self.logger.info("Página ya cargada y sin cambios, se reutiliza: %s", url)
+                return False
+
+        captura = NetworkCapture.de(self.driver) # Solo con --network-capture
+        if captura:
+            captura.antes_de_cargar()
+        self._registrar_monitor_red()
+        self.driver.get(url)
+        self.wait_for_page_ready()
+        token = uuid.uuid4().hex
+        self.driver.execute_script("window.__tlToken = arguments[0];", token)
+        _NAVEGACION[self.driver] = {"url": _normalizar_url(url), "token": token, "sucia": False}
+        if captura:
+            captura.registrar_carga(type(self).__name__, url) # Falla si excede el presupuesto de red
+        return True
+
+    def _registrar_monitor_red(self):
+        """Registra el monitor de fetch/XHR para que vea también las peticiones de la carga inicial."""
+        if self.driver in _MONITOR_REGISTRADO:
+            return
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": _INSTALAR_MONITOR_RED_JS}
+            )
+        except (AttributeError, WebDriverException):
+            # Sin CDP el monitor se inyecta al consultarlo y no ve las peticiones ya en curso
+            self.logger.debug("CDP no disponible: el monitor de red se inyecta después de la carga")
+        _MONITOR_REGISTRADO.add(self.driver)
+
+    def _marcar_sucia(self):
+        """Indica que la página cambió por una interacción y no puede reutilizarse."""
+        estado = _NAVEGACION.get(self.driver)
+        if estado:
+            estado["sucia"] = True
+
+    def _paso(self, accion, locator=None):
+        """Mide un paso del page object (tiempo de espera y de comando)."""
+        ImpactMap.actual().usar_locator(type(self), locator)
+        return StepTimer.actual().paso(accion, type(self).__name__, locator)
 
     def find(self, locator):
         """Espera a que un elemento sea visible y lo devuelve."""
+        if isinstance(locator, TextLocator):
+            return self.find_text(locator)
+        with self._paso("find", locator):
+            try:
+                element = self.policy.until(self.driver, EC.visibility_of_element_located(locator))
+                self.logger.info("Elemento encontrado: %s", locator)
+                return element
+            except TimeoutException:
+                self.logger.error("Timeout al buscar elemento: %s", locator)
+                raise
+
+    def find_text(self, locator, timeout=None):
+        """Espera a que un TextLocator sea visible usando el índice de textos de la página."""
+        with self._paso("find_text", locator):
+            try:
+                element = self.policy.until(
+                    self.driver,
+                    lambda d: d.execute_script(_BUSCAR_TEXTO_JS, locator.texto, locator.scope),
+                    timeout, poll_frequency=0.25
+                )
+                self.logger.info("Texto encontrado: %s", locator)
+                return element
+            except TimeoutException:
+                self.logger.error("Timeout al buscar texto: %s", locator)
+                raise
+
+    def is_text_visible(self, locator, timeout=None):
+        """Verifica si un TextLocator es visible (consulta el índice de textos, sin XPath)."""
+        ImpactMap.actual().usar_locator(type(self), locator)
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Elemento encontrado: {locator}")
-            return element
+            self.policy.until(
+                self.driver,
+                lambda d: d.execute_script(_BUSCAR_TEXTO_JS, locator.texto, locator.scope),
+                timeout, poll_frequency=0.25
+            )
+            return True
         except TimeoutException:
-            self.logger.error(f"Timeout al buscar elemento: {locator}")
-            raise
+            return False
 
     def click(self, locator):
         """Hace clic en un elemento."""
-        element = self.find(locator)
-        element.click()
-        self.logger.info(f"Click realizado en: {locator}")
+        with self._paso("click", locator):
+            self._marcar_sucia()
+            element = self.find(locator)
+            element.click()
+            self.logger.info("Click realizado en: %s", locator)
 
     def type(self, locator, text):
         """Escribe texto en un campo (limpiándolo primero)."""
-        element = self.find(locator)
-        element.clear()
-        element.send_keys(text)
-        self.logger.info(f"Texto '{text}' ingresado en: {locator}")
+        with self._paso("type", locator):
+            self._marcar_sucia()
+            element = self.find(locator)
+            element.clear()
+            element.send_keys(text)
+            self.logger.info("Texto '%s' ingresado en: %s", text, locator)
+
+    def fill_form(self, campos, teclear=False, timeout=None):
+        """Completa varios campos {locator: valor} en un solo execute_script.
+
+        Espera a que todos los campos estén visibles, asigna los valores y
+        dispara los eventos input y change de cada uno. Con teclear=True
+        escribe tecla por tecla con type() (para tests que necesitan
+        eventos de teclado reales).
+        """
+        if teclear:
+            for locator, valor in campos.items():
+                self.type(locator, valor)
+            return
+
+        with self._paso("fill_form", ", ".join(str(locator) for locator in campos)):
+            self._marcar_sucia()
+            consultas = []
+            for locator, valor in campos.items():
+                consulta = self._consulta(str(locator), locator)
+                consulta["valor"] = "" if valor is None else str(valor)
+                consultas.append(consulta)
+
+            faltantes = []
+
+            def completado(driver):
+                nonlocal faltantes
+                faltantes = driver.execute_script(_LLENAR_FORMULARIO_JS, consultas)
+                return not faltantes
+
+            try:
+                self.policy.until(self.driver, completado, timeout, poll_frequency=0.25)
+            except TimeoutException:
+                self.logger.error("Timeout al completar formulario, campos no visibles: %s", faltantes)
+                raise
+            self.logger.info("Formulario completado en un solo script: %s campos", len(consultas))
 
     def get_text(self, locator):
         """Obtiene el texto de un elemento."""
-        text = self.find(locator).text
-        self.logger.info(f"Texto obtenido de {locator}: {text}")
-        return text
+        with self._paso("get_text", locator):
+            text = self.find(locator).text
+            self.logger.info("Texto obtenido de %s: %s", locator, text)
+            return text
 
-    def is_element_visible(self, locator, timeout=10):
+    def is_element_visible(self, locator, timeout=None):
         """Verifica si un elemento es visible."""
+        ImpactMap.actual().usar_locator(type(self), locator)
+        if isinstance(locator, TextLocator):
+            return self.is_text_visible(locator, timeout)
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            self.policy.until(
+                self.driver, EC.visibility_of_element_located(locator), timeout
             )
             return True
         except TimeoutException:
             return False
 
     def is_element_present(self, locator):
-        """Verifica si un elemento está presente en el DOM."""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        """Verifica si un elemento está presente en el DOM (sin esperar)."""
+        ImpactMap.actual().usar_locator(type(self), locator)
+        with self.policy.sin_espera_implicita(self.driver):
+            return len(self.driver.find_elements(*LocatorRegistry.resolver(locator))) > 0
+
+    @staticmethod
+    def text_probe(texto, scope=None):
+        """Locator por texto para query_elements/find (scope: id de la sección que lo contiene)."""
+        return LocatorRegistry.texto(texto, scope)
+
+    def _consulta(self, nombre, locator):
+        """Traduce un locator (de Selenium o TextLocator) al formato que entienden los scripts."""
+        ImpactMap.actual().usar_locator(type(self), locator)
+        if isinstance(locator, TextLocator):
+            return {"nombre": nombre, "by": "texto", "value": locator.texto, "scope": locator.scope}
+        return {"nombre": nombre, "by": locator[0], "value": locator[1]}
+
+    def query_elements(self, probes, timeout=0):
+        """Evalúa varios locators o sondas de texto en un solo execute_script.
+
+        Recibe un diccionario {nombre: locator} y devuelve
+        {nombre: {"presente": bool, "visible": bool}}. Con timeout > 0 vuelve
+        a consultar el lote completo hasta que todos sean visibles.
+        """
+        consultas = [self._consulta(nombre, probe) for nombre, probe in probes.items()]
+
+        resultados = self.driver.execute_script(_CONSULTA_LOTE_JS, consultas)
+
+        def todos_visibles(driver):
+            nonlocal resultados
+            resultados = driver.execute_script(_CONSULTA_LOTE_JS, consultas)
+            return all(r["visible"] for r in resultados.values())
+
+        if timeout and not all(r["visible"] for r in resultados.values()):
+            try:
+                self.policy.until(self.driver, todos_visibles, timeout, poll_frequency=0.25)
+            except TimeoutException:
+                pass
+
+        self.logger.info("Consulta en lote de %s elementos: %s", len(consultas), resultados)
+        return resultados
 
     def get_current_url(self):
         """Obtiene la URL actual."""
         url = self.driver.current_url
-        self.logger.info(f"URL actual: {url}")
+        self.logger.info("URL actual: %s", url)
         return url
 
     def scroll_to_element(self, locator):
         """Hace scroll hasta un elemento específico."""
-        element = self.find(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.logger.info(f"Scroll realizado hacia: {locator}")
+        with self._paso("scroll_to_element", locator):
+            element = self.find(locator)
+            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            self.wait_for_scroll_end()
+            self.logger.info("Scroll realizado hacia: %s", locator)
 
-    def wait_for_url_contains(self, text, timeout=10):
+    def wait_for_url_contains(self, text, timeout=None):
         """Espera a que la URL contenga un texto específico."""
+        with self._paso("wait_for_url_contains", f"url~{text}"):
+            try:
+                self.policy.until(
+                    self.driver, EC.url_contains(text), timeout
+                )
+                return True
+            except TimeoutException:
+                return False
+
+    def wait_for_url_change(self, url_anterior, timeout=None):
+        """Espera a que la URL sea distinta de url_anterior."""
+        try:
+            self.policy.until(
+                self.driver, EC.url_changes(url_anterior), timeout
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning("La URL no cambió desde: %s", url_anterior)
+            return False
+
+    def wait_for_document_ready(self, timeout=None):
+        """Espera a que document.readyState sea 'complete'."""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.url_contains(text)
+            self.policy.until(
+                self.driver, lambda d: d.execute_script("return document.readyState;") == "complete", timeout
             )
             return True
         except TimeoutException:
+            self.logger.warning("Timeout esperando document.readyState == 'complete'")
             return False
+
+    def wait_for_network_idle(self, timeout=None):
+        """Espera a que no queden peticiones fetch/XHR pendientes.
+
+        Con Chrome el monitor corre desde el inicio de cada documento (ver
+        _registrar_monitor_red), así que ve también las peticiones de la carga;
+        sin CDP solo cuenta las posteriores a la primera consulta.
+        """
+        try:
+            self.policy.until(
+                self.driver, lambda d: d.execute_script(_MONITOR_RED_JS) == 0, timeout, poll_frequency=0.1
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning("Timeout esperando que terminen las peticiones fetch/XHR")
+            return False
+
+    def wait_for_dom_stable(self, quieto_ms=300, timeout=None):
+        """Espera a que el DOM no tenga cambios durante quieto_ms milisegundos."""
+        timeout = self.policy.explicit if timeout is None else timeout
+        with self.policy.medir():
+            estable = self.driver.execute_async_script(_DOM_ESTABLE_JS, quieto_ms, timeout * 1000)
+        if not estable:
+            self.logger.warning("El DOM siguió cambiando durante %ss", timeout)
+        return estable
+
+    def wait_for_scroll_end(self, timeout=5):
+        """Espera a que termine el scroll (incluido el scroll suave animado)."""
+        with self.policy.medir():
+            terminado = self.driver.execute_async_script(_SCROLL_TERMINADO_JS, timeout * 1000)
+        if not terminado:
+            self.logger.warning("El scroll no terminó en %ss", timeout)
+        return terminado
+
+    def wait_for_page_ready(self, timeout=None):
+        """Espera a que la página esté lista: documento cargado, red ociosa y DOM estable."""
+        listo = (
+            self.wait_for_document_ready(timeout)
+            and self.wait_for_network_idle(timeout)
+            and self.wait_for_dom_stable(timeout=timeout)
+        )
+        self.logger.info("Página lista: %s", listo)
+        return listo
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.locator_registry import LocatorRegistry
 from utils.logger import Logger
 
 class ClientesPage(BasePage):
@@ -8,9 +9,9 @@ class ClientesPage(BasePage):
     # Locators - ACTUALIZADOS
     SECCION_CLIENTES = (By.ID, "clientes")
     TESTIMONIOS = (By.CSS_SELECTOR, ".testimonials, #clientes .card, #clientes .testimonial")
-    TESTIMONIO_ROSS = (By.XPATH, "//*[contains(text(), 'Ross')]")
-    TESTIMONIO_JOEY = (By.XPATH, "//*[contains(text(), 'Joey')]")
-    TESTIMONIO_PHOEBE = (By.XPATH, "//*[contains(text(), 'Phoebe')]")
+    TESTIMONIO_ROSS = LocatorRegistry.texto("Ross")
+    TESTIMONIO_JOEY = LocatorRegistry.texto("Joey")
+    TESTIMONIO_PHOEBE = LocatorRegistry.texto("Phoebe")
     CARRUSEL_NAVEGACION = (By.CSS_SELECTOR, ".carousel-control-next, .slick-next")
 
     def __init__(self, driver):
@@ -22,40 +23,34 @@ class ClientesPage(BasePage):
         try:
             testimonios = self.driver.find_elements(*self.TESTIMONIOS)
             cantidad = len(testimonios)
-            self.logger.info(f"Se encontraron {cantidad} testimonios")
+            self.logger.info("Se encontraron %s testimonios", cantidad)
             return cantidad
         except Exception as e:
-            self.logger.error(f"Error al contar testimonios: {str(e)}")
+            self.logger.error("Error al contar testimonios: %s", e)
             return 0
 
     def verificar_testimonio_existe(self, nombre):
         """Verifica si un testimonio específico existe."""
-        try:
-            locator = (By.XPATH, f"//*[contains(text(), '{nombre}')]")
-            element = self.find(locator)
-            self.logger.info(f"Testimonio de {nombre} encontrado")
+        if self.is_text_visible(LocatorRegistry.texto(nombre)):
+            self.logger.info("Testimonio de %s encontrado", nombre)
             return True
-        except:
-            self.logger.warning(f"Testimonio de {nombre} no encontrado")
-            return False
+        self.logger.warning("Testimonio de %s no encontrado", nombre)
+        return False
 
     def verificar_testimonios_principales(self):
         """Verifica que los 3 testimonios principales existan."""
-        nombres = ["Ross", "Joey", "Phoebe"]
-        resultados = {}
-
-        for nombre in nombres:
-            resultados[nombre] = self.verificar_testimonio_existe(nombre)
+        testimonios = [self.TESTIMONIO_ROSS, self.TESTIMONIO_JOEY, self.TESTIMONIO_PHOEBE]
+        nombres = [testimonio.texto for testimonio in testimonios]
+        consulta = self.query_elements(dict(zip(nombres, testimonios)), timeout=self.policy.explicit)
+        resultados = {nombre: consulta[nombre]["visible"] for nombre in nombres}
 
-        self.logger.info(f"Verificación de testimonios: {resultados}")
+        self.logger.info("Verificación de testimonios: %s", resultados)
         return resultados
 
     def carrusel_funciona(self):
         """Verifica si el carrusel de navegación es funcional."""
-        try:
-            boton_next = self.driver.find_element(*self.CARRUSEL_NAVEGACION)
+        if self.is_element_present(self.CARRUSEL_NAVEGACION):
             self.logger.info("Carrusel de navegación encontrado")
             return True
-        except:
-            self.logger.warning("Carrusel de navegación no encontrado")
-            return False
+        self.logger.warning("Carrusel de navegación no encontrado")
+        return False
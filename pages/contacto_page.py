@@ -18,43 +18,49 @@ class ContactoPage(BasePage):
         super().__init__(driver)
         self.logger = Logger.get_logger(__name__)
 
-    def completar_formulario(self, nombre, email, mensaje):
-        """Completa el formulario de contacto."""
-        self.logger.info(f"Completando formulario con: nombre={nombre}, email={email}")
+    def completar_formulario(self, nombre, email, mensaje, teclear=False):
+        """Completa el formulario de contacto (teclear=True escribe tecla por tecla)."""
+        self.logger.info("Completando formulario con: nombre=%s, email=%s", nombre, email)
 
         try:
-            self.type(self.INPUT_NOMBRE, nombre)
-            self.type(self.INPUT_EMAIL, email)
-            self.type(self.INPUT_MENSAJE, mensaje)
+            self.fill_form({
+                self.INPUT_NOMBRE: nombre,
+                self.INPUT_EMAIL: email,
+                self.INPUT_MENSAJE: mensaje,
+            }, teclear=teclear)
             self.logger.info("Formulario completado exitosamente")
         except Exception as e:
-            self.logger.error(f"Error al completar formulario: {str(e)}")
+            self.logger.error("Error al completar formulario: %s", e)
             raise
 
     def enviar_formulario(self):
         """Hace clic en el botón Enviar."""
         self.logger.info("Enviando formulario de contacto")
         self.click(self.BTN_ENVIAR)
+        self.wait_for_network_idle()
+        self.wait_for_dom_stable()
 
     def verificar_campos_vacios(self):
         """Verifica si los campos están vacíos antes de enviar."""
         try:
-            nombre = self.driver.find_element(*self.INPUT_NOMBRE).get_attribute("value")
-            email = self.driver.find_element(*self.INPUT_EMAIL).get_attribute("value")
-            mensaje = self.driver.find_element(*self.INPUT_MENSAJE).get_attribute("value")
+            # Sondeo rápido: si falta un campo no se espera el timeout implícito
+            with self.policy.sin_espera_implicita(self.driver):
+                nombre = self.driver.find_element(*self.INPUT_NOMBRE).get_attribute("value")
+                email = self.driver.find_element(*self.INPUT_EMAIL).get_attribute("value")
+                mensaje = self.driver.find_element(*self.INPUT_MENSAJE).get_attribute("value")
 
             campos_vacios = not nombre or not email or not mensaje
-            self.logger.info(f"Campos vacíos: {campos_vacios}")
+            self.logger.info("Campos vacíos: %s", campos_vacios)
             return campos_vacios
         except Exception as e:
-            self.logger.error(f"Error al verificar campos: {str(e)}")
+            self.logger.error("Error al verificar campos: %s", e)
             return False
 
     def obtener_mensaje_confirmacion(self):
         """Obtiene el mensaje de confirmación si existe."""
         try:
             mensaje = self.get_text(self.MENSAJE_CONFIRMACION)
-            self.logger.info(f"Mensaje de confirmación: {mensaje}")
+            self.logger.info("Mensaje de confirmación: %s", mensaje)
             return mensaje
         except:
             self.logger.warning("No se encontró mensaje de confirmación")
@@ -65,8 +71,8 @@ class ContactoPage(BasePage):
         try:
             boton = self.driver.find_element(*self.BTN_ENVIAR)
             esta_deshabilitado = not boton.is_enabled()
-            self.logger.info(f"Botón enviar deshabilitado: {esta_deshabilitado}")
+            self.logger.info("Botón enviar deshabilitado: %s", esta_deshabilitado)
             return esta_deshabilitado
         except Exception as e:
-            self.logger.error(f"Error al verificar estado del botón: {str(e)}")
+            self.logger.error("Error al verificar estado del botón: %s", e)
             return False
@@ -5,6 +5,8 @@ from utils.logger import Logger
 class HomePage(BasePage):
     """Page Object para la página principal de Talento Lab."""
 
+    URL = "https://talentolab-test.netlify.app"
+
     # Locators - ACTUALIZADOS según estructura real
     BTN_REGISTRATE = (By.LINK_TEXT, "Registrate")
     BTN_CARGA_CV = (By.LINK_TEXT, "Carga tu CV")
@@ -16,36 +18,41 @@ class HomePage(BasePage):
 
     def __init__(self, driver):
         super().__init__(driver)
-        self.url = "https://talentolab-test.netlify.app"
+        self.url = self.URL
         self.logger = Logger.get_logger(__name__)
 
-    def open(self):
-        """Abre la página principal."""
-        self.logger.info(f"Navegando a: {self.url}")
-        self.driver.get(self.url)
-        self.logger.info("Página principal cargada exitosamente")
+    def open(self, force=False):
+        """Abre la página principal (force=True recarga aunque ya esté abierta)."""
+        with self._paso("open", self.url):
+            self.logger.info("Navegando a: %s", self.url)
+            self._abrir(self.url, force)
+            self.logger.info("Página principal cargada exitosamente")
 
     def click_registrate(self):
         """Hace clic en el botón 'Registrate'."""
         self.logger.info("Haciendo clic en botón 'Registrate'")
+        url_anterior = self.driver.current_url
         self.click(self.BTN_REGISTRATE)
+        if self.wait_for_url_change(url_anterior):
+            self.wait_for_page_ready()
 
     def click_carga_cv(self):
         """Hace clic en el botón 'Carga tu CV'."""
         self.logger.info("Haciendo clic en botón 'Carga tu CV'")
+        url_anterior = self.driver.current_url
         self.click(self.BTN_CARGA_CV)
+        if self.wait_for_url_change(url_anterior):
+            self.wait_for_page_ready()
 
     def scroll_to_servicios(self):
         """Hace scroll a la sección de servicios."""
         self.logger.info("Scrolling a sección Servicios")
-        element = self.find(self.SECCION_SERVICIOS)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self.scroll_to_element(self.SECCION_SERVICIOS)
 
     def scroll_to_contacto(self):
         """Hace scroll a la sección de contacto."""
         self.logger.info("Scrolling a sección Contacto")
-        element = self.find(self.SECCION_CONTACTO)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self.scroll_to_element(self.SECCION_CONTACTO)
 
     def is_page_loaded(self):
         """Verifica que la página principal esté cargada."""
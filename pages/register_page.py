@@ -18,39 +18,45 @@ class RegisterPage(BasePage):
         super().__init__(driver)
         self.logger = Logger.get_logger(__name__)
 
-    def open(self):
-        """Abre la página de registro."""
-        self.logger.info(f"Navegando a: {self.URL}")
-        self.driver.get(self.URL)
-
-    def complete_form(self, nombre, email, password):
-        """Llena el formulario de registro."""
-        self.logger.info(f"Completando formulario: nombre={nombre}, email={email}")
-        self.type(self.INPUT_NOMBRE, nombre)
-        self.type(self.INPUT_EMAIL, email)
-        self.type(self.INPUT_PASSWORD, password)
+    def open(self, force=False):
+        """Abre la página de registro (force=True recarga aunque ya esté abierta)."""
+        with self._paso("open", self.URL):
+            self.logger.info("Navegando a: %s", self.URL)
+            self._abrir(self.URL, force)
+
+    def complete_form(self, nombre, email, password, teclear=False):
+        """Llena el formulario de registro (teclear=True escribe tecla por tecla)."""
+        self.logger.info("Completando formulario: nombre=%s, email=%s", nombre, email)
+        self.fill_form({
+            self.INPUT_NOMBRE: nombre,
+            self.INPUT_EMAIL: email,
+            self.INPUT_PASSWORD: password,
+        }, teclear=teclear)
 
     def upload_cv(self, file_path):
         """Sube un archivo CV."""
-        self.logger.info(f"Subiendo CV: {file_path}")
+        self.logger.info("Subiendo CV: %s", file_path)
+        self._marcar_sucia()
         try:
             cv_input = self.driver.find_element(*self.INPUT_CV)
             cv_input.send_keys(file_path)
             self.logger.info("CV cargado exitosamente")
         except Exception as e:
-            self.logger.error(f"Error al cargar CV: {str(e)}")
+            self.logger.error("Error al cargar CV: %s", e)
             raise
 
     def submit_form(self):
         """Envía el formulario."""
         self.logger.info("Enviando formulario de registro")
         self.click(self.BTN_SUBMIT)
+        self.wait_for_network_idle()
+        self.wait_for_dom_stable()
 
     def is_registration_successful(self):
         """Verifica si el registro fue exitoso."""
         try:
             msg = self.get_text(self.SUCCESS_MSG)
-            self.logger.info(f"Mensaje encontrado: {msg}")
+            self.logger.info("Mensaje encontrado: %s", msg)
             return msg
         except:
             self.logger.warning("No se encontró mensaje de éxito")
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.locator_registry import LocatorRegistry
 from utils.logger import Logger
 
 class ServiciosPage(BasePage):
@@ -9,10 +10,10 @@ class ServiciosPage(BasePage):
     SECCION_SERVICIOS = (By.ID, "servicios")
     TITULO_SERVICIOS = (By.XPATH, "//*[@id='servicios']//h2")
     TARJETAS_SERVICIOS = (By.CSS_SELECTOR, "#servicios .card, #servicios .service-card, #servicios .col")
-    TARJETA_RECLUTAMIENTO = (By.XPATH, "//*[@id='servicios']//*[contains(text(), 'Reclutamiento')]")
-    TARJETA_HEADHUNTING = (By.XPATH, "//*[@id='servicios']//*[contains(text(), 'Headhunting')]")
-    TARJETA_EVALUACION = (By.XPATH, "//*[@id='servicios']//*[contains(text(), 'Evaluación')]")
-    TARJETA_CONSULTORIA = (By.XPATH, "//*[@id='servicios']//*[contains(text(), 'Consultoría')]")
+    TARJETA_RECLUTAMIENTO = LocatorRegistry.texto("Reclutamiento", "servicios")
+    TARJETA_HEADHUNTING = LocatorRegistry.texto("Headhunting", "servicios")
+    TARJETA_EVALUACION = LocatorRegistry.texto("Evaluación", "servicios")
+    TARJETA_CONSULTORIA = LocatorRegistry.texto("Consultoría", "servicios")
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -23,30 +24,29 @@ class ServiciosPage(BasePage):
         try:
             tarjetas = self.driver.find_elements(*self.TARJETAS_SERVICIOS)
             cantidad = len(tarjetas)
-            self.logger.info(f"Se encontraron {cantidad} tarjetas de servicios")
+            self.logger.info("Se encontraron %s tarjetas de servicios", cantidad)
             return cantidad
         except Exception as e:
-            self.logger.error(f"Error al contar tarjetas: {str(e)}")
+            self.logger.error("Error al contar tarjetas: %s", e)
             return 0
 
     def verificar_servicio_existe(self, nombre_servicio):
         """Verifica si un servicio específico está visible."""
-        try:
-            locator = (By.XPATH, f"//*[@id='servicios']//*[contains(text(), '{nombre_servicio}')]")
-            element = self.find(locator)
-            self.logger.info(f"Servicio '{nombre_servicio}' encontrado")
+        if self.is_text_visible(LocatorRegistry.texto(nombre_servicio, "servicios")):
+            self.logger.info("Servicio '%s' encontrado", nombre_servicio)
             return True
-        except:
-            self.logger.warning(f"Servicio '{nombre_servicio}' no encontrado")
-            return False
+        self.logger.warning("Servicio '%s' no encontrado", nombre_servicio)
+        return False
 
     def get_servicios_disponibles(self):
-        """Retorna lista de servicios disponibles."""
-        servicios = ["Reclutamiento", "Headhunting", "Evaluación", "Consultoría"]
-        disponibles = []
+        """Retorna lista de servicios disponibles (una sola consulta al navegador)."""
+        tarjetas = [self.TARJETA_RECLUTAMIENTO, self.TARJETA_HEADHUNTING, self.TARJETA_EVALUACION, self.TARJETA_CONSULTORIA]
+        servicios = [tarjeta.texto for tarjeta in tarjetas]
+        resultados = self.query_elements(dict(zip(servicios, tarjetas)), timeout=self.policy.explicit)
 
+        disponibles = [servicio for servicio in servicios if resultados[servicio]["visible"]]
         for servicio in servicios:
-            if self.verificar_servicio_existe(servicio):
-                disponibles.append(servicio)
+            if servicio not in disponibles:
+                self.logger.warning("Servicio '%s' no encontrado", servicio)
 
         return disponibles
@@ -1,89 +1,548 @@
 import pytest
+import base64
+import html
+import json
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+import shutil
+import tempfile
 from datetime import datetime
+from pages.home_page import HomePage
+from pages.register_page import RegisterPage
+from utils.api_client import APIClient
+from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import DriverResolver
+from utils.device_emulation import DeviceEmulation
+from utils.duration_store import DurationStore
+from utils.impact_map import ImpactMap
+from utils.jsonplaceholder_local import JSONPlaceholderLocal
+from utils.log_index import MB
+from utils.logger import Logger
+from utils.network_capture import NetworkCapture
+from utils.parallel import BrowserSlots, is_worker, worker_id
+from utils.preflight import Preflight
+from utils.report_renderer import ReportRenderer
+from utils.results_stream import ResultsStream
+from utils.scheduling import LongestFirstScheduling
+from utils.screenshots import ScreenshotWriter
+from utils.step_timer import StepTimer
+from utils.upload_files import UploadFileFactory
+from utils.wait_policy import WaitPolicy
 
-# 1. Configuración del Driver (Navegador) - Desktop
+logger = Logger.get_logger(__name__)
+
+# Fixtures que entregan un navegador (los tests que usan alguno son tests de UI)
+FIXTURES_UI = ("driver", "driver_mobile", "driver_device")
+
+CHROMEDRIVER_KEY = pytest.StashKey[dict]()
+SCREENSHOT_WRITER_KEY = pytest.StashKey[ScreenshotWriter]()
+STEP_TIMINGS_KEY = pytest.StashKey[list]()
+PREFLIGHT_KEY = pytest.StashKey[dict]()
+COMPARTIDO_DIR_KEY = pytest.StashKey[str]()
+PREFLIGHT_ABORT_KEY = pytest.StashKey[str]()
+NETWORK_BUDGETS_KEY = pytest.StashKey[dict]()
+
+def pytest_addoption(parser):
+    """Opciones de línea de comandos propias del framework."""
+    parser.addoption(
+        "--driver-max-uses", action="store", type=int, default=20,
+        help="Cantidad de tests que atiende un navegador del pool antes de reemplazarlo"
+    )
+    parser.addoption(
+        "--driver-offline", action="store_true", default=False,
+        help="No consultar la red: usar el chromedriver que ya esté en el PATH"
+    )
+    parser.addoption(
+        "--implicit-wait", action="store", type=float, default=10,
+        help="Espera implícita en segundos (se apaga durante las esperas explícitas)"
+    )
+    parser.addoption(
+        "--explicit-timeout", action="store", type=float, default=10,
+        help="Timeout por defecto de las esperas explícitas en segundos"
+    )
+    parser.addoption(
+        "--poll-frequency", action="store", type=float, default=0.5,
+        help="Frecuencia de sondeo de las esperas explícitas en segundos"
+    )
+    parser.addoption(
+        "--browser-profile", action="store", default="full", choices=DriverFactory.PERFILES,
+        help="full: Chrome visible completo; lean: headless con bloqueo de recursos vía CDP"
+    )
+    parser.addoption(
+        "--api-base-url", action="store", default="https://jsonplaceholder.typicode.com",
+        help="URL base de la API REST bajo prueba"
+    )
+    parser.addoption(
+        "--api-target", action="store", default="remote", choices=("remote", "local"),
+        help="remote: usa --api-base-url; local: levanta un JSONPlaceholder en proceso (offline)"
+    )
+    parser.addoption(
+        "--max-browsers", action="store", type=int, default=None,
+        help="Máximo de navegadores abiertos a la vez en la máquina, entre todos los workers "
+             "(por defecto la mitad de los CPU, o la cantidad de workers si es mayor)"
+    )
+    parser.addoption(
+        "--browser-slot-timeout", action="store", type=float, default=BrowserSlots.TIMEOUT,
+        help="Segundos que un test espera a que otro worker libere un slot de navegador antes de fallar"
+    )
+    parser.addoption(
+        "--screenshot-format", action="store", default="png", choices=ScreenshotWriter.FORMATOS,
+        help="Formato de los screenshots de fallos (jpeg/webp requieren Pillow)"
+    )
+    parser.addoption(
+        "--screenshot-max-width", action="store", type=int, default=0,
+        help="Ancho máximo de los screenshots guardados (0 = tamaño original; requiere Pillow)"
+    )
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="Ejecutar los benchmarks de carga de página (marcador benchmark)"
+    )
+    parser.addoption(
+        "--benchmark-runs", action="store", type=int, default=5,
+        help="Cantidad de cargas por página y variante de caché en los benchmarks"
+    )
+    parser.addoption(
+        "--log-verbosity", action="store", default="INFO",
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+        help="Nivel de los logs del framework; WARNING apaga el registro paso a paso"
+    )
+    parser.addoption(
+        "--log-max-mb", action="store", type=float, default=10,
+        help="Tamaño en MB a partir del cual el log rota y se comprime el segmento (0 = no rotar)"
+    )
+    parser.addoption(
+        "--impact", action="store_true", default=False,
+        help="Correr solo los tests afectados por los cambios en git (más los marcados smoke)"
+    )
+    parser.addoption(
+        "--impact-base", action="store", default="HEAD",
+        help="Referencia de git contra la que se calculan los cambios de --impact"
+    )
+    parser.addoption(
+        "--scheduling", action="store", default="longest-first", choices=("longest-first", "xdist"),
+        help="(xdist, --dist load) longest-first: reparte primero los tests más lentos según el historial"
+    )
+    parser.addoption(
+        "--devices", action="store", default="pixel_5,iphone_12,ipad_mini",
+        help=f"Dispositivos de los tests con driver_device, separados por coma ({', '.join(DeviceEmulation.PERFILES)})"
+    )
+    parser.addoption(
+        "--preflight", action="store", default="skip", choices=("skip", "abort", "off"),
+        help="Chequeo previo de los sitios de los tests seleccionados: skip omite los tests del sitio caído (y la ejecución termina con error), abort cancela la ejecución"
+    )
+    parser.addoption(
+        "--preflight-timeout", action="store", type=float, default=5,
+        help="Timeout en segundos de cada sondeo del chequeo previo"
+    )
+    parser.addoption(
+        "--results-stream", action="store", default=ResultsStream.ARCHIVO,
+        help="JSONL con el resultado de cada fase a medida que ocurre (vacío = desactivado)"
+    )
+    parser.addoption(
+        "--stream-report", action="store", default=ReportRenderer.DESTINO,
+        help="Directorio del reporte HTML paginado que se arma desde --results-stream al terminar (vacío = no armarlo)"
+    )
+    parser.addoption(
+        "--network-capture", action="store_true", default=False,
+        help="Capturar el tráfico de red de cada test de UI (HAR en reports/network/) y verificar los presupuestos de red"
+    )
+    parser.addini(
+        "network_budgets", default="test_data/network_budgets.json",
+        help="JSON con los presupuestos de red por page object (max_requests, max_total_bytes, max_asset_bytes)"
+    )
+    parser.addini(
+        "lean_blocked_types", type="args", default=["image", "font", "media", "analytics"],
+        help="Tipos de recurso que bloquea el perfil lean (image, font, media, stylesheet, analytics)"
+    )
+    parser.addini(
+        "lean_blocked_urls", type="args", default=[],
+        help="Patrones de URL adicionales que bloquea el perfil lean"
+    )
+
+def _compartido(config, nombre, completar):
+    """Datos que calcula el primer proceso que los necesita y reutilizan los demás workers de xdist.
+
+    completar recibe el diccionario guardado hasta ahora (vacío la primera
+    vez), le agrega lo que falte y devuelve True si lo modificó. Con xdist
+    la lectura y la escritura del JSON compartido van bajo un mutex entre
+    procesos; sin xdist simplemente se calcula.
+    """
+    directorio = getattr(config, "workerinput", {}).get("dir_compartido")
+    if not directorio:
+        datos = {}
+        completar(datos)
+        return datos
+
+    mutex = BrowserSlots(1, directorio) # Un solo slot: exclusión mutua entre los workers
+    handle = mutex.acquire()
+    try:
+        ruta = os.path.join(directorio, f"{nombre}.json")
+        datos = {}
+        if os.path.exists(ruta):
+            with open(ruta, "r", encoding="utf-8") as file:
+                datos = json.load(file)
+        if completar(datos):
+            with open(ruta, "w", encoding="utf-8") as file:
+                json.dump(datos, file)
+        return datos
+    finally:
+        mutex.release(handle)
+
+def _resolver_chromedriver(config):
+    """Resuelve la ruta de chromedriver la primera vez que un test de UI la pide.
+
+    El resultado, también si falla, se memoriza en el stash y con xdist se
+    comparte entre los workers: la resolución (que sin red puede demorar)
+    se intenta una sola vez por ejecución y solo si hay tests de UI.
+    """
+    if CHROMEDRIVER_KEY not in config.stash:
+        def completar(datos):
+            if datos:
+                return False
+            try:
+                datos["ruta"] = DriverResolver.resolve(offline=config.getoption("--driver-offline"))
+            except Exception as e:
+                datos["error"] = f"{type(e).__name__}: {e}"
+                logger.error("No se pudo resolver chromedriver: %s", datos["error"])
+            return True
+        config.stash[CHROMEDRIVER_KEY] = _compartido(config, "chromedriver", completar)
+
+    resultado = config.stash[CHROMEDRIVER_KEY]
+    if "error" in resultado:
+        raise RuntimeError(f"No se pudo resolver chromedriver: {resultado['error']}")
+    return resultado["ruta"]
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """(xdist) El controlador pasa a cada worker el directorio compartido y el id de la ejecución."""
+    if COMPARTIDO_DIR_KEY not in node.config.stash:
+        node.config.stash[COMPARTIDO_DIR_KEY] = tempfile.mkdtemp(prefix="talentolab_xdist_")
+    node.workerinput["dir_compartido"] = node.config.stash[COMPARTIDO_DIR_KEY]
+    node.workerinput["log_ejecucion"] = Logger.ejecucion()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """(xdist) Con --dist load, reparte primero los tests más largos según el historial de duraciones."""
+    if LongestFirstScheduling is None or config.getvalue("dist") != "load":
+        return None
+    if config.getoption("--scheduling") != "longest-first":
+        return None
+    estimaciones = DurationStore.estimaciones()
+    if not estimaciones: # Primera ejecución: todavía no hay historial
+        return None
+    return LongestFirstScheduling(config, log, estimaciones)
+
+def _bloqueos_lean(config):
+    """Patrones de URL que bloquea el perfil lean (configurables en pytest.ini)."""
+    return DriverFactory.patrones_bloqueados(
+        config.getini("lean_blocked_types"), config.getini("lean_blocked_urls")
+    )
+
+def _perfil_para(request):
+    """Perfil de navegador para el test: los marcados con full_render nunca usan lean."""
+    if request.node.get_closest_marker("full_render"):
+        return "full"
+    return request.config.getoption("--browser-profile")
+
+def _max_browsers(config):
+    """Límite de navegadores simultáneos; el de por defecto alcanza para un navegador por worker."""
+    maximo = config.getoption("--max-browsers")
+    if maximo is None:
+        maximo = max((os.cpu_count() or 2) // 2, int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1)))
+    return max(1, maximo)
+
+# 1. Pools de navegadores reutilizables (uno por sesión o por worker de xdist)
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    """Ruta de chromedriver resuelta una vez por sesión."""
+    return _resolver_chromedriver(request.config)
+
+@pytest.fixture(scope="session")
+def driver_pools(request, chromedriver_path):
+    """Pools de navegadores por perfil (full/lean), creados a demanda; los dispositivos se emulan sobre ellos."""
+    config = request.config
+    slots = BrowserSlots(_max_browsers(config), BrowserSlots.directorio_para(config.rootpath))
+    slots_tomados = {}
+    pools = {}
+
+    def crear(perfil):
+        # Cada navegador vivo ocupa un slot global hasta que se cierra
+        try:
+            slot = slots.acquire(config.getoption("--browser-slot-timeout"))
+        except (TimeoutError, RuntimeError) as e:
+            raise RuntimeError(f"{e}. Subir --max-browsers o --browser-slot-timeout") from None
+        try:
+            driver = DriverFactory.crear(
+                chromedriver_path, perfil, _bloqueos_lean(config), config.getoption("--network-capture")
+            )
+        except Exception:
+            slots.release(slot)
+            raise
+        slots_tomados[driver] = slot
+        return driver
+
+    def liberar_slot(driver):
+        slot = slots_tomados.pop(driver, None)
+        if slot:
+            slots.release(slot)
+
+    def ceder_si_esperan():
+        # Otro worker espera un slot: los navegadores inactivos de este proceso se cierran para cederlo
+        if slots.hay_esperando():
+            for pool in pools.values():
+                pool.liberar_inactivos()
+
+    def obtener(perfil):
+        if perfil not in pools:
+            pools[perfil] = DriverPool(
+                lambda: crear(perfil),
+                max_usos=config.getoption("--driver-max-uses"),
+                nombre=perfil,
+                on_discard=liberar_slot,
+                on_release=ceder_si_esperan
+            )
+        pool = pools[perfil]
+        if not pool.tiene_libres():
+            # Antes de abrir otro navegador se cierran los inactivos de los demás pools
+            for otro in pools.values():
+                if otro is not pool:
+                    otro.liberar_inactivos()
+        return pool
+
+    yield obtener
+    for pool in pools.values():
+        pool.shutdown() # Cierra los navegadores al terminar la sesión
+
+# 2. Configuración del Driver (Navegador) - Desktop
 @pytest.fixture(scope="function")
-def driver():
-    """Fixture para navegador en modo Desktop."""
-    # Descarga e instala automáticamente el driver de Chrome
-    service = ChromeService(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized") # Abrir pantalla completa
-    options.add_argument("--disable-notifications")
-    options.add_argument("--disable-popup-blocking")
-
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(10) # Espera implícita básica
+def driver(request, driver_pools):
+    """Fixture para navegador en modo Desktop (tomado del pool)."""
+    pool = driver_pools(_perfil_para(request))
+    driver = pool.acquire()
+    try:
+        captura = _iniciar_captura_de_red(request, driver)
+    except Exception:
+        pool.release(driver, descartar=True)
+        raise
+    yield driver
+    try:
+        _terminar_captura_de_red(captura)
+    finally:
+        pool.release(driver) # Limpia el navegador y lo devuelve al pool
+
+# 2b. Dispositivos emulados vía CDP sobre el navegador desktop del pool (sin abrir otro Chrome)
+def _driver_emulado(request, driver_pools, dispositivo):
+    """Toma un navegador desktop del pool, lo hace emular dispositivo y lo restablece al devolverlo."""
+    pool = driver_pools(_perfil_para(request))
+    driver = pool.acquire()
+    try:
+        DeviceEmulation.aplicar(driver, dispositivo)
+        captura = _iniciar_captura_de_red(request, driver)
+    except Exception:
+        pool.release(driver, descartar=True)
+        raise
     yield driver
-    driver.quit() # Cierra el navegador al terminar
+    try:
+        _terminar_captura_de_red(captura)
+    finally:
+        pool.release(driver, descartar=not DeviceEmulation.restablecer(driver))
 
-# 2. Configuración del Driver para Mobile (2400x1080 según tu documentación)
 @pytest.fixture(scope="function")
-def driver_mobile():
-    """Fixture para navegador en modo Mobile (2400x1080)."""
-    service = ChromeService(ChromeDriverManager().install())
-
-    # Configuración móvil
-    mobile_emulation = {
-        "deviceMetrics": {"width": 412, "height": 915, "pixelRatio": 3.0},
-        "userAgent": "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.91 Mobile Safari/537.36"
-    }
+def driver_mobile(request, driver_pools):
+    """Fixture para navegador en modo Mobile (Pixel 5, 412x915)."""
+    yield from _driver_emulado(request, driver_pools, "pixel_5")
 
-    options = webdriver.ChromeOptions()
-    options.add_experimental_option("mobileEmulation", mobile_emulation)
-    options.add_argument("--disable-notifications")
+@pytest.fixture(scope="function")
+def driver_device(request, driver_pools):
+    """Navegador emulando un dispositivo de DeviceEmulation.PERFILES.
 
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(10)
-    yield driver
-    driver.quit()
+    Sin parametrizar, el test corre una vez por cada dispositivo de --devices;
+    también se puede elegir con @pytest.mark.parametrize("driver_device", [...], indirect=True).
+    """
+    yield from _driver_emulado(request, driver_pools, getattr(request, "param", "pixel_5"))
+
+def pytest_generate_tests(metafunc):
+    """Los tests que usan driver_device (y no lo parametrizan) recorren la matriz de --devices."""
+    if "driver_device" not in metafunc.fixturenames:
+        return
+    for marker in metafunc.definition.iter_markers("parametrize"):
+        if "driver_device" in str(marker.args[0]):
+            return
+    dispositivos = [d.strip() for d in metafunc.config.getoption("--devices").split(",") if d.strip()]
+    for dispositivo in dispositivos:
+        DeviceEmulation.perfil(dispositivo) # Falla en la colección si el nombre no existe
+    metafunc.parametrize("driver_device", dispositivos, indirect=True)
+
+# 2c. Cliente HTTP para los tests de API (una sesión con keep-alive por proceso)
+@pytest.fixture(scope="session")
+def api_base_url(request):
+    """URL base de la API: el servicio real o el JSONPlaceholder local según --api-target."""
+    if request.config.getoption("--api-target") == "local":
+        servidor = JSONPlaceholderLocal().start()
+        logger.info("JSONPlaceholder local escuchando en %s", servidor.base_url)
+        yield servidor.base_url
+        servidor.stop()
+    else:
+        yield request.config.getoption("--api-base-url")
+
+@pytest.fixture(scope="session")
+def api_session(api_base_url):
+    """Cliente HTTP con pool de conexiones compartido por toda la sesión."""
+    client = APIClient(api_base_url)
+    yield client
+    client.close()
+
+@pytest.fixture(scope="function")
+def api_client(api_session):
+    """Cliente HTTP para un test: reutiliza las conexiones y mide sus propias latencias."""
+    api_session.reiniciar_latencias()
+    yield api_session
+
+# 2d. Archivos para los tests de carga de CV (uno por especificación, por proceso)
+@pytest.fixture(scope="session")
+def upload_files(tmp_path_factory):
+    """Fábrica de archivos de carga (pdf, corrupto, txt) en el directorio temporal de la sesión.
+
+    Con xdist cada worker tiene su propio basetemp, así que no hay choques
+    entre procesos. Los archivos se borran al terminar la sesión.
+    """
+    fabrica = UploadFileFactory(tmp_path_factory.mktemp("uploads"))
+    yield fabrica
+    fabrica.limpiar()
+
+# 2e. Captura de red opcional (--network-capture) sobre el navegador del test
+def _iniciar_captura_de_red(request, driver):
+    """Empieza a capturar el tráfico del test con los presupuestos del JSON y del marcador network_budget."""
+    config = request.config
+    if not config.getoption("--network-capture"):
+        return None
+    if NETWORK_BUDGETS_KEY not in config.stash:
+        config.stash[NETWORK_BUDGETS_KEY] = NetworkCapture.cargar_presupuestos(
+            os.path.join(str(config.rootpath), config.getini("network_budgets"))
+        )
+    presupuestos = {pagina: dict(limites) for pagina, limites in config.stash[NETWORK_BUDGETS_KEY].items()}
+    # El marcador más cercano al test gana: se aplican desde el más lejano (módulo) al más cercano
+    for marker in reversed(list(request.node.iter_markers("network_budget"))):
+        NetworkCapture.validar(marker.args[0], marker.kwargs, "@pytest.mark.network_budget")
+        presupuestos.setdefault(marker.args[0], {}).update(marker.kwargs)
+    return NetworkCapture.iniciar(driver, request.node.nodeid, presupuestos)
+
+def _terminar_captura_de_red(captura):
+    """Escribe el HAR del test y deja de capturar."""
+    if captura is None:
+        return
+    ruta = captura.terminar()
+    if ruta:
+        logger.info("Tráfico de red de %s: %s", captura.test, ruta)
+
+def _adjuntar_latencias(rep, latencias):
+    """Agrega al reporte la tabla de latencias HTTP del test."""
+    if not latencias:
+        return
+    lineas = [f"{l['metodo']:<6} {l['status']} {l['ms']:>8.1f} ms  {l['url']}" for l in latencias]
+    rep.sections.append(("Latencias HTTP", "\n".join(lineas)))
+
+    try:
+        from pytest_html import extras
+        # La URL y el método vienen del test: se escapan para no romper el HTML del reporte
+        filas = "".join(
+            f"<tr><td>{html.escape(str(l['metodo']))}</td><td>{html.escape(str(l['url']))}</td>"
+            f"<td>{html.escape(str(l['status']))}</td><td>{l['ms']}</td></tr>"
+            for l in latencias
+        )
+        extra = getattr(rep, "extras", [])
+        extra.append(extras.html(
+            "<table><tr><th>Método</th><th>URL</th><th>Status</th><th>ms</th></tr>"
+            f"{filas}</table>"
+        ))
+        rep.extras = extra
+    except ImportError:
+        pass
+
+def _adjuntar_log_del_test(rep, nodeid):
+    """Agrega al reporte HTML el tramo del log que escribió el test."""
+    try:
+        from pytest_html import extras
+    except ImportError:
+        return
+    texto = Logger.log_del_test(nodeid)
+    if texto:
+        extra = getattr(rep, "extras", [])
+        extra.append(extras.text(texto, name=f"Log ({rep.when})"))
+        rep.extras = extra
+
+@pytest.fixture(autouse=True)
+def _contabilizar_esperas(request):
+    """Registra cuánto del tiempo de cada test de UI se fue en esperas y en cada paso."""
+    if not set(FIXTURES_UI) & set(request.fixturenames):
+        yield
+        return
+    policy = WaitPolicy.actual()
+    policy.reiniciar_contador()
+    StepTimer.actual().test_id = request.node.nodeid # Los pasos de page objects quedan asociados al test
+    inicio = datetime.now()
+    yield
+    total = (datetime.now() - inicio).total_seconds()
+    esperado = policy.tiempo_esperado
+    request.node.user_properties.append(("tiempo_esperas_s", round(esperado, 3)))
+    logger.info("Esperas de %s: %.2fs de %.2fs", request.node.nodeid, esperado, total)
 
 # 3. Configuración para Capturas de Pantalla (Screenshots) en caso de fallo
+def _screenshot_writer(config):
+    """Escritor de screenshots en segundo plano, creado a demanda una vez por proceso."""
+    if SCREENSHOT_WRITER_KEY not in config.stash:
+        config.stash[SCREENSHOT_WRITER_KEY] = ScreenshotWriter(
+            formato=config.getoption("--screenshot-format"),
+            max_ancho=config.getoption("--screenshot-max-width")
+        )
+    return config.stash[SCREENSHOT_WRITER_KEY]
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Hook para capturar screenshots cuando un test falla."""
+    """Hook para adjuntar latencias HTTP y capturar screenshots cuando un test falla."""
     outcome = yield
     rep = outcome.get_result()
 
+    # Latencias de cada petición HTTP de los tests de API
+    if rep.when == "call" and "api_client" in item.funcargs:
+        _adjuntar_latencias(rep, item.funcargs["api_client"].latencias)
+
+    # Un test omitido no aporta dependencias al mapa de impacto
+    if rep.skipped:
+        ImpactMap.actual().omitidos.add(item.nodeid)
+
+    # Las líneas del log de este test (vía el índice del log, sin leer el archivo completo)
+    if rep.failed:
+        _adjuntar_log_del_test(rep, item.nodeid)
+
     if rep.when == "call" and rep.failed:
         try:
-            # Obtener el driver del test (puede ser desktop o mobile)
-            if 'driver' in item.funcargs:
-                driver = item.funcargs['driver']
-            elif 'driver_mobile' in item.funcargs:
-                driver = item.funcargs['driver_mobile']
-            else:
+            # Obtener el driver del test (desktop, mobile o dispositivo emulado)
+            driver = next((item.funcargs[f] for f in FIXTURES_UI if f in item.funcargs), None)
+            if driver is None:
                 return
 
-            # Crear nombre del archivo con fecha y hora
-            now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            # Crear nombre del archivo con worker, fecha y hora (único también con xdist)
+            now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
             test_name = item.name.replace(" ", "_").replace("[", "_").replace("]", "_")
-            file_name = f"reports/screenshots/screenshot_{test_name}_{now}.png"
-
-            # Asegurar que la carpeta reports/screenshots existe
-            os.makedirs("reports/screenshots", exist_ok=True)
 
-            driver.save_screenshot(file_name)
-            print(f"\n📸 Screenshot guardado en: {file_name}")
-
-            # Adjuntar al reporte HTML (pytest-html)
-            if hasattr(rep, "extra"):
-                extra = getattr(rep, "extra", [])
-            else:
-                extra = []
+            # Una sola llamada al navegador; la conversión y escritura van en segundo plano
+            # (la ruta se registra en el log cuando el archivo ya está escrito)
+            png = driver.get_screenshot_as_png()
+            writer = _screenshot_writer(item.config)
+            convertido = writer.submit(png, f"screenshot_{test_name}_{worker_id()}_{now}")
 
             # Agregar screenshot al reporte HTML si pytest-html está disponible
-            if hasattr(rep, "extra"):
-                try:
-                    from pytest_html import extras
-                    extra.append(extras.image(file_name))
-                    rep.extra = extra
-                except ImportError:
-                    pass
+            # (se embebe desde memoria la misma imagen reducida/convertida que se guarda;
+            # solo se espera la conversión, la escritura a disco sigue en segundo plano)
+            try:
+                from pytest_html import extras
+                datos, mime, extension = writer.para_reporte(convertido, png)
+                extra = getattr(rep, "extras", [])
+                extra.append(extras.image(base64.b64encode(datos).decode("ascii"), mime_type=mime, extension=extension))
+                rep.extras = extra
+            except ImportError:
+                pass
 
         except Exception as e:
             print(f"❌ Error al tomar screenshot: {e}")
@@ -96,6 +555,268 @@ def pytest_configure(config):
     os.makedirs("reports/screenshots", exist_ok=True)
     os.makedirs("reports/logs", exist_ok=True)
 
+    # Marcadores propios del framework
+    config.addinivalue_line("markers", "api: tests de API REST")
+    config.addinivalue_line("markers", "mobile: tests en vista móvil")
+    config.addinivalue_line("markers", "negative: casos de prueba negativos")
+    config.addinivalue_line("markers", "full_render: requiere renderizado real (no usa el perfil lean)")
+    config.addinivalue_line("markers", "benchmark: benchmarks de performance (solo con --benchmark)")
+    config.addinivalue_line("markers", "smoke: tests que siempre corren, también con --impact")
+    config.addinivalue_line(
+        "markers", "network_budget(pagina, **limites): presupuesto de red de un page object para el test (con --network-capture)"
+    )
+
+    # Las dependencias del mapa de impacto se guardan relativas a la raíz del proyecto
+    ImpactMap.actual().raiz = str(config.rootpath)
+
+    # Verbosidad de los logs para toda la ejecución
+    Logger.set_level(config.getoption("--log-verbosity"))
+    if "log_ejecucion" in getattr(config, "workerinput", {}):
+        Logger.set_ejecucion(config.workerinput["log_ejecucion"]) # Un solo id de ejecución en el índice del log
+    Logger.set_max_bytes(int(config.getoption("--log-max-mb") * MB))
+
+    # Política de esperas única para fixtures y page objects
+    WaitPolicy.configurar(
+        implicit=config.getoption("--implicit-wait"),
+        explicit=config.getoption("--explicit-timeout"),
+        poll_frequency=config.getoption("--poll-frequency")
+    )
+
+def pytest_sessionstart(session):
+    """Abre el stream de resultados (una vez, en el controlador)."""
+    config = session.config
+    if is_worker() or config.option.collectonly:
+        return
+    if config.getoption("--results-stream"):
+        ResultsStream.abrir(config.getoption("--results-stream"))
+
+def _preflight(config, grupos):
+    """Sondea las URLs de los grupos que tienen tests seleccionados: {grupo: [resultado, ...]}.
+
+    Con xdist el primer worker que llega sondea y los demás leen su resultado
+    (todos omiten los mismos tests y los sitios se consultan una sola vez).
+    """
+    objetivos = {"ui": [HomePage.URL, RegisterPage.URL]}
+    if config.getoption("--api-target") == "remote":
+        objetivos["api"] = [config.getoption("--api-base-url")]
+    objetivos = {grupo: urls for grupo, urls in objetivos.items() if grupo in grupos}
+    if not objetivos:
+        return {}
+
+    def completar(previos):
+        faltan = {grupo: urls for grupo, urls in objetivos.items() if grupo not in previos}
+        if faltan:
+            previos.update(_sondear(config, faltan))
+        return bool(faltan)
+    resultados = _compartido(config, "preflight", completar)
+    return {grupo: resultados[grupo] for grupo in objetivos}
+
+def _sondear(config, objetivos):
+    """Sondea en paralelo las URLs de los objetivos y registra la latencia de cada una."""
+    resultados = Preflight.sondear_todas(
+        [url for urls in objetivos.values() for url in urls], config.getoption("--preflight-timeout")
+    )
+    for resultado in resultados.values():
+        if resultado["ok"]:
+            logger.info("Preflight %s: HTTP %s en %sms", resultado["url"], resultado["status"], resultado["ms"])
+        else:
+            logger.error("Preflight %s: no disponible (%s)", resultado["url"], resultado["error"])
+    return {grupo: [resultados[url] for url in urls] for grupo, urls in objetivos.items()}
+
+def _grupo_preflight(item):
+    """Grupo de preflight del que depende un test (ui, api o ninguno)."""
+    if set(FIXTURES_UI) & set(item.fixturenames):
+        return "ui"
+    if "api_client" in item.fixturenames:
+        return "api"
+    return None
+
+def pytest_report_collectionfinish(config, start_path, items):
+    """Muestra la latencia base medida por el preflight al terminar la colección."""
+    return [
+        f"preflight {r['url']}: " + (f"HTTP {r['status']} en {r['ms']}ms" if r["ok"] else f"NO DISPONIBLE ({r['error']})")
+        for resultados in config.stash.get(PREFLIGHT_KEY, {}).values() for r in resultados
+    ]
+
+def pytest_collection_modifyitems(config, items):
+    """--impact y --benchmark filtran los tests; el preflight omite los grupos cuyo sitio no responde."""
+    if config.getoption("--impact"):
+        _seleccionar_por_impacto(config, items)
+
+    if not config.getoption("--benchmark"):
+        saltar = pytest.mark.skip(reason="Benchmark: ejecutar con --benchmark")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(saltar)
+
+    if config.getoption("--preflight") == "off" or config.option.collectonly:
+        return
+    # Solo se sondean los sitios de los que dependen los tests que van a correr
+    grupos = {_grupo_preflight(item) for item in items if not item.get_closest_marker("skip")}
+    config.stash[PREFLIGHT_KEY] = _preflight(config, grupos - {None})
+
+    caidos = {
+        grupo: [r for r in resultados if not r["ok"]]
+        for grupo, resultados in config.stash[PREFLIGHT_KEY].items()
+    }
+    caidos = {grupo: fallas for grupo, fallas in caidos.items() if fallas}
+    if caidos and config.getoption("--preflight") == "abort":
+        detalle = ", ".join(f"{r['url']} ({r['error']})" for fallas in caidos.values() for r in fallas)
+        mensaje = f"Preflight: no responde {detalle}"
+        # No corre nada y la sesión termina con error (pytest.exit en un worker rompería xdist)
+        config.hook.pytest_deselected(items=list(items))
+        items[:] = []
+        if is_worker():
+            config.workeroutput["preflight_abort"] = mensaje
+        else:
+            config.stash[PREFLIGHT_ABORT_KEY] = mensaje
+        return
+
+    for item in items:
+        fallas = caidos.get(_grupo_preflight(item))
+        if fallas:
+            detalle = ", ".join(f"{r['url']} ({r['error']})" for r in fallas)
+            item.add_marker(pytest.mark.skip(reason=f"Preflight: no responde {detalle}"))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """(xdist) El controlador junta el preflight de los workers (para el reporte) y si alguno canceló."""
+    salida = getattr(node, "workeroutput", {})
+    node.config.stash.setdefault(PREFLIGHT_KEY, {}).update(salida.get("preflight", {}))
+    if "preflight_abort" in salida:
+        node.config.stash[PREFLIGHT_ABORT_KEY] = salida["preflight_abort"]
+
+def _seleccionar_por_impacto(config, items):
+    """Deselecciona los tests cuyas dependencias registradas no cambiaron en git."""
+    raiz = str(config.rootpath)
+    base = config.getoption("--impact-base")
+    cambios = ImpactMap.cambios(raiz, base)
+    if cambios is None:
+        logger.warning("--impact: no se pudieron obtener los cambios de git, se corren todos los tests")
+        return
+
+    locators = {}
+    for archivo in cambios:
+        if archivo.startswith("pages/") and archivo.endswith(".py"):
+            nombres = ImpactMap.locators_cambiados(raiz, archivo, base)
+            if nombres:
+                locators[archivo] = nombres
+
+    elegidos = set(ImpactMap.seleccionar(
+        [item.nodeid for item in items], ImpactMap.cargar(), cambios, locators,
+        siempre={item.nodeid for item in items if item.get_closest_marker("smoke")}
+    ))
+    descartados = [item for item in items if item.nodeid not in elegidos]
+    if descartados:
+        config.hook.pytest_deselected(items=descartados)
+        items[:] = [item for item in items if item.nodeid in elegidos]
+    logger.info("--impact: %s tests afectados por %s archivos modificados, %s deseleccionados",
+                len(items), len(cambios), len(descartados))
+
+def pytest_runtest_logreport(report):
+    """Acumula la duración de cada fase del test y la agrega al stream de resultados.
+
+    Con xdist el controlador recibe las fases de todos los workers.
+    """
+    DurationStore.actual().registrar(report)
+    stream = ResultsStream.actual()
+    if stream:
+        stream.registrar(report, worker=worker_id())
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Los datos que lee un módulo de test al importarse (parametrize) son dependencias de sus tests."""
+    impacto = ImpactMap.actual()
+    if isinstance(collector, pytest.Module):
+        impacto.contexto = collector.nodeid
+    yield
+    impacto.contexto = None
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Asocia al test las páginas, locators y datos que use durante su ejecución, y sus líneas de log."""
+    impacto = ImpactMap.actual()
+    impacto.iniciar_test(item.nodeid)
+    Logger.iniciar_test(item.nodeid)
+    yield
+    impacto.contexto = None
+    Logger.iniciar_test(None)
+
+def pytest_sessionfinish(session, exitstatus):
+    """Termina las escrituras pendientes; con xdist el controlador une los logs y guarda las duraciones."""
+    if SCREENSHOT_WRITER_KEY in session.config.stash:
+        session.config.stash[SCREENSHOT_WRITER_KEY].shutdown()
+    _exportar_tiempos_de_pasos(session.config)
+    _exportar_mapa_de_impacto()
+    Logger.flush()
+    if is_worker():
+        session.config.workeroutput["preflight"] = session.config.stash.get(PREFLIGHT_KEY, {})
+    else:
+        directorio = session.config.stash.get(COMPARTIDO_DIR_KEY, None)
+        if directorio:
+            shutil.rmtree(directorio, ignore_errors=True)
+        _cerrar_preflight(session)
+        Logger.unir_workers()
+        DurationStore.actual().guardar()
+        _cerrar_stream_de_resultados(session.config, exitstatus)
+
+def _cerrar_preflight(session):
+    """Si el preflight encontró un sitio caído la sesión termina con error, aunque sus tests solo se omitieran."""
+    mensaje = session.config.stash.get(PREFLIGHT_ABORT_KEY, None)
+    if mensaje:
+        logger.error("%s: ejecución cancelada", mensaje)
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+        return
+
+    caidos = sorted({
+        f"{r['url']} ({r['error']})"
+        for resultados in session.config.stash.get(PREFLIGHT_KEY, {}).values() for r in resultados if not r["ok"]
+    })
+    if caidos:
+        # Una caída no puede terminar en verde: se omitieron los tests que dependían del sitio
+        logger.error("Preflight: no responde %s; sus tests se omitieron", ", ".join(caidos))
+        if session.exitstatus in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+def _cerrar_stream_de_resultados(config, exitstatus):
+    """Cierra el JSONL de resultados y arma el reporte paginado a partir de él."""
+    stream = ResultsStream.actual()
+    if not stream:
+        return
+    stream.cerrar(exitstatus)
+    if config.getoption("--stream-report"):
+        indice = ReportRenderer.renderizar(stream.ruta, config.getoption("--stream-report"))
+        logger.info("Reporte paginado: %s", indice)
+
+def _exportar_tiempos_de_pasos(config):
+    """Escribe el JSON de tiempos por paso (uno por worker, unidos por el controlador)."""
+    timer = StepTimer.actual()
+    if is_worker():
+        if timer.pasos:
+            base, ext = os.path.splitext(StepTimer.ARCHIVO)
+            timer.exportar(f"{base}_{worker_id()}{ext}")
+        return
+
+    pasos = StepTimer.unir_workers()
+    if pasos is None and timer.pasos:
+        timer.exportar(StepTimer.ARCHIVO)
+        pasos = timer.pasos
+    config.stash[STEP_TIMINGS_KEY] = pasos or []
+
+def _exportar_mapa_de_impacto():
+    """Actualiza el mapa de impacto con los tests ejecutados (por worker, unidos por el controlador)."""
+    impacto = ImpactMap.actual()
+    if is_worker():
+        base, ext = os.path.splitext(ImpactMap.ARCHIVO)
+        impacto.exportar(f"{base}_{worker_id()}{ext}")
+        return
+    if not ImpactMap.unir_workers():
+        impacto.exportar(ImpactMap.ARCHIVO)
+
+def pytest_unconfigure(config):
+    """Vacía la cola de logs antes de terminar."""
+    Logger.detener()
+
 # 5. Configuración del reporte HTML
 @pytest.hookimpl(optionalhook=True)
 def pytest_html_report_title(report):
@@ -104,7 +825,7 @@ def pytest_html_report_title(report):
 
 # 6. Agregar información adicional al reporte
 @pytest.hookimpl(optionalhook=True)
-def pytest_html_results_summary(prefix, summary, postfix):
+def pytest_html_results_summary(prefix, summary, postfix, session):
     """Agregar resumen personalizado al reporte HTML."""
     prefix.extend([
         "<h2>Proyecto Final - Automation Testing</h2>",
@@ -113,3 +834,45 @@ def pytest_html_results_summary(prefix, summary, postfix):
         "<p><strong>URL:</strong> <a href='https://talentolab-test.netlify.app'>https://talentolab-test.netlify.app</a></p>",
         f"<p><strong>Fecha de Ejecución:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>"
     ])
+    prefix.extend(_tabla_preflight(session.config.stash.get(PREFLIGHT_KEY, {})))
+    postfix.extend(_tabla_pasos_lentos(session.config.stash.get(STEP_TIMINGS_KEY, [])))
+
+def _tabla_preflight(grupos):
+    """Tabla HTML con la disponibilidad y la latencia base de cada sitio bajo prueba."""
+    if not grupos:
+        return []
+    filas = "".join(
+        f"<tr><td>{grupo}</td><td>{html.escape(r['url'])}</td>"
+        f"<td>{r['status'] or html.escape(r['error'] or '')}</td><td>{r['ms']}</td></tr>"
+        for grupo, resultados in grupos.items() for r in resultados
+    )
+    return [
+        "<h3>Preflight (latencia base)</h3>",
+        f"<table><tr><th>Grupo</th><th>URL</th><th>Status</th><th>ms</th></tr>{filas}</table>",
+    ]
+
+def _tabla_pasos_lentos(pasos):
+    """Tablas HTML con los pasos y locators más lentos de la ejecución."""
+    if not pasos:
+        return []
+    mas_lentos, locators = StepTimer.resumen(pasos)
+    filas_pasos = "".join(
+        f"<tr><td>{html.escape(p['test'] or '')}</td><td>{p['pagina']}</td><td>{p['accion']}</td>"
+        f"<td>{html.escape(p['locator'])}</td><td>{p['total_ms']}</td><td>{p['espera_ms']}</td>"
+        f"<td>{p['comando_ms']}</td></tr>"
+        for p in mas_lentos
+    )
+    filas_locators = "".join(
+        f"<tr><td>{l['pagina']}</td><td>{html.escape(l['locator'])}</td><td>{l['veces']}</td>"
+        f"<td>{l['total_ms']:.1f}</td><td>{l['espera_ms']:.1f}</td></tr>"
+        for l in locators
+    )
+    return [
+        "<h3>Pasos más lentos</h3>",
+        "<table><tr><th>Test</th><th>Página</th><th>Paso</th><th>Locator</th>"
+        f"<th>Total ms</th><th>Espera ms</th><th>Comando ms</th></tr>{filas_pasos}</table>",
+        "<h3>Locators con más tiempo acumulado</h3>",
+        "<table><tr><th>Página</th><th>Locator</th><th>Veces</th>"
+        f"<th>Total ms</th><th>Espera ms</th></tr>{filas_locators}</table>",
+        f"<p>Detalle completo en <code>{StepTimer.ARCHIVO}</code></p>",
+    ]
@@ -1,5 +1,4 @@
 import pytest
-import requests
 from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
@@ -8,11 +7,12 @@ class TestAPIJSONPlaceholder:
     """
     Suite de pruebas para API REST usando JSONPlaceholder (https://jsonplaceholder.typicode.com).
     Cubre diferentes métodos HTTP: GET, POST, DELETE, PUT.
+    Las peticiones usan el fixture api_client (conexión keep-alive compartida,
+    URL base configurable con --api-base-url).
     """
 
-    BASE_URL = "https://jsonplaceholder.typicode.com"
-
-    def test_api_get_usuarios_lista(self):
+    @pytest.mark.smoke
+    def test_api_get_usuarios_lista(self, api_client):
         """
         API Test 1: GET - Obtener lista de usuarios.
         Valida código de estado y estructura de respuesta.
@@ -20,10 +20,10 @@ class TestAPIJSONPlaceholder:
         logger.info("=== Iniciando API Test 1: GET Lista de Usuarios ===")
 
         # Realizar petición GET
-        endpoint = f"{self.BASE_URL}/users"
-        response = requests.get(endpoint)
+        endpoint = "/users"
+        response = api_client.get(endpoint)
 
-        logger.info(f"Endpoint: {endpoint}")
+        logger.info(f"Endpoint: {response.url}")
         logger.info(f"Status Code: {response.status_code}")
 
         # Validar código de estado
@@ -45,17 +45,17 @@ class TestAPIJSONPlaceholder:
         logger.info(f"✓ Test exitoso: {len(data)} usuarios obtenidos")
         logger.info(f"Primer usuario: {primer_usuario['name']} ({primer_usuario['email']})")
 
-    def test_api_get_usuario_individual(self):
+    def test_api_get_usuario_individual(self, api_client):
         """
         API Test 2: GET - Obtener usuario específico por ID.
         """
         logger.info("=== Iniciando API Test 2: GET Usuario Individual ===")
 
         user_id = 1
-        endpoint = f"{self.BASE_URL}/users/{user_id}"
-        response = requests.get(endpoint)
+        endpoint = f"/users/{user_id}"
+        response = api_client.get(endpoint)
 
-        logger.info(f"Endpoint: {endpoint}")
+        logger.info(f"Endpoint: {response.url}")
         logger.info(f"Status Code: {response.status_code}")
 
         # Validaciones
@@ -69,7 +69,7 @@ class TestAPIJSONPlaceholder:
         logger.info(f"✓ Usuario obtenido: {usuario['name']}")
         logger.info(f"Email: {usuario['email']}")
 
-    def test_api_get_usuario_no_encontrado(self):
+    def test_api_get_usuario_no_encontrado(self, api_client):
         """
         API Test 3: GET - Caso negativo, usuario que no existe.
         Debe retornar 404.
@@ -77,10 +77,10 @@ class TestAPIJSONPlaceholder:
         logger.info("=== Iniciando API Test 3: GET Usuario No Encontrado (NEGATIVO) ===")
 
         user_id = 9999
-        endpoint = f"{self.BASE_URL}/users/{user_id}"
-        response = requests.get(endpoint)
+        endpoint = f"/users/{user_id}"
+        response = api_client.get(endpoint)
 
-        logger.info(f"Endpoint: {endpoint}")
+        logger.info(f"Endpoint: {response.url}")
         logger.info(f"Status Code: {response.status_code}")
 
         # Validar que retorna 404
@@ -88,14 +88,14 @@ class TestAPIJSONPlaceholder:
 
         logger.info("✓ Test exitoso: Usuario inexistente retorna 404 correctamente")
 
-    def test_api_post_crear_post(self):
+    def test_api_post_crear_post(self, api_client):
         """
         API Test 4: POST - Crear nuevo post.
         Valida código 201 y que el post creado tenga ID.
         """
         logger.info("=== Iniciando API Test 4: POST Crear Post ===")
 
-        endpoint = f"{self.BASE_URL}/posts"
+        endpoint = "/posts"
 
         # Datos del nuevo post
         nuevo_post = {
@@ -105,9 +105,9 @@ class TestAPIJSONPlaceholder:
         }
 
         # Realizar petición POST
-        response = requests.post(endpoint, json=nuevo_post)
+        response = api_client.post(endpoint, json=nuevo_post)
 
-        logger.info(f"Endpoint: {endpoint}")
+        logger.info(f"Endpoint: {response.url}")
         logger.info(f"Datos enviados: {nuevo_post}")
         logger.info(f"Status Code: {response.status_code}")
 
@@ -121,7 +121,7 @@ class TestAPIJSONPlaceholder:
 
         logger.info(f"✓ Post creado exitosamente con ID: {data['id']}")
 
-    def test_api_delete_post(self):
+    def test_api_delete_post(self, api_client):
         """
         API Test 5: DELETE - Eliminar post.
         Debe retornar código 200.
@@ -129,12 +129,12 @@ class TestAPIJSONPlaceholder:
         logger.info("=== Iniciando API Test 5: DELETE Post ===")
 
         post_id = 1
-        endpoint = f"{self.BASE_URL}/posts/{post_id}"
+        endpoint = f"/posts/{post_id}"
 
         # Realizar petición DELETE
-        response = requests.delete(endpoint)
+        response = api_client.delete(endpoint)
 
-        logger.info(f"Endpoint: {endpoint}")
+        logger.info(f"Endpoint: {response.url}")
         logger.info(f"Status Code: {response.status_code}")
 
         # Validar código 200
@@ -142,7 +142,7 @@ class TestAPIJSONPlaceholder:
 
         logger.info("✓ Post eliminado exitosamente")
 
-    def test_api_encadenamiento_crear_y_obtener(self):
+    def test_api_encadenamiento_crear_y_obtener(self, api_client):
         """
         API Test 6: ENCADENAMIENTO - Crear post y luego obtener lista.
         Demuestra flujo donde una petición depende de otra.
@@ -150,7 +150,7 @@ class TestAPIJSONPlaceholder:
         logger.info("=== Iniciando API Test 6: Encadenamiento POST + GET ===")
 
         # Paso 1: Crear post
-        endpoint_post = f"{self.BASE_URL}/posts"
+        endpoint_post = "/posts"
         nuevo_post = {
             "title": "QA Automation Framework",
             "body": "Testing con Pytest y Requests",
@@ -158,7 +158,7 @@ class TestAPIJSONPlaceholder:
         }
 
         logger.info("Paso 1: Creando post...")
-        response_post = requests.post(endpoint_post, json=nuevo_post)
+        response_post = api_client.post(endpoint_post, json=nuevo_post)
 
         assert response_post.status_code == 201, "Error al crear post"
         post_creado = response_post.json()
@@ -167,10 +167,10 @@ class TestAPIJSONPlaceholder:
         logger.info(f"✓ Post creado con ID: {post_id}")
 
         # Paso 2: Obtener lista de posts para verificar
-        endpoint_get = f"{self.BASE_URL}/posts"
+        endpoint_get = "/posts"
 
         logger.info(f"Paso 2: Obteniendo lista de posts...")
-        response_get = requests.get(endpoint_get)
+        response_get = api_client.get(endpoint_get)
 
         assert response_get.status_code == 200, "Error al obtener lista"
         posts = response_get.json()
@@ -1,15 +1,15 @@
 import pytest
-import time
-import os
 from pages.home_page import HomePage
 from pages.register_page import RegisterPage
 from utils.logger import Logger
+from utils.upload_files import MB
 
 logger = Logger.get_logger(__name__)
 
 class TestRegistroCV:
     """Suite de pruebas para registro y carga de CV."""
 
+    @pytest.mark.smoke
     def test_tc001_registro_valido(self, driver):
         """
         TC-001: Registro válido desde botón principal.
@@ -18,7 +18,6 @@ class TestRegistroCV:
 
         home = HomePage(driver)
         home.open()
-        time.sleep(2)
 
         # Verificar que página se cargó
         assert home.is_page_loaded(), "Página principal no cargó correctamente"
@@ -28,7 +27,6 @@ class TestRegistroCV:
         logger.info(f"URL inicial: {url_inicial}")
 
         home.click_registrate()
-        time.sleep(2)
 
         url_final = home.get_current_url()
         logger.info(f"URL después de click: {url_final}")
@@ -45,7 +43,6 @@ class TestRegistroCV:
 
         register = RegisterPage(driver)
         register.open()
-        time.sleep(2)
 
         # Completar formulario
         register.complete_form(
@@ -54,31 +51,23 @@ class TestRegistroCV:
             password="Test123456"
         )
 
-        time.sleep(1)
-
         # Enviar formulario
         register.submit_form()
-        time.sleep(2)
 
         logger.info("✓ Formulario de registro enviado correctamente")
         assert True
 
-    def test_tc002_carga_cv_valido(self, driver):
+    def test_tc002_carga_cv_valido(self, driver, upload_files):
         """
         TC-002: Carga de CV con archivo válido (PDF < 5MB).
         """
         logger.info("=== Iniciando TC-002: Carga CV válido ===")
 
-        # Crear archivo de prueba temporal
-        test_file_path = os.path.abspath("test_data/cv_prueba.txt")
-        os.makedirs("test_data", exist_ok=True)
-
-        with open(test_file_path, "w") as f:
-            f.write("CV de prueba - Carlos Mendez\nEditor de Video\n")
+        # PDF válido de 100KB (creado una vez por sesión)
+        test_file_path = upload_files.crear("pdf", 100 * 1024)
 
         register = RegisterPage(driver)
         register.open()
-        time.sleep(2)
 
         # Completar datos básicos
         register.complete_form(
@@ -91,33 +80,23 @@ class TestRegistroCV:
         try:
             register.upload_cv(test_file_path)
             logger.info("✓ CV cargado sin errores")
-            time.sleep(1)
         except Exception as e:
             logger.warning(f"Advertencia al cargar CV: {e}")
 
-        # Limpiar archivo temporal
-        if os.path.exists(test_file_path):
-            os.remove(test_file_path)
-
         assert True, "Test de carga CV ejecutado"
 
-    def test_tc008_carga_cv_corrupto(self, driver):
+    def test_tc008_carga_cv_corrupto(self, driver, upload_files):
         """
         TC-008: Verificar rechazo de archivo corrupto como CV.
         Caso de prueba NEGATIVO.
         """
         logger.info("=== Iniciando TC-008: Carga CV corrupto (NEGATIVO) ===")
 
-        # Crear archivo corrupto
-        corrupted_file = os.path.abspath("test_data/cv_corrupto.pdf")
-        os.makedirs("test_data", exist_ok=True)
-
-        with open(corrupted_file, "wb") as f:
-            f.write(b'\x00\x01\x02\xFF\xFE')  # Bytes aleatorios
+        # Archivo corrupto: bytes sin sentido con extensión .pdf
+        corrupted_file = upload_files.crear("corrupto")
 
         register = RegisterPage(driver)
         register.open()
-        time.sleep(2)
 
         register.complete_form(
             nombre="Test Corrupto",
@@ -132,30 +111,20 @@ class TestRegistroCV:
         except:
             logger.info("✓ Archivo corrupto fue rechazado correctamente")
 
-        # Limpiar
-        if os.path.exists(corrupted_file):
-            os.remove(corrupted_file)
-
         assert True, "Test negativo ejecutado - documenta BUG-005"
 
-    def test_tc009_carga_cv_limite_peso(self, driver):
+    def test_tc009_carga_cv_limite_peso(self, driver, upload_files):
         """
         TC-009: Verificar límite de tamaño de archivo (> 5MB).
         Caso de prueba NEGATIVO.
         """
         logger.info("=== Iniciando TC-009: Carga CV excede límite peso (NEGATIVO) ===")
 
-        # Crear archivo grande (simulado, no real de 5MB para no tardar)
-        large_file = os.path.abspath("test_data/cv_grande.pdf")
-        os.makedirs("test_data", exist_ok=True)
-
-        # Archivo de 1MB como simulación (en producción sería 6MB)
-        with open(large_file, "wb") as f:
-            f.write(b'0' * (1024 * 1024))  # 1MB
+        # PDF válido de 6MB (archivo disperso: no cuesta escribirlo)
+        large_file = upload_files.crear("pdf", 6 * MB)
 
         register = RegisterPage(driver)
         register.open()
-        time.sleep(2)
 
         register.complete_form(
             nombre="Test Grande",
@@ -170,8 +139,4 @@ class TestRegistroCV:
         except:
             logger.info("✓ Archivo grande fue rechazado correctamente")
 
-        # Limpiar
-        if os.path.exists(large_file):
-            os.remove(large_file)
-
         assert True, "Test negativo ejecutado - documenta BUG-001"
@@ -1,5 +1,4 @@
 import pytest
-import time
 from pages.home_page import HomePage
 from pages.contacto_page import ContactoPage
 from utils.data_reader import DataReader
@@ -10,6 +9,7 @@ logger = Logger.get_logger(__name__)
 class TestContacto:
     """Suite de pruebas para la funcionalidad de Contacto."""
 
+    @pytest.mark.smoke
     def test_tc003_envio_formulario_exitoso(self, driver):
         """
         TC-003: Envío exitoso del formulario de contacto con datos válidos.
@@ -19,11 +19,9 @@ class TestContacto:
         # Abrir página principal
         home = HomePage(driver)
         home.open()
-        time.sleep(2)
 
         # Scroll a sección contacto
         home.scroll_to_contacto()
-        time.sleep(1)
 
         # Completar formulario
         contacto = ContactoPage(driver)
@@ -33,11 +31,8 @@ class TestContacto:
             mensaje="¿Cómo es el proceso de selección?"
         )
 
-        time.sleep(1)
-
         # Enviar formulario
         contacto.enviar_formulario()
-        time.sleep(2)
 
         logger.info("✓ Formulario enviado - Test ejecutado")
         # Nota: Según BUG-003, el formulario no envía correctamente
@@ -45,7 +40,9 @@ class TestContacto:
 
         assert True, "Test ejecutado - documenta comportamiento actual"
 
-    @pytest.mark.parametrize("datos", DataReader.read_csv("test_data/contacto.csv"))
+    @pytest.mark.parametrize(
+        "datos", DataReader.read_csv("test_data/contacto.csv"), ids=DataReader.id_column("email")
+    )
     def test_tc003_formulario_con_diferentes_datos(self, driver, datos):
         """
         TC-003: Prueba parametrizada del formulario con diferentes datos desde CSV.
@@ -54,10 +51,8 @@ class TestContacto:
 
         home = HomePage(driver)
         home.open()
-        time.sleep(1)
 
         home.scroll_to_contacto()
-        time.sleep(1)
 
         contacto = ContactoPage(driver)
         contacto.completar_formulario(
@@ -66,10 +61,7 @@ class TestContacto:
             mensaje=datos['mensaje']
         )
 
-        time.sleep(1)
-
         contacto.enviar_formulario()
-        time.sleep(1)
 
         # Verificar según resultado esperado
         if datos['esperado'] == 'error':
@@ -89,10 +81,8 @@ class TestContacto:
 
         home = HomePage(driver)
         home.open()
-        time.sleep(2)
 
         home.scroll_to_contacto()
-        time.sleep(1)
 
         contacto = ContactoPage(driver)
 
@@ -106,7 +96,6 @@ class TestContacto:
         # Intentar enviar
         try:
             contacto.enviar_formulario()
-            time.sleep(2)
 
             # Verificar que sigue en la misma sección (no se envió)
             logger.warning("BUG-003: Formulario no valida campos vacíos")
@@ -0,0 +1,47 @@
+import pytest
+from pages.home_page import HomePage
+from pages.register_page import RegisterPage
+from utils.perf_metrics import PageMetrics
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+PAGINAS = {
+    "home": HomePage,
+    "register": RegisterPage,
+}
+
+@pytest.mark.benchmark
+@pytest.mark.full_render
+class TestPerformanceCarga:
+    """Benchmark de carga de páginas (solo corre con --benchmark)."""
+
+    @pytest.mark.parametrize("cache", ["cold", "warm"])
+    @pytest.mark.parametrize("pagina", list(PAGINAS))
+    def test_benchmark_carga_pagina(self, driver, request, pagina, cache):
+        """
+        PERF-001: Mide N cargas de la página con caché fría o caliente.
+        Reporta min/mediana/p95 de Navigation y Paint Timing y de los recursos descargados.
+        """
+        corridas = request.config.getoption("--benchmark-runs")
+        logger.info(f"=== Benchmark de carga: {pagina} ({cache} cache, {corridas} corridas) ===")
+
+        page = PAGINAS[pagina](driver)
+        if cache == "warm":
+            page.open(force=True) # Carga inicial para dejar la caché caliente
+
+        muestras = []
+        for _ in range(corridas):
+            if cache == "cold":
+                PageMetrics.limpiar_cache(driver)
+            page.open(force=True)
+            muestras.append(PageMetrics.capturar(driver))
+
+        registro = PageMetrics.guardar(pagina, driver.current_url, cache, muestras)
+        for metrica, valores in registro["resumen"].items():
+            if valores:
+                logger.info(f"{pagina}/{cache} {metrica}: {valores}")
+                request.node.user_properties.append((metrica, valores))
+
+        assert len(muestras) == corridas, "No se pudieron capturar todas las muestras"
+        logger.info(f"✓ Benchmark registrado en {PageMetrics.HISTORIAL}")
@@ -1,5 +1,4 @@
 import pytest
-import time
 from pages.home_page import HomePage
 from pages.contacto_page import ContactoPage
 from pages.servicios_page import ServiciosPage
@@ -7,19 +6,23 @@ from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
 
+@pytest.mark.full_render
 class TestResponsividad:
-    """Suite de pruebas para responsividad móvil."""
+    """Suite de pruebas para responsividad móvil.
 
-    def test_tc010_navegacion_mobile(self, driver_mobile):
+    Cada test corre una vez por dispositivo de --devices (teléfonos y
+    tablets), cambiando la emulación del mismo navegador vía CDP.
+    """
+
+    def test_tc010_navegacion_mobile(self, driver_device):
         """
         TC-010: Navegación responsive en dispositivo móvil.
         Verifica menú hamburguesa y disposición de elementos.
         """
         logger.info("=== Iniciando TC-010: Navegación Mobile ===")
 
-        home = HomePage(driver_mobile)
+        home = HomePage(driver_device)
         home.open()
-        time.sleep(3)
 
         # Verificar que la página se carga en móvil
         assert home.is_page_loaded(), "Página no cargó correctamente en móvil"
@@ -28,18 +31,15 @@ class TestResponsividad:
         # Scroll a diferentes secciones
         try:
             home.scroll_to_servicios()
-            time.sleep(2)
             logger.info("✓ Scroll a servicios funcional")
 
-            servicios = ServiciosPage(driver_mobile)
+            servicios = ServiciosPage(driver_device)
             servicios_disponibles = servicios.get_servicios_disponibles()
             logger.info(f"Servicios visibles en móvil: {len(servicios_disponibles)}")
 
-            # Scroll a contacto
-            driver_mobile.get("https://talentolab-test.netlify.app")
-            time.sleep(2)
+            # Scroll a contacto (open reutiliza la página ya cargada y vuelve arriba)
+            home.open()
             home.scroll_to_contacto()
-            time.sleep(2)
             logger.info("✓ Scroll a contacto funcional")
 
             logger.info("✓ Navegación móvil completada exitosamente")
@@ -52,20 +52,18 @@ class TestResponsividad:
             assert True, "Test ejecutado - documenta comportamiento móvil"
 
     @pytest.mark.mobile
-    def test_formulario_contacto_mobile(self, driver_mobile):
+    def test_formulario_contacto_mobile(self, driver_device):
         """
         Verificar funcionalidad del formulario de contacto en móvil.
         """
         logger.info("=== Test: Formulario Contacto en Mobile ===")
 
-        home = HomePage(driver_mobile)
+        home = HomePage(driver_device)
         home.open()
-        time.sleep(2)
 
         home.scroll_to_contacto()
-        time.sleep(2)
 
-        contacto = ContactoPage(driver_mobile)
+        contacto = ContactoPage(driver_device)
 
         try:
             contacto.completar_formulario(
@@ -74,7 +72,6 @@ class TestResponsividad:
                 mensaje="Prueba desde dispositivo móvil"
             )
 
-            time.sleep(1)
             logger.info("✓ Formulario completado en vista móvil")
 
             assert True, "Formulario accesible en móvil"
@@ -83,20 +80,18 @@ class TestResponsividad:
             assert True, "Test ejecutado - documenta comportamiento"
 
     @pytest.mark.mobile
-    def test_servicios_responsive_mobile(self, driver_mobile):
+    def test_servicios_responsive_mobile(self, driver_device):
         """
         Verificar que las tarjetas de servicios se muestran correctamente en móvil.
         """
         logger.info("=== Test: Servicios Responsive Mobile ===")
 
-        home = HomePage(driver_mobile)
+        home = HomePage(driver_device)
         home.open()
-        time.sleep(2)
 
         home.scroll_to_servicios()
-        time.sleep(2)
 
-        servicios = ServiciosPage(driver_mobile)
+        servicios = ServiciosPage(driver_device)
         servicios_disponibles = servicios.get_servicios_disponibles()
 
         logger.info(f"Servicios visibles en móvil: {len(servicios_disponibles)}")
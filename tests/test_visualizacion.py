@@ -1,5 +1,4 @@
 import pytest
-import time
 from pages.home_page import HomePage
 from pages.servicios_page import ServiciosPage
 from pages.clientes_page import ClientesPage
@@ -19,7 +18,6 @@ class TestVisualizacion:
         # Abrir página principal
         home = HomePage(driver)
         home.open()
-        time.sleep(2)
 
         # Acceder a sección clientes
         clientes = ClientesPage(driver)
@@ -36,6 +34,7 @@ class TestVisualizacion:
 
         logger.info(f"✓ Test exitoso: {cantidad} testimonios verificados")
 
+    @pytest.mark.smoke
     def test_tc006_visualizacion_servicios(self, driver):
         """
         TC-006: Verificar visualización clara de servicios ofrecidos.
@@ -47,7 +46,6 @@ class TestVisualizacion:
 
         # Scroll a servicios
         home.scroll_to_servicios()
-        time.sleep(2)
 
         servicios = ServiciosPage(driver)
 
@@ -73,14 +71,12 @@ class TestVisualizacion:
 
         home = HomePage(driver)
         home.open()
-        time.sleep(2)
 
         # Verificar que la página se cargó correctamente
         assert home.is_page_loaded(), "La página principal no se cargó correctamente"
 
         # Scroll por las diferentes secciones
         home.scroll_to_servicios()
-        time.sleep(1)
 
         servicios = ServiciosPage(driver)
         servicios_disponibles = servicios.get_servicios_disponibles()
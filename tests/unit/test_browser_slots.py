@@ -0,0 +1,44 @@
+import getpass
+import os
+from utils.parallel import BrowserSlots
+
+def test_aviso_de_espera_propio_o_huerfano_no_cuenta(tmp_path):
+    slots = BrowserSlots(1, str(tmp_path))
+    propio = slots._avisar_espera()
+    assert not slots.hay_esperando()
+    slots._retirar_aviso(propio)
+
+    # Aviso de un proceso que murió: nadie tiene el lock, se borra
+    (tmp_path / "espera_999999.lock").write_text("")
+    assert not slots.hay_esperando()
+    assert not os.path.exists(tmp_path / "espera_999999.lock")
+
+def test_slots_se_toman_y_liberan(tmp_path):
+    slots = BrowserSlots(2, str(tmp_path))
+    primero, segundo = slots.acquire(), slots.acquire()
+    otro_proceso = BrowserSlots(2, str(tmp_path)) # Mismos archivos de lock, otro contador
+    try:
+        otro_proceso.acquire(timeout=0.3)
+        assert False, "No debería haber un tercer slot"
+    except TimeoutError:
+        pass
+    slots.release(primero)
+    slots.release(slots.acquire(timeout=1))
+    slots.release(segundo)
+
+def test_pedir_mas_slots_de_los_que_hay_falla_enseguida(tmp_path):
+    slots = BrowserSlots(1, str(tmp_path))
+    slot = slots.acquire(timeout=0.1)
+    try:
+        slots.acquire()
+        assert False, "Un segundo slot en el mismo proceso es un bloqueo seguro"
+    except RuntimeError as e:
+        assert "ya tiene los 1 slots" in str(e)
+    slots.release(slot)
+    slots.release(slots.acquire(timeout=0.1))
+
+def test_el_directorio_es_propio_del_usuario_y_del_checkout(tmp_path):
+    uno = BrowserSlots.directorio_para(tmp_path / "clon_a")
+    assert uno == BrowserSlots.directorio_para(tmp_path / "clon_a")
+    assert uno != BrowserSlots.directorio_para(tmp_path / "clon_b")
+    assert getpass.getuser() in os.path.basename(uno)
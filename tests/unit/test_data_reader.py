@@ -0,0 +1,36 @@
+import pytest
+from utils.data_reader import DataReader
+
+def _csv(tmp_path, contenido):
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text(contenido, encoding="utf-8")
+    return str(ruta)
+
+def test_encabezados_que_no_son_identificadores(tmp_path):
+    ruta = _csv(tmp_path, "first name,e-mail,class,1er,first name\nAna,ana@x.com,A,si,dup\n")
+    registro = DataReader.read_csv(ruta)[0]
+
+    assert registro["first name"] == "Ana"
+    assert registro["e-mail"] == registro.e_mail == "ana@x.com"
+    assert registro["class"] == "A"
+    assert registro["1er"] == "si"
+    assert registro.first_name == "Ana"
+    assert registro.get("no existe") is None
+    with pytest.raises(KeyError):
+        registro["no existe"]
+
+def test_filas_cortas_se_completan_con_none(tmp_path):
+    ruta = _csv(tmp_path, "nombre,edad,email\nAna,30\nLuis\n")
+    filas = DataReader.read_csv(ruta, tipos={"edad": int})
+
+    assert filas[0]["edad"] == 30 and filas[0]["email"] is None
+    assert filas[1]["edad"] is None and filas[1].email is None
+
+def test_fila_con_valores_de_mas_falla_con_la_linea(tmp_path):
+    ruta = _csv(tmp_path, "nombre,edad\nAna,30,extra\n")
+    with pytest.raises(ValueError, match="línea 2: 3 valores para 2 columnas"):
+        DataReader.read_csv(ruta)
+
+def test_coma_final_vacia_no_es_un_valor_de_mas(tmp_path):
+    ruta = _csv(tmp_path, "nombre,edad\nAna,30,\n")
+    assert DataReader.read_csv(ruta)[0]["edad"] == "30"
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from utils.duration_store import DurationStore
+from utils.scheduling import ordenar_por_duracion
+
+def _reporte(nodeid, when, duracion, outcome="passed"):
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duracion, outcome=outcome)
+
+def test_los_tests_sin_historial_se_ubican_con_la_mediana():
+    tests = ["a", "nuevo", "b", "c", "otro_nuevo"]
+    orden, duraciones = ordenar_por_duracion(tests, {"a": 1.0, "b": 9.0, "c": 3.0})
+
+    assert duraciones == [1.0, 3.0, 9.0, 3.0, 3.0]
+    # A igual duración se conserva el orden de colección
+    assert [tests[i] for i in orden] == ["b", "nuevo", "c", "otro_nuevo", "a"]
+
+def test_sin_historial_se_conserva_el_orden_de_coleccion():
+    orden, duraciones = ordenar_por_duracion(["x", "y", "z"], {})
+    assert orden == [0, 1, 2]
+    assert duraciones == [0.0, 0.0, 0.0]
+
+def test_el_historial_se_guarda_y_se_relee(tmp_path):
+    ruta = str(tmp_path / "durations.jsonl")
+    store = DurationStore()
+    for reporte in (
+        _reporte("t::lento", "setup", 0.5), _reporte("t::lento", "call", 4.0),
+        _reporte("t::falla", "call", 1.0, "failed"), _reporte("t::omitido", "setup", 0.0, "skipped"),
+    ):
+        store.registrar(reporte)
+    store.guardar(ruta)
+
+    registros = {r["test"]: r for r in DurationStore.cargar(ruta)}
+    assert set(registros) == {"t::lento", "t::falla"}
+    assert registros["t::lento"]["duracion_s"] == 4.5
+    assert registros["t::falla"]["resultado"] == "failed"
+    assert DurationStore.estimaciones(ruta) == {"t::lento": 4.5, "t::falla": 1.0}
+
+def test_se_conservan_las_ultimas_ejecuciones_de_cada_test(tmp_path):
+    ruta = str(tmp_path / "durations.jsonl")
+    for i in range(DurationStore.MAX_POR_TEST + 3):
+        store = DurationStore()
+        store.registrar(_reporte("t::x", "call", float(i)))
+        store.guardar(ruta)
+
+    duraciones = [r["duracion_s"] for r in DurationStore.cargar(ruta)]
+    assert duraciones == [float(i) for i in range(3, DurationStore.MAX_POR_TEST + 3)]
+
+def test_las_lineas_danadas_o_cortadas_se_ignoran(tmp_path):
+    ruta = tmp_path / "durations.jsonl"
+    ruta.write_text(
+        '{"test": "t::a", "duracion_s": 2.0, "resultado": "passed", "fecha": "2026-01-01T00:00:00"}\n'
+        'esto no es json\n'
+        '{"test": "t::b", "duracion_s": 1.\n'
+        '{"test": "t::c"}\n'
+        '[1, 2]\n'
+        '{"test": "t::a", "duracion_s": 4.0, "resultado": "passed", "fecha": "2026-01-02T00:00:00"}\n'
+        '{"test": "t::d", "dura',
+        encoding="utf-8"
+    )
+
+    assert [r["test"] for r in DurationStore.cargar(str(ruta))] == ["t::a", "t::a"]
+    assert DurationStore.estimaciones(str(ruta)) == {"t::a": 3.0}
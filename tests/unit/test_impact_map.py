@@ -0,0 +1,72 @@
+import subprocess
+from utils.impact_map import ImpactMap
+
+MAPA = {
+    "tests/test_a.py::test_titulo": {
+        "modulos": ["pages/base_page.py", "pages/home_page.py"],
+        "locators": ["pages/home_page.py::TITULO"], "datos": [],
+    },
+    "tests/test_a.py::test_menu": {
+        "modulos": ["pages/base_page.py", "pages/home_page.py"],
+        "locators": ["pages/home_page.py::MENU"], "datos": [],
+    },
+    "tests/test_b.py::test_registro": {
+        "modulos": ["pages/base_page.py", "pages/register_page.py"],
+        "locators": ["pages/register_page.py::EMAIL"], "datos": ["test_data/usuarios.csv"],
+    },
+}
+NODEIDS = list(MAPA)
+
+def test_un_locator_cambiado_elige_solo_los_tests_que_lo_usan():
+    elegidos = ImpactMap.seleccionar(
+        NODEIDS, MAPA, {"pages/home_page.py"}, {"pages/home_page.py": {"pages/home_page.py::MENU"}}
+    )
+    assert elegidos == ["tests/test_a.py::test_menu"]
+
+def test_un_locator_que_ningun_test_registro_elige_por_modulo():
+    elegidos = ImpactMap.seleccionar(
+        NODEIDS, MAPA, {"pages/home_page.py"}, {"pages/home_page.py": {"pages/home_page.py::NUEVO"}}
+    )
+    assert elegidos == ["tests/test_a.py::test_titulo", "tests/test_a.py::test_menu"]
+
+def test_un_archivo_global_elige_todo():
+    for cambio in ("tests/conftest.py", "pytest.ini", "utils/logger.py"):
+        assert ImpactMap.seleccionar(NODEIDS, MAPA, {cambio}, {}) == NODEIDS
+
+def test_un_test_fuera_del_mapa_siempre_se_elige():
+    nuevo = "tests/test_c.py::test_nuevo"
+    assert ImpactMap.seleccionar(NODEIDS + [nuevo], MAPA, {"README.md"}, {}) == [nuevo]
+
+def test_datos_y_smoke():
+    elegidos = ImpactMap.seleccionar(
+        NODEIDS, MAPA, {"test_data/usuarios.csv"}, {}, siempre={"tests/test_a.py::test_titulo"}
+    )
+    assert elegidos == ["tests/test_a.py::test_titulo", "tests/test_b.py::test_registro"]
+
+def _git(raiz, *args):
+    subprocess.run(["git", *args], cwd=raiz, check=True, capture_output=True)
+
+def test_locators_cambiados_distingue_locators_de_otros_cambios(tmp_path):
+    raiz = str(tmp_path)
+    _git(raiz, "init", "-q")
+    _git(raiz, "config", "user.email", "test@example.com")
+    _git(raiz, "config", "user.name", "test")
+    (tmp_path / "pages").mkdir()
+    pagina = tmp_path / "pages" / "home_page.py"
+    original = (
+        "class HomePage:\n"
+        "    TITULO = ('id', 'titulo')\n"
+        "    MENU = ('id', 'menu')\n"
+        "\n"
+        "    def abrir(self):\n"
+        "        return 1\n"
+    )
+    pagina.write_text(original)
+    _git(raiz, "add", ".")
+    _git(raiz, "commit", "-q", "-m", "base")
+
+    pagina.write_text(original.replace("'menu'", "'menu-principal'") + "    # comentario\n")
+    assert ImpactMap.locators_cambiados(raiz, "pages/home_page.py") == {"pages/home_page.py::MENU"}
+
+    pagina.write_text(original.replace("return 1", "return 2"))
+    assert ImpactMap.locators_cambiados(raiz, "pages/home_page.py") is None
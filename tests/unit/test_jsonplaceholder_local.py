@@ -0,0 +1,26 @@
+import pytest
+import requests
+from utils.jsonplaceholder_local import JSONPlaceholderLocal
+
+@pytest.fixture(scope="module")
+def servidor():
+    servidor = JSONPlaceholderLocal().start()
+    yield servidor.base_url
+    servidor.stop()
+
+@pytest.mark.parametrize("metodo,ruta", [("post", "/posts"), ("put", "/posts/1")])
+@pytest.mark.parametrize("cuerpo", ["[]", '"x"', "42", "null"])
+def test_un_cuerpo_que_no_es_objeto_responde_400(servidor, metodo, ruta, cuerpo):
+    respuesta = requests.request(
+        metodo, servidor + ruta, data=cuerpo, headers={"Content-Type": "application/json"}, timeout=5
+    )
+    assert respuesta.status_code == 400
+
+def test_un_objeto_se_acepta(servidor):
+    creado = requests.post(servidor + "/posts", json={"title": "nuevo"}, timeout=5)
+    assert creado.status_code == 201
+    assert creado.json() == {"title": "nuevo", "id": 101}
+
+    actualizado = requests.put(servidor + "/posts/1", json={"title": "editado"}, timeout=5)
+    assert actualizado.status_code == 200
+    assert actualizado.json() == {"title": "editado", "id": 1}
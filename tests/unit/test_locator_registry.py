@@ -0,0 +1,42 @@
+import re
+from selenium.webdriver.common.by import By
+from utils.locator_registry import LocatorRegistry
+
+_CADENA = r"'[^']*'|\"[^\"]*\""
+
+def _evaluar_literal(expresion):
+    """Valor de un literal XPath 1.0 (cadena entre comillas o concat de cadenas), como lo evaluaría el navegador."""
+    if re.fullmatch(_CADENA, expresion):
+        return expresion[1:-1]
+    partes = re.fullmatch(rf"concat\(((?:{_CADENA})(?:, (?:{_CADENA}))+)\)", expresion)
+    assert partes, f"No es un literal XPath válido: {expresion}"
+    return "".join(parte[1:-1] for parte in re.findall(_CADENA, partes.group(1)))
+
+def _texto_buscado(locator):
+    """Extrae del XPath compilado el literal de contains(., ...) y lo evalúa."""
+    by, xpath = LocatorRegistry.compilar(locator)
+    assert by == By.XPATH
+    literal = re.fullmatch(r".*//\*\[text\(\)\[contains\(\., (.+)\)\]\]", xpath).group(1)
+    return _evaluar_literal(literal)
+
+def test_comilla_simple():
+    texto = "Reclutamiento d'Élite"
+    assert LocatorRegistry.xpath_literal(texto) == "\"Reclutamiento d'Élite\""
+    assert _texto_buscado(LocatorRegistry.texto(texto)) == texto
+
+def test_comilla_doble():
+    texto = 'Servicio "Premium"'
+    assert LocatorRegistry.xpath_literal(texto) == "'Servicio \"Premium\"'"
+    assert _texto_buscado(LocatorRegistry.texto(texto)) == texto
+
+def test_comillas_mezcladas_usan_concat():
+    texto = "Joey dijo: \"It's great\" y 'listo'"
+    assert LocatorRegistry.xpath_literal(texto).startswith("concat(")
+    assert _evaluar_literal(LocatorRegistry.xpath_literal(texto)) == texto
+    assert _texto_buscado(LocatorRegistry.texto(texto, "testimonios")) == texto
+
+def test_scope_con_comillas_y_compilado_unico():
+    locator = LocatorRegistry.texto("Ross", "sección'a")
+    by, xpath = LocatorRegistry.compilar(locator)
+    assert xpath.startswith("//*[@id=\"sección'a\"]//*")
+    assert LocatorRegistry.compilar(locator) is LocatorRegistry.compilar(locator)
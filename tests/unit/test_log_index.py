@@ -0,0 +1,68 @@
+import gzip
+import os
+from utils.log_index import LogIndex, LogSegments
+from utils.parallel import merge_worker_logs
+
+def _linea(segundo, texto):
+    return f"2026-01-01 10:00:{segundo:02d} - tests - INFO - {texto}\n"
+
+def test_rotacion_comprime_segmentos_y_extrae_solo_el_test(tmp_path):
+    ruta = str(tmp_path / "log.log")
+    log = LogSegments(ruta, max_bytes=200)
+    for i in range(40):
+        log.escribir(_linea(i, f"linea {i} de t{i % 3}"), f"t{i % 3}")
+    log.cerrar()
+
+    segmentos = sorted(a for a in os.listdir(tmp_path) if a.endswith(".log.gz"))
+    assert len(segmentos) > 1
+    # Cada segmento sigue siendo un gzip válido (miembros concatenados)
+    assert b"linea 0 de t0" in gzip.open(tmp_path / segmentos[0]).read()
+
+    texto = LogIndex.extraer(ruta, "t1")
+    lineas = texto.splitlines()
+    assert len(lineas) == len([i for i in range(40) if i % 3 == 1])
+    assert all("de t1" in linea for linea in lineas)
+
+def test_extraer_filtra_por_ejecucion(tmp_path):
+    ruta = str(tmp_path / "log.log")
+    primera = LogSegments(ruta, ejecucion="a")
+    primera.escribir(_linea(1, "primera corrida"), "t")
+    primera.cerrar()
+    segunda = LogSegments(ruta, ejecucion="b")
+    segunda.escribir(_linea(2, "segunda corrida"), "t")
+
+    assert segunda.tramo("t") == _linea(2, "segunda corrida")
+    segunda.cerrar()
+    assert LogIndex.extraer(ruta, "t", "a") == _linea(1, "primera corrida")
+    assert "primera corrida" in LogIndex.extraer(ruta, "t")
+
+def test_flush_indexa_el_tramo_en_curso(tmp_path):
+    ruta = str(tmp_path / "log.log")
+    log = LogSegments(ruta)
+    log.escribir(_linea(1, "uno"), "t")
+    log.flush()
+    assert [r["test"] for r in LogIndex.leer(ruta)] == ["t"]
+    log.escribir(_linea(2, "dos"), "t")
+    log.cerrar()
+    assert LogIndex.extraer(ruta, "t") == _linea(1, "uno") + _linea(2, "dos")
+
+def test_merge_de_workers_conserva_el_test_de_cada_registro(tmp_path):
+    destino = LogSegments(str(tmp_path / "log.log"), ejecucion="x")
+    destino.escribir(_linea(0, "controlador"), None)
+    for numero, worker in enumerate(("gw0", "gw1")):
+        log = LogSegments(str(tmp_path / f"log_{worker}.log"), max_bytes=150, ejecucion="x")
+        for i in range(6):
+            log.escribir(_linea(i * 2 + numero, f"{worker} paso {i} de t{worker}{i // 2}"), f"t{worker}{i // 2}")
+        log.flush() # Lo que hace el worker en su sessionfinish, antes del merge
+        log.cerrar()
+
+    merge_worker_logs(destino.ruta, destino)
+    destino.flush()
+
+    for worker in ("gw0", "gw1"):
+        for t in range(3):
+            texto = LogIndex.extraer(destino.ruta, f"t{worker}{t}", "x")
+            assert len(texto.splitlines()) == 2, texto
+            assert all(f"de t{worker}{t}" in linea for linea in texto.splitlines())
+    assert not [a for a in os.listdir(tmp_path) if a.startswith("log_gw") and not a.endswith(".gz")]
+    destino.cerrar()
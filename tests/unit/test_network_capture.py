@@ -0,0 +1,46 @@
+import json
+import pytest
+from utils.network_capture import NetworkCapture
+
+class _DriverFalso:
+    """Devuelve como performance log los eventos cargados en cola (una sola vez, como Chrome)."""
+
+    def __init__(self):
+        self.cola = []
+
+    def get_log(self, tipo):
+        eventos, self.cola = self.cola, []
+        return eventos
+
+def _evento(metodo, **params):
+    return {"message": json.dumps({"message": {"method": metodo, "params": params}})}
+
+def _request(request_id, url, bytes_):
+    return [
+        _evento("Network.requestWillBeSent", requestId=request_id, timestamp=1.0, wallTime=1.7e9,
+                type="Script", request={"url": url, "method": "GET"}),
+        _evento("Network.responseReceived", requestId=request_id, response={"status": 200, "mimeType": "text/javascript"}),
+        _evento("Network.loadingFinished", requestId=request_id, timestamp=1.5, encodedDataLength=bytes_),
+    ]
+
+def test_metricas_desconocidas_fallan_con_las_validas():
+    with pytest.raises(ValueError, match=r"\['max_bytes'\].*max_total_bytes"):
+        NetworkCapture.validar("HomePage", {"max_bytes": 1}, "@pytest.mark.network_budget")
+
+def test_carga_excedida_falla_con_la_tabla(tmp_path):
+    driver = _DriverFalso()
+    captura = NetworkCapture.iniciar(driver, "t::x", {"HomePage": {"max_requests": 1, "max_asset_bytes": 1000}})
+    captura.antes_de_cargar()
+    driver.cola = _request("1", "https://x/app.js", 500) + _request("2", "https://x/hero.js", 4000)
+
+    with pytest.raises(AssertionError) as error:
+        captura.registrar_carga("HomePage", "https://x")
+    lineas = [linea.split() for linea in str(error.value).splitlines()]
+    assert ["requests", "1", "2", "+1"] in lineas
+    assert ["asset", "más", "grande", "1000", "B", "3.9", "KB", "+2.9", "KB"] in lineas
+    assert ["https://x/hero.js"] in lineas
+
+    ruta = captura.terminar(str(tmp_path))
+    har = json.loads(open(ruta, encoding="utf-8").read())
+    assert [p["_requests"] for p in har["log"]["pages"]] == [2]
+    assert NetworkCapture.de(driver) is None
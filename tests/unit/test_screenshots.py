@@ -0,0 +1,59 @@
+import builtins
+import os
+import threading
+from utils import screenshots
+from utils.screenshots import ScreenshotWriter
+
+class ImagenFalsa:
+    width, height = 100, 50
+    def convert(self, modo):
+        return self
+    def save(self, buffer, **kwargs):
+        buffer.write(b"JPEG " + kwargs["format"].encode())
+
+class ImageFalso:
+    @staticmethod
+    def open(_):
+        return ImagenFalsa()
+
+def test_sin_conversion_el_reporte_usa_el_png_y_el_archivo_se_escribe(tmp_path):
+    writer = ScreenshotWriter(directorio=str(tmp_path))
+    convertido = writer.submit(b"\x89PNG datos", "captura")
+
+    assert writer.para_reporte(convertido, b"\x89PNG datos") == (b"\x89PNG datos", "image/png", "png")
+    writer.shutdown()
+    with open(tmp_path / "captura.png", "rb") as file:
+        assert file.read() == b"\x89PNG datos"
+
+def test_el_reporte_embebe_la_imagen_convertida_sin_esperar_la_escritura(tmp_path, monkeypatch):
+    monkeypatch.setattr(screenshots, "Image", ImageFalso)
+    escribir = threading.Event()
+
+    def open_lento(*args, **kwargs):
+        escribir.wait(5)
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr(screenshots, "open", open_lento, raising=False)
+    writer = ScreenshotWriter(directorio=str(tmp_path), formato="jpeg")
+    convertido = writer.submit(b"\x89PNG datos", "captura")
+
+    # La escritura sigue bloqueada: el reporte solo esperó la conversión
+    assert writer.para_reporte(convertido, b"\x89PNG datos") == (b"JPEG JPEG", "image/jpeg", "jpg")
+    assert not os.path.exists(tmp_path / "captura.jpg")
+    escribir.set()
+    writer.shutdown()
+    assert os.path.exists(tmp_path / "captura.jpg")
+
+def test_si_la_conversion_falla_el_reporte_usa_el_png(tmp_path, monkeypatch):
+    class ImageRoto:
+        @staticmethod
+        def open(_):
+            raise OSError("imagen dañada")
+
+    monkeypatch.setattr(screenshots, "Image", ImageRoto)
+    writer = ScreenshotWriter(directorio=str(tmp_path), formato="webp")
+    convertido = writer.submit(b"\x89PNG datos", "captura")
+
+    assert writer.para_reporte(convertido, b"\x89PNG datos") == (b"\x89PNG datos", "image/png", "png")
+    writer.shutdown()
+    assert not os.path.exists(tmp_path / "captura.webp")
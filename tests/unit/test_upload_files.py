@@ -0,0 +1,46 @@
+import os
+import re
+import pytest
+from utils.upload_files import MB, UploadFileFactory
+
+def _verificar_pdf(ruta):
+    """Comprueba que startxref, la tabla xref y /Length apunten a donde dicen."""
+    with open(ruta, "rb") as file:
+        datos = file.read()
+    assert datos.startswith(b"%PDF-1.4\n")
+    assert datos.endswith(b"\n%%EOF\n")
+
+    inicio_xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", datos).group(1))
+    assert datos[inicio_xref:].startswith(b"xref\n0 5\n")
+
+    # Cada entrada de la tabla mide exactamente 20 bytes
+    tabla = datos[inicio_xref + len(b"xref\n0 5\n"):]
+    entradas = [tabla[i:i + 20] for i in range(0, 100, 20)]
+    assert all(entrada.endswith(b" \n") for entrada in entradas)
+    assert tabla[100:].startswith(b"trailer\n")
+    assert entradas[0] == b"0000000000 65535 f \n"
+    for numero, entrada in enumerate(entradas[1:], start=1):
+        offset, generacion, uso = entrada.split()
+        assert (generacion, uso) == (b"00000", b"n")
+        assert datos[int(offset):].startswith(b"%d 0 obj\n" % numero), f"Offset del objeto {numero}"
+
+    largo = int(re.search(rb"4 0 obj\n<< /Length (\d+) >>\nstream\n", datos).group(1))
+    inicio_stream = datos.index(b"stream\n") + len(b"stream\n")
+    assert datos[inicio_stream + largo:].startswith(b"\nendstream\nendobj\n")
+
+@pytest.mark.parametrize("tamano", [0, 1024, 9_999, 10_000, 1 * MB, 5 * MB + 1])
+def test_pdf_valido_con_el_tamano_pedido(tmp_path, tamano):
+    ruta = UploadFileFactory(tmp_path).crear("pdf", tamano)
+    _verificar_pdf(ruta)
+    if tamano:
+        assert os.path.getsize(ruta) == tamano
+    else:
+        assert os.path.getsize(ruta) > 0
+
+def test_cada_especificacion_se_crea_una_sola_vez(tmp_path):
+    fabrica = UploadFileFactory(tmp_path)
+    ruta = fabrica.crear("txt", 2048)
+    assert fabrica.crear("txt", 2048) == ruta
+    assert os.path.getsize(ruta) == 2048
+    with pytest.raises(ValueError):
+        fabrica.crear("docx")
@@ -0,0 +1,35 @@
+from utils.wait_policy import WaitPolicy
+
+class DriverFalso:
+    def __init__(self):
+        self.comandos = []
+        self.script_timeout = 30 # El valor por defecto de Selenium
+
+    def implicitly_wait(self, segundos):
+        self.comandos.append(segundos)
+
+    def set_script_timeout(self, segundos):
+        self.script_timeout = segundos
+
+def test_el_script_timeout_cubre_las_esperas_explicitas_largas():
+    driver = DriverFalso()
+    WaitPolicy(explicit=45).aplicar(driver)
+    assert driver.script_timeout > 45
+
+def test_las_esperas_anidadas_no_reencienden_la_implicita():
+    policy = WaitPolicy(implicit=10)
+    driver = DriverFalso()
+    policy.aplicar(driver)
+
+    with policy.sin_espera_implicita(driver):
+        policy.until(driver, lambda d: True)
+        assert driver.comandos == [10, 0]
+    assert driver.comandos == [10, 0, 10]
+
+def test_sin_espera_implicita_no_hay_comandos_extra():
+    policy = WaitPolicy(implicit=0)
+    driver = DriverFalso()
+    policy.aplicar(driver)
+
+    policy.until(driver, lambda d: True)
+    assert driver.comandos == [0]
@@ -0,0 +1,68 @@
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from utils.logger import Logger
+
+class APIClient:
+    """Cliente HTTP para los tests de API con pool de conexiones y keep-alive.
+
+    Todas las peticiones salen de una misma requests.Session, así que las
+    llamadas encadenadas reutilizan la conexión TCP/TLS. Cada petición queda
+    registrada con su latencia para adjuntarla al reporte del test.
+    """
+
+    def __init__(self, base_url, timeout=10, pool_size=10):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.latencias = []
+        self.logger = Logger.get_logger(__name__)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+    def url(self, path):
+        """Arma la URL completa a partir de un path relativo a base_url."""
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method, path, **kwargs):
+        """Ejecuta una petición con el timeout por defecto y registra su latencia."""
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+
+        inicio = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        latencia_ms = (time.perf_counter() - inicio) * 1000
+
+        self.latencias.append({
+            "metodo": method,
+            "url": url,
+            "status": response.status_code,
+            "ms": round(latencia_ms, 1)
+        })
+        self.logger.info("%s %s -> %s (%.1f ms)", method, url, response.status_code, latencia_ms)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def reiniciar_latencias(self):
+        """Descarta las latencias registradas (al iniciar cada test)."""
+        self.latencias = []
+
+    def close(self):
+        """Cierra las conexiones del pool."""
+        self.session.close()
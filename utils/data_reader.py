@@ -1,72 +1,129 @@
 import json
 import csv
 import os
+import re
+from collections import namedtuple
+from utils.impact_map import ImpactMap
+
+def _tipo_registro(columnas):
+    """Crea una clase de registro compacta (namedtuple) para las columnas de un CSV.
+
+    Los encabezados que no son identificadores válidos ("first name",
+    "e-mail") se normalizan para el acceso por atributo (r.first_name,
+    r.e_mail); por clave se accede con el nombre original (r["e-mail"]).
+    """
+    nombres = [re.sub(r"\W+", "_", columna).strip("_") for columna in columnas]
+    base = namedtuple("Registro", nombres, rename=True)
+    indices = {}
+    for i, columna in enumerate(columnas):
+        indices.setdefault(columna, i)
+    for i, nombre in enumerate(base._fields):
+        indices.setdefault(nombre, i)
+
+    class Registro(base):
+        """Fila de datos de prueba: acceso por atributo (r.email) o por clave (r['email'])."""
+        __slots__ = ()
+        _indices = indices
+
+        def __getitem__(self, key):
+            if isinstance(key, str):
+                try:
+                    return tuple.__getitem__(self, self._indices[key])
+                except KeyError:
+                    raise KeyError(key) from None
+            return super().__getitem__(key)
+
+        def get(self, key, default=None):
+            try:
+                return self[key]
+            except KeyError:
+                return default
+
+    return Registro
 
 class DataReader:
-    """Clase para leer datos de prueba desde archivos externos."""
+    """Clase para leer datos de prueba desde archivos externos.
+
+    Las lecturas se cachean por ruta y fecha de modificación, así que leer el
+    mismo archivo varias veces (por ejemplo en cada @pytest.mark.parametrize)
+    solo lo parsea una vez mientras no cambie.
+    """
+
+    _cache = {}
 
     @staticmethod
     def read_json(file_path):
-        """Lee datos desde un archivo JSON."""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"El archivo {file_path} no existe")
+        """Lee datos desde un archivo JSON (el resultado es compartido: no modificarlo)."""
+        return DataReader._cacheado(file_path, None, DataReader._parse_json)
 
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+    @staticmethod
+    def read_csv(file_path, tipos=None):
+        """Lee datos desde un archivo CSV y retorna una lista (cacheada) de registros.
+
+        tipos es un diccionario {columna: conversor}, por ejemplo {"edad": int};
+        las columnas no indicadas quedan como texto.
+        """
+        clave_tipos = tuple(sorted(tipos.items(), key=lambda t: t[0])) if tipos else None
+        return DataReader._cacheado(
+            file_path, clave_tipos, lambda ruta: list(DataReader.iter_csv(ruta, tipos))
+        )
 
     @staticmethod
-    def read_csv(file_path):
-        """Lee datos desde un archivo CSV y retorna una lista de diccionarios."""
+    def iter_csv(file_path, tipos=None):
+        """Recorre un CSV fila por fila sin cargarlo entero (para datasets grandes)."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"El archivo {file_path} no existe")
 
-        data = []
-        with open(file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                data.append(row)
-        return data
-import logging
-import os
-from datetime import datetime
-
-class Logger:
-    """Sistema de logging para registrar pasos clave durante la ejecución."""
+        ImpactMap.actual().usar_archivo(file_path)
+        tipos = tipos or {}
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            csv_reader = csv.reader(file)
+            columnas = next(csv_reader, None)
+            if columnas is None:
+                return
+            registro = _tipo_registro(columnas)
+            conversores = [tipos.get(columna) for columna in columnas]
+
+            for fila in csv_reader:
+                if not fila:
+                    continue
+                if len(fila) > len(columnas) and any(v.strip() for v in fila[len(columnas):]):
+                    raise ValueError(
+                        f"{file_path}, línea {csv_reader.line_num}: {len(fila)} valores para "
+                        f"{len(columnas)} columnas ({', '.join(columnas)})"
+                    )
+                # Como csv.DictReader: a las filas cortas les faltan valores (None)
+                fila = fila[:len(columnas)] + [None] * (len(columnas) - len(fila))
+                valores = [conv(v) if conv and v is not None else v for conv, v in zip(conversores, fila)]
+                yield registro(*valores)
 
     @staticmethod
-    def get_logger(name=__name__):
-        """Crea y configura un logger."""
-        # Crear directorio de logs si no existe
-        os.makedirs("reports/logs", exist_ok=True)
+    def id_column(columna):
+        """Devuelve una función de ids para parametrize basada en una columna clave."""
+        def ids(registro):
+            return str(registro[columna])
+        return ids
 
-        # Nombre del archivo con fecha
-        log_file = f"reports/logs/test_execution_{datetime.now().strftime('%Y-%m-%d')}.log"
-
-        # Configurar logger
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.INFO)
-
-        # Evitar duplicados
-        if not logger.handlers:
-            # Handler para archivo
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-
-            # Handler para consola
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-
-            # Formato
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+    @staticmethod
+    def _cacheado(file_path, variante, cargar):
+        """Devuelve el contenido cacheado de file_path o lo carga si cambió en disco."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"El archivo {file_path} no existe")
 
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
+        ImpactMap.actual().usar_archivo(file_path) # También en los aciertos de caché
+        estado = os.stat(file_path)
+        clave = (os.path.abspath(file_path), variante)
+        firma = (estado.st_mtime_ns, estado.st_size)
 
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+        en_cache = DataReader._cache.get(clave)
+        if en_cache and en_cache[0] == firma:
+            return en_cache[1]
 
-        return logger
+        data = cargar(file_path)
+        DataReader._cache[clave] = (firma, data)
+        return data
 
+    @staticmethod
+    def _parse_json(file_path):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
@@ -0,0 +1,79 @@
+from selenium.common.exceptions import WebDriverException
+from utils.logger import Logger
+
+class DeviceEmulation:
+    """Emulación de dispositivos en un navegador ya abierto, vía CDP.
+
+    Cambiar de dispositivo es un par de comandos CDP (métricas de pantalla,
+    user agent y touch) sobre el mismo Chrome, en lugar de abrir un
+    navegador con mobileEmulation por cada viewport.
+    """
+
+    # Dispositivos: viewport en px CSS, densidad de píxeles, user agent y plataforma
+    PERFILES = {
+        "pixel_5": {
+            "width": 412, "height": 915, "pixelRatio": 3.0, "mobile": True, "platform": "Android",
+            "userAgent": "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.91 Mobile Safari/537.36",
+        },
+        "galaxy_s8": {
+            "width": 360, "height": 740, "pixelRatio": 4.0, "mobile": True, "platform": "Android",
+            "userAgent": "Mozilla/5.0 (Linux; Android 7.0; SM-G950U) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/62.0.3202.84 Mobile Safari/537.36",
+        },
+        "iphone_12": {
+            "width": 390, "height": 844, "pixelRatio": 3.0, "mobile": True, "platform": "iPhone",
+            "userAgent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1",
+        },
+        "ipad_mini": {
+            "width": 768, "height": 1024, "pixelRatio": 2.0, "mobile": True, "platform": "iPad",
+            "userAgent": "Mozilla/5.0 (iPad; CPU OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1",
+        },
+        "ipad_pro": {
+            "width": 1024, "height": 1366, "pixelRatio": 2.0, "mobile": True, "platform": "iPad",
+            "userAgent": "Mozilla/5.0 (iPad; CPU OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1",
+        },
+    }
+
+    @staticmethod
+    def perfil(nombre):
+        """Devuelve el perfil de un dispositivo o falla con las opciones válidas."""
+        if nombre not in DeviceEmulation.PERFILES:
+            raise ValueError(
+                f"Dispositivo desconocido: {nombre} (opciones: {', '.join(DeviceEmulation.PERFILES)})"
+            )
+        return DeviceEmulation.PERFILES[nombre]
+
+    @staticmethod
+    def aplicar(driver, nombre):
+        """Hace que el navegador se comporte como el dispositivo nombre desde la próxima navegación."""
+        perfil = DeviceEmulation.perfil(nombre)
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": perfil["width"],
+            "height": perfil["height"],
+            "deviceScaleFactor": perfil["pixelRatio"],
+            "mobile": perfil["mobile"],
+        })
+        driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {
+            "userAgent": perfil["userAgent"], "platform": perfil["platform"]
+        })
+        driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {
+            "enabled": perfil["mobile"], "maxTouchPoints": 5
+        })
+        Logger.get_logger(__name__).info(
+            "Emulando %s (%sx%s @%sx)", nombre, perfil["width"], perfil["height"], perfil["pixelRatio"]
+        )
+
+    @staticmethod
+    def restablecer(driver):
+        """Quita la emulación (vuelve al viewport y user agent propios del navegador).
+
+        Devuelve False si el navegador no respondió (conviene descartarlo).
+        """
+        try:
+            driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+            driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": False})
+            user_agent = driver.execute_cdp_cmd("Browser.getVersion", {})["userAgent"]
+            driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": user_agent})
+            return True
+        except WebDriverException as e:
+            Logger.get_logger(__name__).warning("No se pudo quitar la emulación de dispositivo: %s", e)
+            return False
@@ -0,0 +1,90 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.common.exceptions import WebDriverException
+from utils.logger import Logger
+from utils.wait_policy import WaitPolicy
+
+class DriverFactory:
+    """Crea navegadores Chrome de escritorio según el perfil (full/lean).
+
+    Los dispositivos móviles se emulan vía CDP sobre estos mismos navegadores
+    (ver DeviceEmulation), sin abrir un Chrome distinto.
+
+    El perfil "full" es el navegador visible de siempre. El perfil "lean" corre
+    headless, sin extensiones, GPU ni throttling de fondo, y bloquea por CDP
+    los recursos que los tests no verifican (imágenes, fuentes, video,
+    analytics).
+
+    Con capturar_red=True el navegador guarda el performance log de Chrome
+    (eventos Network.*), que usa NetworkCapture.
+    """
+
+    PERFILES = ("full", "lean")
+
+    LEAN_ARGS = [
+        "--headless=new",
+        "--window-size=1920,1080",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+    ]
+
+    # Patrones de URL que bloquea cada tipo de recurso en el perfil lean
+    PATRONES_POR_TIPO = {
+        "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+        "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+        "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a"],
+        "stylesheet": ["*.css"],
+        "analytics": [
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*hotjar.com*", "*facebook.net*", "*clarity.ms*",
+        ],
+    }
+
+    @staticmethod
+    def crear(driver_path, perfil="full", bloqueos=None, capturar_red=False):
+        """Crea un navegador del perfil indicado con la política de esperas vigente."""
+        if perfil not in DriverFactory.PERFILES:
+            raise ValueError(f"Perfil de navegador desconocido: {perfil}")
+
+        options = webdriver.ChromeOptions()
+        options.add_argument("--start-maximized") # Abrir pantalla completa
+        options.add_argument("--disable-popup-blocking")
+        options.add_argument("--disable-notifications")
+
+        if perfil == "lean":
+            for arg in DriverFactory.LEAN_ARGS:
+                options.add_argument(arg)
+
+        if capturar_red:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        # La ruta del driver ya viene resuelta (y cacheada) por DriverResolver
+        driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        WaitPolicy.actual().aplicar(driver) # Espera implícita según la política vigente
+
+        if perfil == "lean" and bloqueos:
+            DriverFactory._bloquear_urls(driver, bloqueos)
+        return driver
+
+    @staticmethod
+    def patrones_bloqueados(tipos, urls=()):
+        """Expande tipos de recurso y patrones sueltos en la lista para Network.setBlockedURLs."""
+        patrones = []
+        for tipo in tipos:
+            if tipo not in DriverFactory.PATRONES_POR_TIPO:
+                raise ValueError(f"Tipo de recurso desconocido para bloquear: {tipo}")
+            patrones.extend(DriverFactory.PATRONES_POR_TIPO[tipo])
+        patrones.extend(urls)
+        return patrones
+
+    @staticmethod
+    def _bloquear_urls(driver, patrones):
+        """Activa el bloqueo de URLs vía CDP (Network.setBlockedURLs)."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patrones)})
+        except WebDriverException as e:
+            Logger.get_logger(__name__).warning("No se pudo activar el bloqueo de recursos: %s", e)
@@ -0,0 +1,126 @@
+import threading
+from selenium.common.exceptions import WebDriverException
+from utils.logger import Logger
+
+class DriverPool:
+    """Pool de navegadores reutilizables durante una sesión (o un worker de xdist).
+
+    Entrega drivers "tibios" en lugar de abrir un Chrome nuevo por test. Entre un
+    test y otro limpia cookies, storage y pestañas extra; antes de entregar un
+    driver verifica que siga respondiendo, y lo reemplaza después de
+    ``max_usos`` tests o si se cayó.
+    """
+
+    def __init__(self, factory, max_usos=20, nombre="desktop", on_discard=None, on_release=None):
+        self.factory = factory
+        self.max_usos = max_usos
+        self.nombre = nombre
+        self.on_discard = on_discard
+        self.on_release = on_release
+        self._libres = []
+        self._usos = {}
+        self._lock = threading.Lock()
+        self.logger = Logger.get_logger(__name__)
+
+    def acquire(self):
+        """Devuelve un driver sano del pool, creando uno nuevo si no hay disponibles."""
+        while True:
+            with self._lock:
+                driver = self._libres.pop() if self._libres else None
+            if driver is None:
+                break
+            if self._is_healthy(driver):
+                self.logger.info("[%s] Reutilizando driver (usos: %s)", self.nombre, self._usos[driver])
+                return driver
+            self.logger.warning("[%s] Driver no responde, se reemplaza", self.nombre)
+            self._discard(driver)
+
+        driver = self.factory()
+        with self._lock:
+            self._usos[driver] = 0
+        self.logger.info("[%s] Nuevo driver creado", self.nombre)
+        return driver
+
+    def release(self, driver, descartar=False):
+        """Devuelve un driver al pool, o lo descarta si llegó al límite de usos o falló."""
+        with self._lock:
+            self._usos[driver] = self._usos.get(driver, 0) + 1
+            usos = self._usos[driver]
+
+        if descartar or usos >= self.max_usos:
+            self.logger.info("[%s] Reciclando driver tras %s usos", self.nombre, usos)
+            self._discard(driver)
+            return
+
+        if not self._reset(driver):
+            self.logger.warning("[%s] No se pudo limpiar el driver, se descarta", self.nombre)
+            self._discard(driver)
+            return
+
+        with self._lock:
+            self._libres.append(driver)
+        if self.on_release:
+            self.on_release()
+
+    def tiene_libres(self):
+        """Indica si hay drivers esperando en el pool."""
+        return bool(self._libres)
+
+    def liberar_inactivos(self):
+        """Cierra los drivers que esperan en el pool (libera memoria y slots de navegador)."""
+        with self._lock:
+            drivers = list(self._libres)
+            self._libres.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def shutdown(self):
+        """Cierra todos los navegadores creados por el pool."""
+        with self._lock:
+            drivers = list(self._usos)
+            self._libres.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+    def _is_healthy(self, driver):
+        """Verifica que el navegador siga vivo y con al menos una ventana."""
+        try:
+            return driver.execute_script("return 1;") == 1 and len(driver.window_handles) > 0
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        """Deja el navegador como recién abierto: una pestaña, sin cookies ni storage."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+            try:
+                # Chrome permite borrar las cookies de todos los dominios vía CDP
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (AttributeError, WebDriverException):
+                pass
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        """Cierra un driver y lo quita del registro del pool."""
+        with self._lock:
+            self._usos.pop(driver, None)
+            if driver in self._libres:
+                self._libres.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        if self.on_discard:
+            self.on_discard(driver)
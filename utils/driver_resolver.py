@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+from utils.logger import Logger
+
+class DriverResolver:
+    """Resuelve la ruta del binario de chromedriver una sola vez por ejecución.
+
+    La ruta resuelta se guarda en un caché local indexado por la versión de
+    Chrome instalada, de modo que las ejecuciones siguientes no consultan la
+    red. En modo offline solo se usa un chromedriver que ya esté en el PATH.
+    """
+
+    CACHE_FILE = ".driver_cache/chromedriver.json"
+    ENV_VAR = "CHROMEDRIVER_PATH"
+
+    @staticmethod
+    def detectar_version_chrome():
+        """Devuelve la versión de Chrome instalada, o None si no se puede detectar."""
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception:
+            return None
+
+    @staticmethod
+    def resolve(offline=False, cache_file=CACHE_FILE):
+        """Devuelve la ruta de chromedriver, usando el caché siempre que sea posible."""
+        logger = Logger.get_logger(__name__)
+
+        # 1. Ruta fijada explícitamente por variable de entorno
+        ruta_env = os.environ.get(DriverResolver.ENV_VAR)
+        if ruta_env and os.path.exists(ruta_env):
+            logger.info("chromedriver tomado de %s: %s", DriverResolver.ENV_VAR, ruta_env)
+            return ruta_env
+
+        # 2. Modo offline: solo se acepta un binario que ya esté en el PATH
+        if offline:
+            ruta = shutil.which("chromedriver")
+            if not ruta:
+                raise RuntimeError(
+                    "Modo offline: no se encontró 'chromedriver' en el PATH "
+                    f"(o definí {DriverResolver.ENV_VAR})"
+                )
+            logger.info("chromedriver (offline) encontrado en: %s", ruta)
+            return ruta
+
+        # 3. Caché local indexado por versión de Chrome
+        version = DriverResolver.detectar_version_chrome()
+        cache = DriverResolver._leer_cache(cache_file)
+        ruta = cache.get(version) if version else None
+        if ruta and os.path.exists(ruta):
+            logger.info("chromedriver en caché para Chrome %s: %s", version, ruta)
+            return ruta
+
+        # 4. Descarga con webdriver-manager (única consulta de red de la ejecución)
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            ruta = ChromeDriverManager().install()
+        except Exception as e:
+            ruta = shutil.which("chromedriver")
+            if not ruta:
+                raise
+            logger.warning("webdriver-manager falló (%s), se usa chromedriver del PATH: %s", e, ruta)
+            return ruta
+
+        if version:
+            cache[version] = ruta
+            DriverResolver._guardar_cache(cache_file, cache)
+        logger.info("chromedriver resuelto para Chrome %s: %s", version, ruta)
+        return ruta
+
+    @staticmethod
+    def _leer_cache(cache_file):
+        """Lee el caché de rutas; un archivo inexistente o dañado equivale a vacío."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _guardar_cache(cache_file, cache):
+        """Escribe el caché de forma atómica (seguro con varios procesos)."""
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(cache, file, indent=2)
+        os.replace(tmp_file, cache_file)
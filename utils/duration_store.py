@@ -0,0 +1,86 @@
+import json
+import os
+import statistics
+from datetime import datetime
+
+class DurationStore:
+    """Historial local de duración y resultado de cada test (JSONL en reports/).
+
+    Cada línea es una ejecución de un test: {"test", "duracion_s",
+    "resultado", "fecha"}. Se conservan las últimas MAX_POR_TEST ejecuciones
+    de cada test, así el archivo no crece sin límite y la estimación sigue
+    los cambios recientes.
+    """
+
+    ARCHIVO = "reports/test_durations.jsonl"
+    MAX_POR_TEST = 10
+
+    _actual = None
+
+    def __init__(self):
+        self.duraciones = {}
+        self.resultados = {}
+
+    @classmethod
+    def actual(cls):
+        """Devuelve el registro de la ejecución en curso."""
+        if cls._actual is None:
+            cls._actual = cls()
+        return cls._actual
+
+    def registrar(self, report):
+        """Acumula la duración de una fase (setup/call/teardown) de un test."""
+        self.duraciones[report.nodeid] = self.duraciones.get(report.nodeid, 0.0) + report.duration
+        if report.when == "call" or report.outcome != "passed":
+            self.resultados.setdefault(report.nodeid, report.outcome)
+
+    def guardar(self, ruta=ARCHIVO):
+        """Agrega las ejecuciones de esta corrida al historial (los tests omitidos no se guardan)."""
+        fecha = datetime.now().isoformat(timespec="seconds")
+        nuevas = [
+            {"test": nodeid, "duracion_s": round(duracion, 3),
+             "resultado": self.resultados.get(nodeid, "passed"), "fecha": fecha}
+            for nodeid, duracion in self.duraciones.items()
+            if self.resultados.get(nodeid) != "skipped"
+        ]
+        if not nuevas:
+            return
+
+        por_test = {}
+        for registro in DurationStore.cargar(ruta) + nuevas:
+            por_test.setdefault(registro["test"], []).append(registro)
+
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as file:
+            for registros in por_test.values():
+                for registro in registros[-DurationStore.MAX_POR_TEST:]:
+                    file.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        os.replace(temporal, ruta)
+
+    @staticmethod
+    def cargar(ruta=ARCHIVO):
+        """Lee todas las ejecuciones del historial ([] si no existe; ignora líneas dañadas)."""
+        if not os.path.exists(ruta):
+            return []
+        registros = []
+        with open(ruta, "r", encoding="utf-8") as file:
+            for linea in file:
+                try:
+                    registro = json.loads(linea)
+                except ValueError:
+                    continue
+                # Una línea cortada puede seguir siendo JSON válido pero sin los campos
+                if isinstance(registro, dict) and "test" in registro and isinstance(
+                    registro.get("duracion_s"), (int, float)
+                ):
+                    registros.append(registro)
+        return registros
+
+    @staticmethod
+    def estimaciones(ruta=ARCHIVO, ultimas=5):
+        """Duración esperada de cada test: mediana de sus últimas ejecuciones."""
+        por_test = {}
+        for registro in DurationStore.cargar(ruta):
+            por_test.setdefault(registro["test"], []).append(registro["duracion_s"])
+        return {test: statistics.median(valores[-ultimas:]) for test, valores in por_test.items()}
@@ -0,0 +1,230 @@
+import glob
+import inspect
+import json
+import os
+import re
+import subprocess
+
+# Línea de un diff que solo (re)define un locator de page object: NOMBRE = (...)
+_LINEA_LOCATOR = re.compile(r"^\s*([A-Z][A-Z0-9_]*)\s*=")
+
+# Cambios en estos archivos pueden afectar a cualquier test: se corre todo
+_GLOBALES = ("tests/conftest.py", "conftest.py", "pytest.ini", "requirements.txt", "utils/")
+
+class ImpactMap:
+    """Mapa de dependencias de cada test para correr solo los afectados por un cambio.
+
+    Durante la ejecución registra qué módulos de page objects instancia cada
+    test, qué locators usa y qué archivos de datos lee (los leídos al importar
+    el módulo de test, por ejemplo en un parametrize, se asignan a todos sus
+    tests). Al terminar lo guarda en ARCHIVO; en la siguiente ejecución
+    seleccionar() cruza ese mapa con los archivos modificados en git.
+    """
+
+    ARCHIVO = "reports/impact_map.json"
+
+    _actual = None
+
+    def __init__(self):
+        self.raiz = os.getcwd()
+        self.contexto = None
+        self.usos = {}
+        self.omitidos = set()
+        self._archivos_por_clase = {}
+        self._locators_por_clase = {}
+
+    @classmethod
+    def actual(cls):
+        """Devuelve el registrador del proceso."""
+        if cls._actual is None:
+            cls._actual = cls()
+        return cls._actual
+
+    def iniciar_test(self, nodeid):
+        """Asocia las dependencias que se registren a partir de ahora con el test nodeid."""
+        self.contexto = nodeid
+        self.usos.setdefault(nodeid, {"modulos": set(), "locators": set(), "datos": set()})
+
+    def usar(self, tipo, valor):
+        """Registra una dependencia (modulos, locators o datos) del test o módulo en curso."""
+        if self.contexto is None:
+            return
+        usos = self.usos.setdefault(self.contexto, {"modulos": set(), "locators": set(), "datos": set()})
+        usos[tipo].add(valor)
+
+    def usar_archivo(self, ruta):
+        """Registra la lectura de un archivo de datos."""
+        self.usar("datos", self._relativa(ruta))
+
+    def usar_pagina(self, clase):
+        """Registra los módulos de un page object y de sus clases base."""
+        archivos = self._archivos_por_clase.get(clase)
+        if archivos is None:
+            archivos = self._archivos_por_clase[clase] = [
+                self._relativa(inspect.getfile(c)) for c in clase.__mro__ if c.__module__.startswith("pages.")
+            ]
+        for archivo in archivos:
+            self.usar("modulos", archivo)
+
+    def usar_locator(self, clase, locator):
+        """Registra un locator declarado en el page object como 'archivo::NOMBRE'."""
+        if self.contexto is None:
+            return
+        nombres = self._locators_por_clase.get(clase)
+        if nombres is None:
+            nombres = self._locators_por_clase[clase] = {}
+            for c in reversed(clase.__mro__):
+                if not c.__module__.startswith("pages."):
+                    continue
+                archivo = self._relativa(inspect.getfile(c))
+                for nombre, valor in vars(c).items():
+                    if nombre.isupper() and isinstance(valor, tuple):
+                        nombres[valor] = f"{archivo}::{nombre}"
+        try:
+            nombre = nombres.get(locator)
+        except TypeError: # locator no hasheable
+            return
+        if nombre:
+            self.usar("locators", nombre)
+
+    def exportar(self, ruta):
+        """Agrega al mapa en ruta las dependencias de los tests ejecutados (con las de su módulo).
+
+        Los tests omitidos (skip) no se guardan: no se sabe qué usarían.
+        Devuelve False si no se ejecutó ningún test.
+        """
+        nodeids = [clave for clave in self.usos if "::" in clave and clave not in self.omitidos]
+        if not nodeids:
+            return False
+        tests = {}
+        for nodeid in nodeids:
+            dependencias = {"modulos": set(), "locators": set(), "datos": set()}
+            for clave in (nodeid.split("::")[0], nodeid):
+                for tipo, valores in self.usos.get(clave, {}).items():
+                    dependencias[tipo] |= valores
+            tests[nodeid] = {tipo: sorted(valores) for tipo, valores in dependencias.items()}
+        ImpactMap._escribir(ruta, tests)
+        return True
+
+    @staticmethod
+    def unir_workers(ruta=ARCHIVO):
+        """Une en ruta los mapas parciales de cada worker de xdist (<ruta>_gw*.json) y los borra.
+
+        Devuelve False si no hubo workers de xdist.
+        """
+        base, ext = os.path.splitext(ruta)
+        archivos = sorted(glob.glob(f"{base}_gw*{ext}"))
+        tests = {}
+        for archivo in archivos:
+            tests.update(ImpactMap.cargar(archivo))
+            os.remove(archivo)
+        if tests:
+            ImpactMap._escribir(ruta, tests)
+        return bool(archivos)
+
+    @staticmethod
+    def cargar(ruta=ARCHIVO):
+        """Lee el mapa {nodeid: {"modulos", "locators", "datos"}} ({} si no existe)."""
+        try:
+            with open(ruta, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def cambios(raiz, base="HEAD"):
+        """Archivos modificados respecto de base (incluye staged, unstaged y no versionados).
+
+        Devuelve rutas relativas a raiz, o None si git no está disponible.
+        """
+        try:
+            top = ImpactMap._git(raiz, "rev-parse", "--show-toplevel")[0]
+            archivos = ImpactMap._git(raiz, "diff", "--name-only", base)
+            archivos += ImpactMap._git(raiz, "ls-files", "--others", "--exclude-standard", "--full-name")
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return {
+            os.path.relpath(os.path.join(top, archivo), raiz).replace(os.sep, "/") for archivo in archivos
+        }
+
+    @staticmethod
+    def locators_cambiados(raiz, archivo, base="HEAD"):
+        """Nombres de locators tocados en archivo, o None si el diff cambia algo más que locators."""
+        try:
+            diff = ImpactMap._git(raiz, "diff", "-U0", base, "--", archivo)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        nombres = set()
+        for linea in diff:
+            if linea.startswith(("+++", "---")) or not linea.startswith(("+", "-")):
+                continue
+            contenido = linea[1:].strip()
+            if not contenido or contenido.startswith("#"):
+                continue
+            coincidencia = _LINEA_LOCATOR.match(contenido)
+            if not coincidencia:
+                return None
+            nombres.add(f"{archivo}::{coincidencia.group(1)}")
+        return nombres or None
+
+    @staticmethod
+    def seleccionar(nodeids, mapa, cambios, locators_cambiados, siempre=()):
+        """Devuelve los nodeids afectados por los cambios.
+
+        Se eligen los tests de siempre (smoke), los que no están en el mapa,
+        aquellos cuyo archivo de test cambió y los que dependen de un módulo,
+        locator o archivo de datos modificado. locators_cambiados es
+        {modulo: nombres}: si un módulo solo cambió en sus locators y todos
+        ellos aparecen en el mapa, se eligen los tests que usan esos locators
+        y no todos los que usan el módulo (un locator que ningún test registró
+        se usa directo con el driver, así que se vuelve al criterio por módulo).
+        Un cambio en conftest, utils/, pytest.ini o requirements.txt elige todo.
+        """
+        if any(c == g or (g.endswith("/") and c.startswith(g)) for c in cambios for g in _GLOBALES):
+            return list(nodeids)
+
+        conocidos = {l for deps in mapa.values() for l in deps.get("locators", [])}
+        locators_cambiados = {
+            modulo: nombres for modulo, nombres in locators_cambiados.items() if nombres <= conocidos
+        }
+
+        afectados = []
+        for nodeid in nodeids:
+            deps = mapa.get(nodeid)
+            elegido = (
+                nodeid in siempre
+                or deps is None
+                or nodeid.split("::")[0] in cambios
+                or any(d in cambios for d in deps.get("datos", []))
+                or any(
+                    m in cambios and m not in locators_cambiados for m in deps.get("modulos", [])
+                )
+                or any(
+                    l in nombres for nombres in locators_cambiados.values() for l in deps.get("locators", [])
+                )
+            )
+            if elegido:
+                afectados.append(nodeid)
+        return afectados
+
+    def _relativa(self, ruta):
+        return os.path.relpath(os.path.abspath(ruta), self.raiz).replace(os.sep, "/")
+
+    @staticmethod
+    def _git(raiz, *args):
+        salida = subprocess.run(
+            ["git", *args], cwd=raiz, capture_output=True, text=True, check=True
+        ).stdout
+        return [linea for linea in salida.splitlines() if linea]
+
+    @staticmethod
+    def _escribir(ruta, tests):
+        """Actualiza el mapa en ruta con tests (los tests que no se ejecutaron conservan su entrada)."""
+        mapa = ImpactMap.cargar(ruta)
+        mapa.update(tests)
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as file:
+            json.dump(mapa, file, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(temporal, ruta)
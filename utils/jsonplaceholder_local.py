@@ -0,0 +1,137 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Usuarios con la misma forma que los de JSONPlaceholder
+_USUARIOS = [
+    (1, "Leanne Graham", "Bret", "Sincere@april.biz"),
+    (2, "Ervin Howell", "Antonette", "Shanna@melissa.tv"),
+    (3, "Clementine Bauch", "Samantha", "Nathan@yesenia.net"),
+    (4, "Patricia Lebsack", "Karianne", "Julianne.OConner@kory.org"),
+    (5, "Chelsey Dietrich", "Kamren", "Lucio_Hettinger@annie.ca"),
+    (6, "Mrs. Dennis Schulist", "Leopoldo_Corkery", "Karley_Dach@jasper.info"),
+    (7, "Kurtis Weissnat", "Elwyn.Skiles", "Telly.Hoeger@billy.biz"),
+    (8, "Nicholas Runolfsdottir V", "Maxime_Nienow", "Sherwood@rosamond.me"),
+    (9, "Glenna Reichert", "Delphine", "Chaim_McDermott@dana.io"),
+    (10, "Clementina DuBuque", "Moriah.Stanton", "Rey.Padberg@karina.biz"),
+]
+
+class _Datos:
+    """Datos en memoria del servidor, con las respuestas de lista ya serializadas."""
+
+    def __init__(self):
+        self.users = {
+            uid: {"id": uid, "name": name, "username": username, "email": email}
+            for uid, name, username, email in _USUARIOS
+        }
+        self.posts = {
+            pid: {
+                "userId": (pid - 1) // 10 + 1,
+                "id": pid,
+                "title": f"Post de prueba {pid}",
+                "body": f"Contenido del post {pid} servido por el JSONPlaceholder local"
+            }
+            for pid in range(1, 101)
+        }
+        self.listas = {
+            "users": json.dumps(list(self.users.values())).encode("utf-8"),
+            "posts": json.dumps(list(self.posts.values())).encode("utf-8"),
+        }
+
+class _Handler(BaseHTTPRequestHandler):
+    """Reproduce /users, /users/{id}, /posts y /posts/{id} como JSONPlaceholder."""
+
+    protocol_version = "HTTP/1.1" # Keep-alive, igual que el servicio real
+    disable_nagle_algorithm = True # Headers y cuerpo van en escrituras separadas
+    RUTA = re.compile(r"^/(users|posts)(?:/(\d+))?/?$")
+
+    def do_GET(self):
+        recurso, item_id = self._ruta()
+        if recurso is None:
+            return self._responder(404, b"{}")
+        if item_id is None:
+            return self._responder(200, self.server.datos.listas[recurso])
+        item = getattr(self.server.datos, recurso).get(item_id)
+        if item is None:
+            return self._responder(404, b"{}")
+        return self._responder(200, json.dumps(item).encode("utf-8"))
+
+    def do_POST(self):
+        recurso, item_id = self._ruta()
+        if recurso is None or item_id is not None:
+            return self._responder(404, b"{}")
+        cuerpo = self._leer_json()
+        if not isinstance(cuerpo, dict):
+            return self._responder(400, b"{}")
+        # Como JSONPlaceholder: responde 201 con el id siguiente, sin persistir
+        creado = dict(cuerpo, id=len(getattr(self.server.datos, recurso)) + 1)
+        return self._responder(201, json.dumps(creado).encode("utf-8"))
+
+    def do_PUT(self):
+        recurso, item_id = self._ruta()
+        if recurso is None or item_id not in getattr(self.server.datos, recurso, {}):
+            return self._responder(500, b"{}")
+        cuerpo = self._leer_json()
+        if not isinstance(cuerpo, dict):
+            return self._responder(400, b"{}")
+        actualizado = dict(cuerpo, id=item_id)
+        return self._responder(200, json.dumps(actualizado).encode("utf-8"))
+
+    def do_DELETE(self):
+        recurso, _ = self._ruta()
+        if recurso is None:
+            return self._responder(404, b"{}")
+        return self._responder(200, b"{}")
+
+    def _ruta(self):
+        match = self.RUTA.match(self.path.split("?", 1)[0])
+        if not match:
+            return None, None
+        return match.group(1), int(match.group(2)) if match.group(2) else None
+
+    def _leer_json(self):
+        """Cuerpo JSON de la petición ({} si falta o no se puede parsear; puede no ser un objeto)."""
+        largo = int(self.headers.get("Content-Length") or 0)
+        if not largo:
+            return {}
+        try:
+            return json.loads(self.rfile.read(largo))
+        except ValueError:
+            return {}
+
+    def _responder(self, status, cuerpo):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        # Sin log por petición: el servidor también se usa como blanco de carga
+        pass
+
+class JSONPlaceholderLocal:
+    """Servidor local en proceso que reemplaza a JSONPlaceholder en ejecuciones offline."""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.datos = _Datos()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Arranca el servidor en un hilo de fondo."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detiene el servidor y libera el puerto."""
+        self._server.shutdown()
+        self._server.server_close()
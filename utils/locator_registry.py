@@ -0,0 +1,61 @@
+import threading
+from collections import namedtuple
+from selenium.webdriver.common.by import By
+
+# Locator por texto: texto visible buscado y, opcionalmente, el id de la sección que lo contiene
+TextLocator = namedtuple("TextLocator", ["texto", "scope"])
+
+class LocatorRegistry:
+    """Registro de locators por texto de los page objects.
+
+    Los page objects declaran sus locators por texto una sola vez con
+    LocatorRegistry.texto(...). El registro los interna (mismo texto y
+    sección, misma instancia) y los compila una única vez a un XPath
+    limitado a la sección y con el texto escapado, así un nombre con
+    comillas no rompe la expresión ni permite inyectar XPath. Las
+    consultas repetidas de BasePage no usan este XPath sino el índice de
+    textos que se arma en el navegador una vez por carga de página.
+    """
+
+    _registrados = {}
+    _compilados = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def texto(texto, scope=None):
+        """Declara (o recupera) el locator de un texto, opcionalmente dentro del elemento con id scope."""
+        clave = (texto, scope)
+        with LocatorRegistry._lock:
+            locator = LocatorRegistry._registrados.get(clave)
+            if locator is None:
+                locator = LocatorRegistry._registrados[clave] = TextLocator(texto, scope)
+        return locator
+
+    @staticmethod
+    def xpath_literal(valor):
+        """Convierte valor en un literal XPath 1.0 válido aunque tenga comillas simples y dobles."""
+        if "'" not in valor:
+            return f"'{valor}'"
+        if '"' not in valor:
+            return f'"{valor}"'
+        partes = [f"'{parte}'" for parte in valor.split("'")]
+        return "concat(" + ", \"'\", ".join(partes) + ")"
+
+    @staticmethod
+    def compilar(locator):
+        """Devuelve el locator de Selenium (By.XPATH, ...) de un TextLocator, compilado una sola vez."""
+        with LocatorRegistry._lock:
+            compilado = LocatorRegistry._compilados.get(locator)
+            if compilado is None:
+                raiz = f"//*[@id={LocatorRegistry.xpath_literal(locator.scope)}]" if locator.scope else ""
+                texto = LocatorRegistry.xpath_literal(locator.texto)
+                compilado = (By.XPATH, f"{raiz}//*[text()[contains(., {texto})]]")
+                LocatorRegistry._compilados[locator] = compilado
+        return compilado
+
+    @staticmethod
+    def resolver(locator):
+        """Traduce un TextLocator a un locator de Selenium; cualquier otro locator se devuelve igual."""
+        if isinstance(locator, TextLocator):
+            return LocatorRegistry.compilar(locator)
+        return locator
@@ -0,0 +1,258 @@
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+
+MB = 1024 * 1024
+
+# Un registro de log empieza con la fecha; las líneas siguientes (tracebacks) le pertenecen
+_INICIO_REGISTRO = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+class LogSegments:
+    """Archivo de log que rota por tamaño y lleva un índice de qué bytes escribió cada test.
+
+    El archivo activo es <base>.log. Al pasar max_bytes se comprime como
+    <base>.NNN.log.gz y se empieza uno nuevo. El gzip se arma con un miembro
+    por tramo de test, así se puede descomprimir solo el tramo de un test
+    sin tocar el resto del segmento.
+
+    El índice (<base>.idx.jsonl) tiene dos tipos de línea:
+        {"test", "ejecucion", "segmento", "inicio", "fin"}: bytes del test en el segmento (sin comprimir).
+        {"segmento", "miembros": [[inicio, inicio_gz, fin_gz], ...]}: dónde quedó cada tramo al comprimir.
+
+    El archivo es del día y lo comparten varias ejecuciones: cada tramo lleva
+    el id de la ejecución que lo escribió, así el log de un test no mezcla
+    corridas anteriores.
+    """
+
+    def __init__(self, ruta, max_bytes=10 * MB, ejecucion=None):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.ejecucion = ejecucion or uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._base = os.path.splitext(ruta)[0]
+        self._indice = open(LogIndex.ruta_indice(ruta), "a", encoding="utf-8", buffering=1)
+
+        # El segmento activo continúa la numeración de los ya comprimidos (varias ejecuciones en el día)
+        nombre = re.escape(os.path.basename(self._base))
+        numeros = [
+            int(m.group(1)) for m in
+            (re.fullmatch(nombre + r"\.(\d+)\.log\.gz", a) for a in os.listdir(os.path.dirname(ruta) or "."))
+            if m
+        ]
+        self._numero = max(numeros, default=0) + 1
+        self._abrir()
+
+        # Los tramos de una ejecución anterior sobre el mismo archivo siguen siendo cortes del segmento
+        for registro in LogIndex.leer(ruta):
+            if registro.get("segmento") == self.segmento and "test" in registro:
+                self._cortes.update((registro["inicio"], registro["fin"]))
+
+    @property
+    def segmento(self):
+        """Nombre que va a tener el segmento activo una vez comprimido."""
+        return f"{os.path.basename(self._base)}.{self._numero:03d}.log.gz"
+
+    def escribir(self, texto, test=None):
+        """Agrega un registro al log asociándolo al test en curso (None = fuera de un test)."""
+        datos = texto.encode("utf-8")
+        with self._lock:
+            if test != self._test or self._inicio is None:
+                self._cerrar_tramo()
+                self._test, self._inicio = test, self._file.tell()
+                self._cortes.add(self._inicio)
+            self._file.write(datos)
+            if self.max_bytes and self._file.tell() >= self.max_bytes:
+                self._rotar()
+
+    def flush(self):
+        """Registra en el índice el tramo en curso y vuelca el segmento activo al sistema operativo.
+
+        Si el mismo test sigue escribiendo, su próximo registro abre otro tramo.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._cerrar_tramo()
+            self._file.flush()
+
+    def tramo(self, test):
+        """Log de un test, incluido lo que lleva escrito si todavía está en curso."""
+        with self._lock:
+            self._file.flush()
+            texto = LogIndex.extraer(self.ruta, test, self.ejecucion)
+            if test is not None and test == self._test and self._inicio is not None:
+                with open(self.ruta, "rb") as file:
+                    file.seek(self._inicio)
+                    texto += file.read(self._file.tell() - self._inicio).decode("utf-8", errors="replace")
+            return texto
+
+    def importar(self, ruta):
+        """Suma al índice los segmentos ya comprimidos de otro log (los de un worker de xdist en esta ejecución)."""
+        with self._lock:
+            for registro in LogIndex.leer(ruta):
+                if registro.get("ejecucion", self.ejecucion) != self.ejecucion:
+                    continue
+                if os.path.exists(os.path.join(os.path.dirname(ruta) or ".", registro["segmento"])):
+                    self._indice.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+    def cerrar(self):
+        """Cierra el tramo en curso y los archivos (sin rotar)."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._cerrar_tramo()
+            self._file.close()
+            self._indice.close()
+
+    def _abrir(self):
+        self._file = open(self.ruta, "ab")
+        self._test = None
+        self._inicio = None
+        self._cortes = {0, self._file.tell()}
+
+    def _cerrar_tramo(self):
+        """Registra en el índice el tramo del test que se estaba escribiendo."""
+        if self._test is not None and self._inicio is not None and self._file.tell() > self._inicio:
+            self._indice.write(json.dumps({
+                "test": self._test, "ejecucion": self.ejecucion, "segmento": self.segmento,
+                "inicio": self._inicio, "fin": self._file.tell()
+            }, ensure_ascii=False) + "\n")
+        self._inicio = None
+
+    def _rotar(self):
+        """Comprime el segmento activo (un miembro gzip por tramo) y abre uno nuevo."""
+        self._cerrar_tramo()
+        fin = self._file.tell()
+        self._file.close()
+
+        destino = os.path.join(os.path.dirname(self.ruta) or ".", self.segmento)
+        cortes = sorted(c for c in self._cortes if c < fin) + [fin]
+        miembros = []
+        with open(self.ruta, "rb") as origen, open(f"{destino}.tmp", "wb") as comprimido:
+            for inicio, final in zip(cortes, cortes[1:]):
+                inicio_gz = comprimido.tell()
+                comprimido.write(gzip.compress(origen.read(final - inicio), compresslevel=6))
+                miembros.append([inicio, inicio_gz, comprimido.tell()])
+        os.replace(f"{destino}.tmp", destino)
+        self._indice.write(json.dumps({"segmento": self.segmento, "miembros": miembros}) + "\n")
+
+        os.remove(self.ruta)
+        self._numero += 1
+        self._abrir()
+
+class LogSegmentsHandler(logging.Handler):
+    """Handler de logging que escribe en un LogSegments; el test del registro viene en record.test."""
+
+    def __init__(self, archivo):
+        super().__init__()
+        self.archivo = archivo
+
+    def emit(self, record):
+        try:
+            self.archivo.escribir(self.format(record) + "\n", getattr(record, "test", None))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.archivo.flush()
+
+    def close(self):
+        self.archivo.cerrar()
+        super().close()
+
+class LogIndex:
+    """Lectura del índice de LogSegments: el log de un test sin leer el archivo completo."""
+
+    @staticmethod
+    def ruta_indice(log_file):
+        """Ruta del índice de un log (<base>.idx.jsonl)."""
+        return f"{os.path.splitext(log_file)[0]}.idx.jsonl"
+
+    @staticmethod
+    def leer(log_file):
+        """Líneas del índice de un log ([] si no tiene)."""
+        ruta = LogIndex.ruta_indice(log_file)
+        if not os.path.exists(ruta):
+            return []
+        registros = []
+        with open(ruta, "r", encoding="utf-8") as file:
+            for linea in file:
+                try:
+                    registros.append(json.loads(linea))
+                except ValueError:
+                    continue
+        return registros
+
+    @staticmethod
+    def extraer(log_file, test, ejecucion=None):
+        """Texto que escribió un test: lee solo sus bytes (o descomprime solo sus miembros gzip).
+
+        Con ejecucion, solo los tramos de esa ejecución (si no, los de todas las del día).
+        """
+        directorio = os.path.dirname(log_file) or "."
+        tramos = []
+        miembros = {}
+        for registro in LogIndex.leer(log_file):
+            if registro.get("test") == test and ejecucion in (None, registro.get("ejecucion")):
+                tramos.append(registro)
+            elif "miembros" in registro:
+                miembros[registro["segmento"]] = {m[0]: m[1:] for m in registro["miembros"]}
+
+        partes = []
+        for tramo in tramos:
+            comprimido = miembros.get(tramo["segmento"], {}).get(tramo["inicio"])
+            if comprimido:
+                with open(os.path.join(directorio, tramo["segmento"]), "rb") as file:
+                    file.seek(comprimido[0])
+                    partes.append(gzip.decompress(file.read(comprimido[1] - comprimido[0])))
+            elif tramo["segmento"] not in miembros and os.path.exists(log_file):
+                with open(log_file, "rb") as file:
+                    file.seek(tramo["inicio"])
+                    partes.append(file.read(tramo["fin"] - tramo["inicio"]))
+        return b"".join(partes).decode("utf-8", errors="replace")
+
+    @staticmethod
+    def registros(log_file, ejecucion=None):
+        """Recorre el segmento activo de un log devolviendo (timestamp, texto, test) por registro.
+
+        Con ejecucion, los registros de tramos de otras ejecuciones quedan sin test.
+        """
+        segmento = None
+        tramos = []
+        for registro in LogIndex.leer(log_file):
+            if "test" in registro:
+                if ejecucion not in (None, registro.get("ejecucion")):
+                    continue
+                if registro["segmento"] != segmento:
+                    segmento, tramos = registro["segmento"], []
+                tramos.append((registro["inicio"], registro["fin"], registro["test"]))
+            elif registro["segmento"] == segmento:
+                tramos = [] # Ese segmento ya se comprimió: no es el activo
+
+        # Los registros y los tramos están en el mismo orden: se avanza sobre los tramos una sola vez
+        pendientes = iter(tramos)
+        tramo = next(pendientes, None)
+
+        def test_en(offset):
+            nonlocal tramo
+            while tramo and tramo[1] <= offset:
+                tramo = next(pendientes, None)
+            return tramo[2] if tramo and tramo[0] <= offset else None
+
+        with open(log_file, "rb") as file:
+            actual = []
+            offset = inicio = 0
+            for linea in file:
+                if _INICIO_REGISTRO.match(linea.decode("utf-8", errors="replace")) and actual:
+                    texto = b"".join(actual).decode("utf-8", errors="replace")
+                    yield texto[:19], texto, test_en(inicio)
+                    actual, inicio = [], offset
+                actual.append(linea)
+                offset += len(linea)
+            if actual:
+                texto = b"".join(actual).decode("utf-8", errors="replace")
+                yield texto[:19], texto, test_en(inicio)
@@ -1,32 +1,150 @@
+import atexit
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from utils.log_index import MB, LogSegments, LogSegmentsHandler
+from utils.parallel import is_worker, merge_worker_logs, worker_id
 
 class Logger:
-    """Sistema de logging para registrar pasos clave durante la ejecución."""
+    """Sistema de logging para registrar pasos clave durante la ejecución.
+
+    Los mensajes se encolan desde el hilo del test (QueueHandler) y un hilo de
+    fondo (QueueListener) los escribe en archivo y consola. La configuración
+    se hace una sola vez por proceso; get_logger solo engancha el handler de
+    la cola.
+
+    El archivo rota al llegar a MAX_BYTES (los segmentos viejos se comprimen)
+    y cada registro queda asociado al test en curso, así log_del_test puede
+    leer solo las líneas de un test.
+    """
+
+    LOG_DIR = "reports/logs"
+    MAX_BYTES = 10 * MB
+
+    _queue_handler = None
+    _archivo = None
+    _test = None
+    _listener = None
+    _nivel = logging.INFO
+    _loggers = []
+    _lock = threading.Lock()
 
     @staticmethod
     def get_logger(name=__name__):
-        """Crea y configura un logger."""
-        # Crear directorio de logs si no existe
-        os.makedirs("reports/logs", exist_ok=True)
-
-        # Nombre del archivo con fecha
-        log_file = f"reports/logs/test_execution_{datetime.now().strftime('%Y-%m-%d')}.log"
+        """Devuelve un logger que escribe a través de la cola compartida."""
+        if Logger._queue_handler is None:
+            Logger._configurar()
 
-        # Configurar logger
         logger = logging.getLogger(name)
-        logger.setLevel(logging.INFO)
 
         # Evitar duplicados
         if not logger.handlers:
-            # Handler para archivo
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
+            logger.setLevel(Logger._nivel)
+            logger.addHandler(Logger._queue_handler)
+            Logger._loggers.append(logger)
+
+        return logger
+
+    @staticmethod
+    def set_level(nivel):
+        """Define la verbosidad de la ejecución (por ejemplo 'WARNING' apaga los pasos INFO)."""
+        if isinstance(nivel, str):
+            nivel = logging.getLevelName(nivel.upper())
+        Logger._nivel = nivel
+        for logger in Logger._loggers:
+            logger.setLevel(nivel)
+
+    @staticmethod
+    def set_max_bytes(max_bytes):
+        """Tamaño a partir del cual rota el log (0 = no rotar)."""
+        Logger.MAX_BYTES = max_bytes
+        if Logger._archivo is not None:
+            Logger._archivo.max_bytes = max_bytes
+
+    @staticmethod
+    def ejecucion():
+        """Id de la ejecución con el que se marcan los tramos del índice del log."""
+        if Logger._archivo is None:
+            Logger._configurar()
+        return Logger._archivo.ejecucion
+
+    @staticmethod
+    def set_ejecucion(ejecucion):
+        """Usa el id de ejecución del controlador (en los workers de xdist)."""
+        if Logger._archivo is None:
+            Logger._configurar()
+        Logger._archivo.flush()
+        Logger._archivo.ejecucion = ejecucion
+
+    @staticmethod
+    def iniciar_test(nodeid):
+        """Los registros siguientes pertenecen a nodeid (None = fuera de un test)."""
+        Logger._test = nodeid
+
+    @staticmethod
+    def log_del_test(nodeid):
+        """Líneas que escribió un test en el log de este proceso (sin leer el resto del archivo)."""
+        if Logger._archivo is None:
+            return ""
+        Logger.flush()
+        return Logger._archivo.tramo(nodeid)
+
+    @staticmethod
+    def unir_workers():
+        """Une al log del controlador los logs de los workers de xdist."""
+        if Logger._archivo is None:
+            Logger._configurar()
+        Logger.flush()
+        return merge_worker_logs(Logger._archivo.ruta, Logger._archivo)
+
+    @staticmethod
+    def log_file(worker=True):
+        """Ruta del log del día; con xdist cada worker escribe en su propio archivo."""
+        nombre = f"test_execution_{datetime.now().strftime('%Y-%m-%d')}"
+        if worker and is_worker():
+            nombre += f"_{worker_id()}"
+        return f"{Logger.LOG_DIR}/{nombre}.log"
+
+    @staticmethod
+    def flush():
+        """Espera a que el hilo escritor vuelque todo lo encolado hasta ahora (y lo indexe)."""
+        with Logger._lock:
+            if Logger._listener is not None:
+                Logger._listener.stop()
+                Logger._listener.start()
+            if Logger._archivo is not None:
+                Logger._archivo.flush()
+
+    @staticmethod
+    def detener():
+        """Vacía la cola y detiene el hilo escritor (al terminar la ejecución)."""
+        with Logger._lock:
+            if Logger._listener is not None:
+                Logger._listener.stop()
+                Logger._listener = None
+
+    @staticmethod
+    def _configurar():
+        """Crea los handlers y el hilo escritor una sola vez por proceso."""
+        with Logger._lock:
+            if Logger._queue_handler is not None:
+                return
+
+            # Crear directorio de logs si no existe
+            os.makedirs(Logger.LOG_DIR, exist_ok=True)
+
+            # Nombre del archivo con fecha (y worker de xdist, si corresponde)
+            log_file = Logger.log_file()
+
+            # Handler para archivo (rota por tamaño e indexa los bytes de cada test)
+            Logger._archivo = LogSegments(log_file, Logger.MAX_BYTES)
+            file_handler = LogSegmentsHandler(Logger._archivo)
 
             # Handler para consola
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
 
             # Formato
             formatter = logging.Formatter(
@@ -37,8 +155,16 @@ class Logger:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-
-        return logger
+            # El hilo del test solo encola; el listener escribe en segundo plano
+            cola = queue.SimpleQueue()
+            Logger._listener = QueueListener(cola, file_handler, console_handler)
+            Logger._listener.start()
+            Logger._queue_handler = QueueHandler(cola)
+            Logger._queue_handler.addFilter(Logger._marcar_test)
+            atexit.register(Logger.detener)
 
+    @staticmethod
+    def _marcar_test(record):
+        """Anota en el registro el test en curso (se evalúa en el hilo que loguea)."""
+        record.test = Logger._test
+        return True
@@ -0,0 +1,216 @@
+import json
+import os
+import re
+import weakref
+from datetime import datetime, timezone
+from selenium.common.exceptions import WebDriverException
+from utils.logger import Logger
+
+# Métricas de un presupuesto de red: clave en el JSON/marcador -> (nombre legible, clave en el resumen de la carga)
+METRICAS = {
+    "max_requests": ("requests", "requests"),
+    "max_total_bytes": ("bytes totales", "bytes"),
+    "max_asset_bytes": ("asset más grande", "mayor_asset"),
+}
+
+def _tamano(valor, metrica):
+    if metrica == "max_requests":
+        return str(valor)
+    for unidad, factor in (("MB", 1024 * 1024), ("KB", 1024)):
+        if valor >= factor:
+            return f"{valor / factor:.1f} {unidad}"
+    return f"{valor} B"
+
+class NetworkCapture:
+    """Tráfico de red de un test, leído de los eventos Network.* del performance log de Chrome.
+
+    El navegador tiene que crearse con performance logging (DriverFactory,
+    capturar_red=True). Cada navegación de un page object (BasePage._abrir)
+    es una "carga": sus requests se agrupan y se comparan con el presupuesto
+    de esa página, si lo tiene. Al terminar el test se escribe un archivo
+    con formato HAR reducido (una entrada por request, sin headers ni cuerpos).
+    """
+
+    DIRECTORIO = "reports/network"
+
+    _activas = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, test, presupuestos=None):
+        self.driver = driver
+        self.test = test
+        self.presupuestos = presupuestos or {}
+        self.cargas = []
+        self.entradas = []
+        self._pendientes = {}
+        self.logger = Logger.get_logger(__name__)
+
+    @classmethod
+    def iniciar(cls, driver, test, presupuestos=None):
+        """Empieza a capturar el tráfico de driver para test (descarta lo anterior del navegador)."""
+        captura = cls(driver, test, presupuestos)
+        captura._eventos() # Lo que quedó en el log de otro test del pool no cuenta
+        cls._activas[driver] = captura
+        return captura
+
+    @classmethod
+    def de(cls, driver):
+        """Captura en curso del navegador (None si no se está capturando)."""
+        return cls._activas.get(driver)
+
+    @staticmethod
+    def cargar_presupuestos(ruta):
+        """Presupuestos por page object desde un JSON ({"HomePage": {"max_requests": 60, ...}})."""
+        if not ruta or not os.path.exists(ruta):
+            return {}
+        with open(ruta, "r", encoding="utf-8") as file:
+            presupuestos = json.load(file)
+        for pagina, limites in presupuestos.items():
+            NetworkCapture.validar(pagina, limites, ruta)
+        return presupuestos
+
+    @staticmethod
+    def validar(pagina, limites, origen):
+        """Falla si un presupuesto usa métricas que no existen (origen: el JSON o el marcador)."""
+        desconocidas = set(limites) - set(METRICAS)
+        if desconocidas:
+            raise ValueError(
+                f"Presupuesto de red de {pagina} en {origen}: métricas desconocidas {sorted(desconocidas)} "
+                f"(válidas: {', '.join(METRICAS)})"
+            )
+
+    def antes_de_cargar(self):
+        """Cierra lo capturado hasta ahora, antes de que un page object navegue."""
+        self._procesar()
+
+    def registrar_carga(self, pagina, url):
+        """Agrupa como una carga de pagina los requests iniciados desde antes_de_cargar y verifica su presupuesto.
+
+        Cuentan los requests terminados cuando la página quedó lista; los que
+        terminan después aparecen en el HAR pero no en el presupuesto.
+        """
+        carga = {
+            "id": f"carga_{len(self.cargas) + 1}",
+            "pagina": pagina,
+            "url": url,
+            "inicio": datetime.now(timezone.utc).isoformat(),
+        }
+        self._procesar(pageref=carga["id"])
+        entradas = [e for e in self.entradas if e.get("pageref") == carga["id"]]
+        mayor = max(entradas, key=lambda e: e["response"]["_transferSize"], default=None)
+        carga.update({
+            "requests": len(entradas),
+            "bytes": sum(e["response"]["_transferSize"] for e in entradas),
+            "mayor_asset": mayor["response"]["_transferSize"] if mayor else 0,
+            "url_mayor_asset": mayor["request"]["url"] if mayor else None,
+        })
+        self.cargas.append(carga)
+        self.logger.info(
+            "Red %s: %s requests, %s transferidos (mayor: %s)", pagina, carga["requests"],
+            _tamano(carga["bytes"], "max_total_bytes"), _tamano(carga["mayor_asset"], "max_asset_bytes")
+        )
+        self._verificar(carga)
+
+    def terminar(self, directorio=DIRECTORIO):
+        """Procesa lo pendiente, escribe el archivo HAR del test y deja de capturar. Devuelve su ruta."""
+        NetworkCapture._activas.pop(self.driver, None)
+        try:
+            self._procesar()
+        except WebDriverException as e:
+            self.logger.warning("No se pudo leer el tráfico de red final de %s: %s", self.test, e)
+        if not self.entradas:
+            return None
+
+        os.makedirs(directorio, exist_ok=True)
+        nombre = re.sub(r"[^\w.-]+", "_", self.test).strip("_")
+        ruta = os.path.join(directorio, f"{nombre}.har")
+        har = {"log": {
+            "version": "1.2",
+            "creator": {"name": "talento-lab-automation", "version": "1.0"},
+            "pages": [
+                {"id": c["id"], "title": f"{c['pagina']} {c['url']}", "startedDateTime": c["inicio"],
+                 "_requests": c["requests"], "_bytes": c["bytes"], "_mayorAsset": c["mayor_asset"]}
+                for c in self.cargas
+            ],
+            "entries": self.entradas,
+        }}
+        with open(ruta, "w", encoding="utf-8") as file:
+            json.dump(har, file, ensure_ascii=False, separators=(",", ":"))
+        return ruta
+
+    def _verificar(self, carga):
+        """Falla con la tabla presupuesto/medido si la carga excede alguna métrica."""
+        limites = self.presupuestos.get(carga["pagina"], {})
+        excedidas = [
+            (metrica, limite, carga[METRICAS[metrica][1]])
+            for metrica, limite in limites.items()
+            if limite is not None and carga[METRICAS[metrica][1]] > limite
+        ]
+        if not excedidas:
+            return
+
+        lineas = [
+            f"Presupuesto de red excedido en {carga['pagina']} ({carga['url']}):",
+            f"  {'métrica':<18} {'presupuesto':>12} {'medido':>12} {'exceso':>12}",
+        ]
+        for metrica, limite, medido in excedidas:
+            lineas.append(
+                f"  {METRICAS[metrica][0]:<18} {_tamano(limite, metrica):>12} {_tamano(medido, metrica):>12} "
+                f"{'+' + _tamano(medido - limite, metrica):>12}"
+            )
+            if metrica == "max_asset_bytes":
+                lineas.append(f"  {'':<18} {carga['url_mayor_asset']}")
+        mensaje = "\n".join(lineas)
+        self.logger.error(mensaje)
+        raise AssertionError(mensaje)
+
+    def _eventos(self):
+        """Eventos Network.* nuevos del performance log (Chrome los entrega una sola vez)."""
+        eventos = []
+        for entrada in self.driver.get_log("performance"):
+            mensaje = json.loads(entrada["message"])["message"]
+            if mensaje["method"].startswith("Network."):
+                eventos.append(mensaje)
+        return eventos
+
+    def _procesar(self, pageref=None):
+        """Convierte los eventos nuevos en entradas HAR; los requests sin terminar quedan pendientes."""
+        for evento in self._eventos():
+            params = evento["params"]
+            request_id = params.get("requestId")
+            metodo = evento["method"]
+
+            if metodo == "Network.requestWillBeSent":
+                if params["request"]["url"].startswith("data:"):
+                    continue
+                anterior = self._pendientes.pop(request_id, None)
+                if anterior and params.get("redirectResponse"):
+                    # Una redirección es un request propio (con el mismo requestId)
+                    anterior["response"]["status"] = params["redirectResponse"]["status"]
+                    anterior["response"]["_transferSize"] = int(params["redirectResponse"].get("encodedDataLength", 0))
+                    self._cerrar(anterior, params["timestamp"])
+                self._pendientes[request_id] = {
+                    "pageref": pageref,
+                    "startedDateTime": datetime.fromtimestamp(params["wallTime"], timezone.utc).isoformat(),
+                    "_inicio": params["timestamp"],
+                    "_resourceType": params.get("type", "Other"),
+                    "request": {"method": params["request"]["method"], "url": params["request"]["url"]},
+                    "response": {"status": 0, "content": {"mimeType": ""}, "_transferSize": 0},
+                }
+            elif request_id in self._pendientes:
+                entrada = self._pendientes[request_id]
+                if metodo == "Network.responseReceived":
+                    entrada["response"]["status"] = params["response"]["status"]
+                    entrada["response"]["content"]["mimeType"] = params["response"].get("mimeType", "")
+                    entrada["_resourceType"] = params.get("type", entrada["_resourceType"])
+                elif metodo == "Network.loadingFinished":
+                    entrada["response"]["_transferSize"] = int(params.get("encodedDataLength", 0))
+                    self._cerrar(self._pendientes.pop(request_id), params["timestamp"])
+                elif metodo == "Network.loadingFailed":
+                    entrada["response"]["_error"] = params.get("errorText", "")
+                    self._cerrar(self._pendientes.pop(request_id), params["timestamp"])
+
+    def _cerrar(self, entrada, fin):
+        entrada["time"] = round((fin - entrada.pop("_inicio")) * 1000, 1)
+        if entrada["pageref"] is None:
+            entrada.pop("pageref")
+        self.entradas.append(entrada)
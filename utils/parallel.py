@@ -0,0 +1,170 @@
+import getpass
+import glob
+import hashlib
+import heapq
+import os
+import tempfile
+import time
+from utils.log_index import LogIndex
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+def worker_id():
+    """Id del worker de xdist ("gw0", "gw1", ...) o "master" si no hay paralelismo."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+def is_worker():
+    """Indica si el proceso actual es un worker de xdist."""
+    return "PYTEST_XDIST_WORKER" in os.environ
+
+class BrowserSlots:
+    """Semáforo entre procesos para limitar cuántos Chrome hay abiertos a la vez.
+
+    Cada navegador vivo ocupa un slot, que es un lock sobre un archivo. El
+    sistema operativo libera el lock si el proceso muere, así que un worker
+    caído nunca deja slots tomados.
+
+    Un proceso que espera un slot deja un aviso (otro archivo bloqueado);
+    los demás lo ven con hay_esperando y cierran sus navegadores inactivos
+    para cederle el suyo.
+
+    Los slots son de cada usuario y checkout (ver directorio_para): otra
+    cuenta u otro clon del repositorio en la misma máquina no comparte el
+    límite ni los archivos de lock.
+    """
+
+    TIMEOUT = 300 # Segundos de espera por un slot antes de fallar
+
+    def __init__(self, cantidad, directorio=None):
+        self.cantidad = max(1, cantidad)
+        self.directorio = directorio or BrowserSlots.directorio_para(os.getcwd())
+        self._tomados = 0
+        os.makedirs(self.directorio, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def directorio_para(raiz):
+        """Directorio de los slots del usuario actual para el checkout en raiz."""
+        try:
+            usuario = getpass.getuser()
+        except Exception: # Sin variables de entorno ni entrada en passwd
+            usuario = str(os.getuid()) if hasattr(os, "getuid") else "usuario"
+        clave = hashlib.sha1(os.path.abspath(str(raiz)).encode("utf-8")).hexdigest()[:10]
+        return os.path.join(tempfile.gettempdir(), f"talentolab_browser_slots_{usuario}_{clave}")
+
+    def acquire(self, timeout=TIMEOUT):
+        """Toma un slot libre, esperando hasta timeout segundos (None: sin límite) a que otro proceso lo ceda.
+
+        Si este proceso ya tiene todos los slots falla enseguida: nadie más
+        puede liberarlos, así que esperar sería un bloqueo seguro.
+        """
+        if self._tomados >= self.cantidad:
+            raise RuntimeError(
+                f"Este proceso ya tiene los {self.cantidad} slots de navegador en uso y pidió otro "
+                "(un test que usa varios navegadores necesita un límite mayor)"
+            )
+        fin = None if timeout is None else time.monotonic() + timeout
+        aviso = None
+        try:
+            while True:
+                for i in range(self.cantidad):
+                    handle = open(os.path.join(self.directorio, f"slot_{i}.lock"), "a+")
+                    if self._try_lock(handle):
+                        self._tomados += 1
+                        return handle
+                    handle.close()
+                if aviso is None:
+                    aviso = self._avisar_espera()
+                if fin is not None and time.monotonic() > fin:
+                    raise TimeoutError(
+                        f"No se liberó ningún slot de navegador en {timeout}s (máximo: {self.cantidad})"
+                    )
+                time.sleep(0.2)
+        finally:
+            if aviso is not None:
+                self._retirar_aviso(aviso)
+
+    def hay_esperando(self):
+        """Indica si otro proceso está esperando un slot."""
+        propio = f"espera_{os.getpid()}.lock"
+        for ruta in glob.glob(os.path.join(self.directorio, "espera_*.lock")):
+            if os.path.basename(ruta) == propio:
+                continue
+            try:
+                handle = open(ruta, "a+")
+            except OSError:
+                continue
+            if not self._try_lock(handle):
+                handle.close()
+                return True
+            # Aviso de un proceso que ya no existe
+            self._retirar_aviso(handle)
+        return False
+
+    def release(self, handle):
+        """Libera un slot tomado con acquire."""
+        self._tomados = max(0, self._tomados - 1)
+        self._desbloquear(handle)
+
+    @staticmethod
+    def _desbloquear(handle):
+        try:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        handle.close()
+
+    def _avisar_espera(self):
+        handle = open(os.path.join(self.directorio, f"espera_{os.getpid()}.lock"), "a+")
+        self._try_lock(handle)
+        return handle
+
+    def _retirar_aviso(self, handle):
+        self._desbloquear(handle)
+        try:
+            os.remove(handle.name)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _try_lock(handle):
+        try:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+def merge_worker_logs(log_file, destino):
+    """Une los logs por worker (<log>_gw*.log) en destino (LogSegments) en orden cronológico y los borra.
+
+    Cada registro conserva el test al que pertenecía en el índice del
+    worker; los segmentos que el worker ya había comprimido quedan como
+    están y pasan al índice de destino.
+    """
+    base, ext = os.path.splitext(log_file)
+    archivos = sorted(glob.glob(f"{base}_gw*{ext}"))
+    if not archivos:
+        return []
+
+    for archivo in archivos:
+        destino.importar(archivo)
+    registros = (LogIndex.registros(a, destino.ejecucion) for a in archivos)
+    for _, texto, test in heapq.merge(*registros, key=lambda r: r[0]):
+        destino.escribir(texto, test)
+
+    for archivo in archivos:
+        os.remove(archivo)
+        if os.path.exists(LogIndex.ruta_indice(archivo)):
+            os.remove(LogIndex.ruta_indice(archivo))
+    return archivos
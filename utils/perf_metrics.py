@@ -0,0 +1,85 @@
+import json
+import os
+import statistics
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+from utils.wait_policy import WaitPolicy
+
+# Navigation Timing, Paint Timing y Resource Timing de la carga actual
+_METRICAS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav || !nav.loadEventEnd) { return null; }
+var pintado = {};
+performance.getEntriesByType('paint').forEach(function(p) { pintado[p.name] = p.startTime; });
+var recursos = performance.getEntriesByType('resource');
+var bytes = 0, decodificados = 0;
+recursos.forEach(function(r) { bytes += r.transferSize || 0; decodificados += r.decodedBodySize || 0; });
+return {
+    ttfb_ms: nav.responseStart - nav.requestStart,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+    load_ms: nav.loadEventEnd,
+    documento_bytes: nav.transferSize || 0,
+    first_paint_ms: pintado['first-paint'] || null,
+    fcp_ms: pintado['first-contentful-paint'] || null,
+    recursos: recursos.length,
+    recursos_bytes: bytes,
+    recursos_decodificados_bytes: decodificados
+};
+"""
+
+class PageMetrics:
+    """Captura y resume métricas de carga de página desde la Performance API del navegador."""
+
+    HISTORIAL = "reports/benchmark_page_load.jsonl"
+
+    @staticmethod
+    def capturar(driver, timeout=None):
+        """Espera a que termine el evento load y devuelve las métricas de la carga actual."""
+        return WaitPolicy.actual().until(
+            driver, lambda d: d.execute_script(_METRICAS_JS), timeout, poll_frequency=0.1
+        )
+
+    @staticmethod
+    def limpiar_cache(driver):
+        """Vacía la caché HTTP del navegador para medir una carga en frío."""
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except (AttributeError, WebDriverException):
+            pass
+        driver.get("about:blank")
+
+    @staticmethod
+    def estadisticas(valores):
+        """min / mediana / p95 de una serie (ignora valores nulos)."""
+        valores = sorted(v for v in valores if v is not None)
+        if not valores:
+            return None
+        indice_p95 = min(len(valores) - 1, max(0, round(0.95 * len(valores)) - 1))
+        return {
+            "min": round(valores[0], 1),
+            "mediana": round(statistics.median(valores), 1),
+            "p95": round(valores[indice_p95], 1),
+        }
+
+    @staticmethod
+    def resumir(muestras):
+        """Estadísticas por métrica de una lista de muestras."""
+        metricas = muestras[0].keys() if muestras else []
+        return {m: PageMetrics.estadisticas([s[m] for s in muestras]) for m in metricas}
+
+    @staticmethod
+    def guardar(pagina, url, cache, muestras, ruta=HISTORIAL):
+        """Agrega una línea JSON al historial de benchmarks (para comparar entre deploys)."""
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        registro = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "pagina": pagina,
+            "url": url,
+            "cache": cache,
+            "corridas": len(muestras),
+            "resumen": PageMetrics.resumir(muestras),
+            "muestras": muestras,
+        }
+        with open(ruta, "a", encoding="utf-8") as file:
+            file.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        return registro
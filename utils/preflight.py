@@ -0,0 +1,36 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+class Preflight:
+    """Chequeo previo de los sitios bajo prueba, antes de abrir navegadores.
+
+    Hace una petición corta a cada URL y mide la latencia hasta recibir los
+    headers. Un timeout, un error de conexión o un 5xx marcan la URL como no
+    disponible; un 4xx cuenta como disponible (el servidor responde).
+    """
+
+    @staticmethod
+    def sondear(url, timeout=5):
+        """Devuelve {"url", "ok", "status", "ms", "error"} para una URL."""
+        inicio = time.perf_counter()
+        try:
+            with requests.get(url, timeout=timeout, stream=True) as respuesta:
+                ms = round((time.perf_counter() - inicio) * 1000, 1)
+                ok = respuesta.status_code < 500
+                return {
+                    "url": url, "ok": ok, "status": respuesta.status_code, "ms": ms,
+                    "error": None if ok else f"HTTP {respuesta.status_code}"
+                }
+        except requests.RequestException as e:
+            ms = round((time.perf_counter() - inicio) * 1000, 1)
+            return {"url": url, "ok": False, "status": None, "ms": ms, "error": type(e).__name__}
+
+    @staticmethod
+    def sondear_todas(urls, timeout=5):
+        """Sondea varias URLs en paralelo; devuelve {url: resultado}."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return dict(zip(urls, executor.map(lambda url: Preflight.sondear(url, timeout), urls)))
@@ -0,0 +1,177 @@
+import glob
+import html
+import json
+import os
+import sys
+from collections import Counter
+from utils.results_stream import ResultsStream
+
+_ESTILO = """<style>
+body { font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 20px; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 4px 6px; text-align: left; vertical-align: top; }
+th { background: #f2f2f2; }
+.passed { color: #2e7d32; } .failed, .error { color: #c62828; }
+.skipped, .xfailed, .xpassed, .incompleto { color: #8d6e63; }
+pre { white-space: pre-wrap; max-height: 400px; overflow: auto; background: #fafafa; }
+nav a { margin-right: 12px; }
+</style>"""
+
+class _Pagina:
+    """Archivo HTML de resultados que se escribe fila por fila."""
+
+    def __init__(self, ruta, titulo, navegacion):
+        self.ruta = ruta
+        self.filas = 0
+        self.fallos = 0
+        self.primero = None
+        self.ultimo = None
+        self._file = open(ruta, "w", encoding="utf-8")
+        self._file.write(
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(titulo)}</title>{_ESTILO}</head>"
+            f"<body><nav>{navegacion}</nav><h1>{html.escape(titulo)}</h1>"
+            "<table><tr><th>Test</th><th>Resultado</th><th>Duración (s)</th><th>Worker</th><th>Detalle</th></tr>\n"
+        )
+
+    def agregar(self, fila):
+        self._file.write(_fila_html(fila))
+        self.filas += 1
+        self.fallos += fila["resultado"] in ("failed", "error")
+        self.primero = self.primero or fila["test"]
+        self.ultimo = fila["test"]
+
+    def cerrar(self, navegacion=""):
+        self._file.write(f"</table><nav>{navegacion}</nav></body></html>\n")
+        self._file.close()
+
+def _fila_html(fila):
+    detalle = ""
+    if fila["detalle"]:
+        detalle = f"<details><summary>ver</summary><pre>{html.escape(fila['detalle'])}</pre></details>"
+    return (
+        f"<tr><td>{html.escape(fila['test'])}</td><td class='{fila['resultado']}'>{fila['resultado']}</td>"
+        f"<td>{fila['duracion_s']}</td><td>{html.escape(fila['worker'] or '')}</td><td>{detalle}</td></tr>\n"
+    )
+
+def _resultado(fases):
+    """Resultado de un test a partir de sus fases (como lo resume pytest)."""
+    for nombre in ("setup", "call", "teardown"):
+        fase = fases.get(nombre)
+        if fase and fase["resultado"] == "failed":
+            return "failed" if nombre == "call" else "error"
+    if any(f["resultado"] == "skipped" for f in fases.values()):
+        return "xfailed" if any(f["xfail"] for f in fases.values()) else "skipped"
+    if "teardown" not in fases:
+        return "incompleto"
+    if fases.get("call", {}).get("xfail"):
+        return "xpassed"
+    return "passed"
+
+def _fila(test, fases):
+    detalle = "\n\n".join(f["detalle"] for f in fases.values() if f["detalle"])
+    worker = next((f["worker"] for f in fases.values() if f["worker"]), None)
+    return {
+        "test": test,
+        "resultado": _resultado(fases),
+        "duracion_s": round(sum(f["duracion_s"] for f in fases.values()), 3),
+        "worker": worker,
+        "detalle": detalle,
+    }
+
+class ReportRenderer:
+    """Arma un reporte HTML paginado leyendo el stream de resultados línea por línea.
+
+    En memoria solo quedan los tests que todavía no terminaron su teardown
+    (a lo sumo uno por worker) y un resumen por página, así que el costo no
+    depende del tamaño de la ejecución. Se puede correr sobre el stream de
+    una ejecución en curso o cortada: los tests sin teardown aparecen como
+    "incompleto".
+    """
+
+    DESTINO = "reports/stream_report"
+    POR_PAGINA = 500
+
+    @staticmethod
+    def renderizar(origen=ResultsStream.ARCHIVO, destino=DESTINO, por_pagina=POR_PAGINA):
+        """Genera index.html, pagina_NNNN.html y fallos.html en destino. Devuelve la ruta del índice."""
+        os.makedirs(destino, exist_ok=True)
+        for viejo in glob.glob(os.path.join(destino, "pagina_*.html")):
+            os.remove(viejo)
+
+        conteo = Counter()
+        paginas = []
+        inicio = fin = None
+        abiertos = {}
+        fallos = _Pagina(os.path.join(destino, "fallos.html"), "Fallos", "<a href='index.html'>Índice</a>")
+
+        def nueva_pagina():
+            numero = len(paginas) + 1
+            anterior = f"<a href='pagina_{numero - 1:04d}.html'>« Anterior</a>" if numero > 1 else ""
+            pagina = _Pagina(
+                os.path.join(destino, f"pagina_{numero:04d}.html"), f"Resultados - página {numero}",
+                f"<a href='index.html'>Índice</a>{anterior}"
+            )
+            paginas.append(pagina)
+            return pagina
+
+        pagina = None
+
+        def emitir(fila):
+            nonlocal pagina
+            if pagina is None or pagina.filas >= por_pagina:
+                if pagina is not None:
+                    pagina.cerrar(f"<a href='pagina_{len(paginas) + 1:04d}.html'>Siguiente »</a>")
+                pagina = nueva_pagina()
+            pagina.agregar(fila)
+            conteo[fila["resultado"]] += 1
+            if fila["resultado"] in ("failed", "error"):
+                fallos.agregar(fila)
+
+        with open(origen, "r", encoding="utf-8") as file:
+            for linea in file:
+                try:
+                    registro = json.loads(linea)
+                except ValueError:
+                    continue # Última línea a medio escribir si la ejecución se cortó
+                if registro["evento"] == "inicio":
+                    inicio = registro["fecha"]
+                elif registro["evento"] == "fin":
+                    fin = registro
+                else:
+                    fases = abiertos.setdefault(registro["test"], {})
+                    fases[registro["fase"]] = registro
+                    if registro["fase"] == "teardown":
+                        emitir(_fila(registro["test"], abiertos.pop(registro["test"])))
+
+        for test, fases in abiertos.items():
+            emitir(_fila(test, fases))
+        if pagina is not None:
+            pagina.cerrar()
+        fallos.cerrar()
+
+        indice = os.path.join(destino, "index.html")
+        with open(indice, "w", encoding="utf-8") as file:
+            estado = (
+                f"Terminada el {fin['fecha']} (exit status {fin['exitstatus']})" if fin
+                else "Ejecución incompleta o en curso: reporte parcial"
+            )
+            resumen = "".join(
+                f"<li class='{resultado}'>{resultado}: {cantidad}</li>" for resultado, cantidad in sorted(conteo.items())
+            )
+            filas = "".join(
+                f"<tr><td><a href='{os.path.basename(p.ruta)}'>{i}</a></td><td>{p.filas}</td><td>{p.fallos}</td>"
+                f"<td>{html.escape(p.primero or '')}</td><td>{html.escape(p.ultimo or '')}</td></tr>"
+                for i, p in enumerate(paginas, start=1)
+            )
+            file.write(
+                f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Talento Lab - Resultados</title>{_ESTILO}</head>"
+                f"<body><h1>Talento Lab - Resultados</h1><p>Inicio: {inicio or '-'}. {estado}.</p>"
+                f"<ul>{resumen}</ul><p><a href='fallos.html'>Ver fallos ({fallos.filas})</a></p>"
+                "<table><tr><th>Página</th><th>Tests</th><th>Fallos</th><th>Desde</th><th>Hasta</th></tr>"
+                f"{filas}</table></body></html>\n"
+            )
+        return indice
+
+if __name__ == "__main__":
+    # python -m utils.report_renderer [reports/results.jsonl] [reports/stream_report]
+    print(ReportRenderer.renderizar(*sys.argv[1:3]))
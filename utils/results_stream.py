@@ -0,0 +1,61 @@
+import json
+import os
+from datetime import datetime
+
+class ResultsStream:
+    """Escribe los resultados a medida que ocurren: una línea JSON por fase de cada test.
+
+    Cada línea se vuelca al sistema operativo apenas se escribe, así el
+    archivo sirve para armar un reporte parcial aunque la ejecución se corte.
+    La memoria no crece con la cantidad de tests.
+    """
+
+    ARCHIVO = "reports/results.jsonl"
+    MAX_DETALLE = 20000 # Caracteres del traceback que se guardan por fase
+
+    _actual = None
+
+    def __init__(self, ruta=ARCHIVO):
+        self.ruta = ruta
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        self._file = open(ruta, "w", encoding="utf-8", buffering=1)
+        self._escribir({"evento": "inicio", "fecha": datetime.now().isoformat(timespec="seconds")})
+
+    @classmethod
+    def abrir(cls, ruta=ARCHIVO):
+        """Empieza el stream de la ejecución en curso (se llama una vez, en el controlador)."""
+        cls._actual = cls(ruta)
+        return cls._actual
+
+    @classmethod
+    def actual(cls):
+        """Devuelve el stream de la ejecución en curso (None si no se abrió, p. ej. en un worker)."""
+        return cls._actual
+
+    def registrar(self, report, worker=None):
+        """Agrega la línea de una fase (setup/call/teardown) de un test."""
+        detalle = ""
+        if report.failed or report.skipped:
+            detalle = report.longreprtext[:self.MAX_DETALLE]
+        self._escribir({
+            "evento": "fase",
+            "test": report.nodeid,
+            "fase": report.when,
+            "resultado": report.outcome,
+            "xfail": hasattr(report, "wasxfail"),
+            "duracion_s": round(report.duration, 3),
+            "worker": getattr(report, "worker_id", None) or worker,
+            "detalle": detalle,
+        })
+
+    def cerrar(self, exitstatus=None):
+        """Escribe la línea de cierre y cierra el archivo."""
+        if self._file.closed:
+            return
+        self._escribir({
+            "evento": "fin", "fecha": datetime.now().isoformat(timespec="seconds"), "exitstatus": int(exitstatus or 0)
+        })
+        self._file.close()
+
+    def _escribir(self, registro):
+        self._file.write(json.dumps(registro, ensure_ascii=False) + "\n")
@@ -0,0 +1,81 @@
+import statistics
+from utils.logger import Logger
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError: # pytest-xdist es opcional: sin él no hay reparto entre workers
+    LoadScheduling = None
+
+def ordenar_por_duracion(tests, estimaciones):
+    """Índices de tests ordenados de mayor a menor duración estimada.
+
+    Los tests sin historial se estiman con la mediana de los conocidos. A
+    igual duración se conserva el orden de colección.
+    """
+    conocidas = [estimaciones[t] for t in tests if t in estimaciones]
+    por_defecto = statistics.median(conocidas) if conocidas else 0.0
+    duraciones = [estimaciones.get(t, por_defecto) for t in tests]
+    return sorted(range(len(tests)), key=lambda i: -duraciones[i]), duraciones
+
+if LoadScheduling is not None:
+    class LongestFirstScheduling(LoadScheduling):
+        """Reparto de xdist que manda primero los tests más largos según el historial.
+
+        Cada worker tiene como mucho dos tests asignados (el que corre y el
+        siguiente, que xdist necesita para el teardown). Cuando termina uno
+        recibe el más largo de los pendientes, así los tests lentos no quedan
+        para el final y la ejecución termina cerca de total/N.
+        """
+
+        def __init__(self, config, log=None, estimaciones=None):
+            super().__init__(config, log)
+            self.estimaciones = estimaciones or {}
+            self.logger = Logger.get_logger(__name__)
+
+        def schedule(self):
+            """Ordena la colección por duración y asigna los primeros tests a cada worker."""
+            assert self.collection_is_completed
+
+            # Nodos nuevos después del reparto inicial
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = next(iter(self.node2collection.values()))
+            orden, duraciones = ordenar_por_duracion(self.collection, self.estimaciones)
+            self.pending[:] = orden
+            if not self.collection:
+                return
+
+            total = sum(duraciones)
+            self.logger.info(
+                "Reparto longest-first: %s tests, %.1fs estimados en total, ideal %.1fs por worker",
+                len(self.collection), total, total / len(self.nodes)
+            )
+
+            # Dos rondas de a un test: el más largo va al primer worker, el segundo al siguiente...
+            for _ in range(2):
+                for node in self.nodes:
+                    self._send_tests(node, 1)
+
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration=0):
+            """Al terminar un test, el worker recibe el pendiente más largo."""
+            if node.shutting_down:
+                return
+            if self.pending:
+                if len(self.node2pending[node]) < 2:
+                    self._send_tests(node, 2 - len(self.node2pending[node]))
+            else:
+                node.shutdown()
+            self.log("num items waiting for node:", len(self.pending))
+else:
+    LongestFirstScheduling = None
@@ -0,0 +1,106 @@
+import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils.logger import Logger
+
+try:
+    from PIL import Image
+except ImportError: # Pillow es opcional: sin él se guarda el PNG tal cual
+    Image = None
+
+class ScreenshotWriter:
+    """Guarda screenshots en segundo plano para no frenar al siguiente test.
+
+    El hook de pytest solo toma los bytes PNG del navegador; la reducción de
+    tamaño, la conversión a JPEG/WebP (si Pillow está instalado) y la
+    escritura a disco se hacen en un pool de hilos. El reporte espera como
+    mucho la conversión (nunca la escritura), y la ruta se registra en el
+    log recién cuando el archivo quedó escrito.
+    """
+
+    FORMATOS = ("png", "jpeg", "webp")
+    MIME = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+
+    def __init__(self, directorio="reports/screenshots", formato="png", max_ancho=0, calidad=80, max_workers=2):
+        self.directorio = directorio
+        self.max_ancho = max_ancho
+        self.calidad = calidad
+        self.logger = Logger.get_logger(__name__)
+
+        if formato != "png" and Image is None:
+            self.logger.warning("Pillow no está instalado: los screenshots se guardan en PNG")
+            formato = "png"
+        self.formato = formato
+
+        os.makedirs(directorio, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshots")
+
+    @property
+    def extension(self):
+        """Extensión de los archivos según el formato."""
+        return "jpg" if self.formato == "jpeg" else self.formato
+
+    def convierte(self):
+        """Indica si los screenshots se reducen o cambian de formato antes de guardarse."""
+        return Image is not None and bool(self.formato != "png" or self.max_ancho)
+
+    def submit(self, png, nombre):
+        """Encola el procesamiento de un screenshot; devuelve un Future con los bytes convertidos.
+
+        El Future se completa apenas termina la conversión (enseguida si no
+        hay conversión); la escritura a disco sigue en segundo plano.
+        """
+        ruta = os.path.join(self.directorio, f"{nombre}.{self.extension}")
+        convertido = Future()
+        if not self.convierte():
+            convertido.set_result(png)
+        self._executor.submit(self._guardar, png, ruta, convertido).add_done_callback(self._informar)
+        return convertido
+
+    def para_reporte(self, convertido, png):
+        """(bytes, mime, extensión) a embeber en el reporte: la imagen tal como se guarda.
+
+        Espera solo la conversión; si falló, usa el PNG original.
+        """
+        try:
+            datos = convertido.result()
+        except Exception:
+            return png, self.MIME["png"], "png" # El error ya quedó en el log
+        return datos, self.MIME[self.formato], self.extension
+
+    def shutdown(self):
+        """Espera a que terminen las escrituras pendientes."""
+        self._executor.shutdown(wait=True)
+
+    def _informar(self, futuro):
+        """Registra el resultado de una escritura cuando termina."""
+        if futuro.exception():
+            self.logger.error("Error al guardar screenshot: %s", futuro.exception())
+        else:
+            self.logger.info("📸 Screenshot guardado en: %s", futuro.result())
+
+    def _guardar(self, png, ruta, convertido):
+        """Convierte el screenshot, publica los bytes en convertido y los escribe (en un hilo de fondo)."""
+        if not convertido.done():
+            try:
+                png = self._convertir(png)
+            except Exception as e:
+                convertido.set_exception(e)
+                raise
+            convertido.set_result(png)
+
+        with open(ruta, "wb") as file:
+            file.write(png)
+        return ruta
+
+    def _convertir(self, png):
+        """Reduce el ancho y cambia el formato según la configuración."""
+        imagen = Image.open(io.BytesIO(png))
+        if self.max_ancho and imagen.width > self.max_ancho:
+            alto = round(imagen.height * self.max_ancho / imagen.width)
+            imagen = imagen.resize((self.max_ancho, alto), Image.LANCZOS)
+        if self.formato == "jpeg":
+            imagen = imagen.convert("RGB")
+        buffer = io.BytesIO()
+        imagen.save(buffer, format=self.formato.upper(), quality=self.calidad, optimize=True)
+        return buffer.getvalue()
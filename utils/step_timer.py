@@ -0,0 +1,99 @@
+import glob
+import json
+import os
+import time
+from contextlib import contextmanager
+from utils.wait_policy import WaitPolicy
+
+class StepTimer:
+    """Mide cuánto tarda cada paso de los page objects (find, click, type, ...).
+
+    Cada paso registra el tiempo total dividido en espera (lo que acumuló la
+    WaitPolicy durante el paso) y comando (el resto), junto con el locator, la
+    clase de página y el test. Solo se registran los pasos de primer nivel:
+    el find interno de un click queda incluido en el click.
+    """
+
+    ARCHIVO = "reports/step_timings.json"
+
+    _actual = None
+
+    def __init__(self):
+        self.pasos = []
+        self.test_id = None
+        self._profundidad = 0
+
+    @classmethod
+    def actual(cls):
+        """Devuelve el registrador del proceso."""
+        if cls._actual is None:
+            cls._actual = cls()
+        return cls._actual
+
+    @contextmanager
+    def paso(self, accion, pagina, locator=None):
+        """Mide un paso de page object."""
+        self._profundidad += 1
+        policy = WaitPolicy.actual()
+        espera_inicial = policy.tiempo_esperado
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._profundidad -= 1
+            if self._profundidad == 0:
+                total = time.perf_counter() - inicio
+                espera = min(policy.tiempo_esperado - espera_inicial, total)
+                self.pasos.append({
+                    "test": self.test_id,
+                    "pagina": pagina,
+                    "accion": accion,
+                    "locator": str(locator) if locator is not None else "",
+                    "total_ms": round(total * 1000, 1),
+                    "espera_ms": round(espera * 1000, 1),
+                    "comando_ms": round((total - espera) * 1000, 1),
+                })
+
+    def exportar(self, ruta):
+        """Escribe los pasos registrados como JSON."""
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as file:
+            json.dump(self.pasos, file, ensure_ascii=False, indent=1)
+
+    @staticmethod
+    def unir_workers(ruta=ARCHIVO):
+        """Une en ruta los archivos por worker (<ruta>_gw*.json) y los borra.
+
+        Devuelve los pasos unidos, o None si no hubo workers de xdist.
+        """
+        base, ext = os.path.splitext(ruta)
+        archivos = sorted(glob.glob(f"{base}_gw*{ext}"))
+        if not archivos:
+            return None
+
+        pasos = []
+        for archivo in archivos:
+            with open(archivo, "r", encoding="utf-8") as file:
+                pasos.extend(json.load(file))
+            os.remove(archivo)
+        with open(ruta, "w", encoding="utf-8") as file:
+            json.dump(pasos, file, ensure_ascii=False, indent=1)
+        return pasos
+
+    @staticmethod
+    def resumen(pasos, limite=10):
+        """Devuelve (pasos más lentos, locators con más tiempo acumulado)."""
+        mas_lentos = sorted(pasos, key=lambda p: p["total_ms"], reverse=True)[:limite]
+
+        por_locator = {}
+        for p in pasos:
+            clave = (p["pagina"], p["locator"])
+            acumulado = por_locator.setdefault(clave, {
+                "pagina": p["pagina"], "locator": p["locator"],
+                "veces": 0, "total_ms": 0.0, "espera_ms": 0.0
+            })
+            acumulado["veces"] += 1
+            acumulado["total_ms"] += p["total_ms"]
+            acumulado["espera_ms"] += p["espera_ms"]
+        locators = sorted(por_locator.values(), key=lambda l: l["total_ms"], reverse=True)[:limite]
+        return mas_lentos, locators
@@ -0,0 +1,94 @@
+import os
+
+MB = 1024 * 1024
+
+class UploadFileFactory:
+    """Crea archivos para los tests de carga (CV) sin escribir su contenido byte a byte.
+
+    El relleno se hace con seek/truncate, así el sistema de archivos crea un
+    archivo disperso: uno de 6 MB cuesta lo mismo que uno de 1 KB. Cada
+    especificación (tipo, tamaño) se crea una sola vez y se reutiliza.
+
+    Tipos:
+        pdf: PDF válido de una página; el relleno va dentro de un stream.
+        corrupto: bytes sin sentido con extensión .pdf.
+        txt: CV en texto plano.
+    """
+
+    TIPOS = ("pdf", "corrupto", "txt")
+
+    def __init__(self, directorio):
+        self.directorio = str(directorio)
+        self._creados = {}
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def crear(self, tipo, tamano=0):
+        """Devuelve la ruta absoluta de un archivo del tipo pedido con al menos tamano bytes."""
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de archivo no soportado: {tipo} (opciones: {', '.join(self.TIPOS)})")
+
+        clave = (tipo, tamano)
+        ruta = self._creados.get(clave)
+        if ruta and os.path.exists(ruta):
+            return ruta
+
+        extension = "txt" if tipo == "txt" else "pdf"
+        ruta = os.path.abspath(os.path.join(self.directorio, f"cv_{tipo}_{tamano}.{extension}"))
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "wb") as file:
+            if tipo == "pdf":
+                self._escribir_pdf(file, tamano)
+            else:
+                file.write(b"\x00\x01\x02\xFF\xFE" if tipo == "corrupto" else
+                           "CV de prueba - Carlos Mendez\nEditor de Video\n".encode("utf-8"))
+                if tamano > file.tell():
+                    file.truncate(tamano)
+        os.replace(temporal, ruta)
+
+        self._creados[clave] = ruta
+        return ruta
+
+    def limpiar(self):
+        """Borra los archivos creados."""
+        for ruta in self._creados.values():
+            if os.path.exists(ruta):
+                os.remove(ruta)
+        self._creados = {}
+
+    @staticmethod
+    def _escribir_pdf(file, tamano):
+        """Escribe un PDF mínimo válido; el stream de contenido se rellena hasta llegar a tamano."""
+        objetos = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        ]
+
+        def armar(relleno):
+            cabecera = b"%PDF-1.4\n"
+            offsets = []
+            for numero, objeto in enumerate(objetos, start=1):
+                offsets.append(len(cabecera))
+                cabecera += b"%d 0 obj\n%s\nendobj\n" % (numero, objeto)
+            offsets.append(len(cabecera))
+            cabecera += b"4 0 obj\n<< /Length %d >>\nstream\n" % relleno
+
+            inicio_xref = len(cabecera) + relleno + len(b"\nendstream\nendobj\n")
+            entradas = b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+            cola = (
+                b"\nendstream\nendobj\n"
+                b"xref\n0 5\n0000000000 65535 f \n" + entradas +
+                b"trailer\n<< /Size 5 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % inicio_xref
+            )
+            return cabecera, cola
+
+        # El largo del relleno cambia la cantidad de dígitos de /Length y startxref: se ajusta hasta que cierre
+        relleno = 0
+        for _ in range(3):
+            cabecera, cola = armar(relleno)
+            relleno = max(0, tamano - len(cabecera) - len(cola))
+        cabecera, cola = armar(relleno)
+
+        file.write(cabecera)
+        file.seek(relleno, os.SEEK_CUR) # Hueco disperso: el stream son ceros (espacio en PDF)
+        file.write(cola)
@@ -0,0 +1,99 @@
+import time
+import weakref
+from contextlib import contextmanager
+from selenium.webdriver.support.ui import WebDriverWait
+
+class WaitPolicy:
+    """Política única de esperas compartida por los fixtures y los page objects.
+
+    Es dueña de la espera implícita, del timeout explícito y de la frecuencia
+    de sondeo. Las esperas explícitas se ejecutan con la espera implícita
+    apagada, así un timeout de 10 s dura 10 s y no 10 s por cada búsqueda
+    interna. También acumula cuánto tiempo de cada test se fue en esperas.
+    """
+
+    _actual = None
+
+    # Segundos extra del script timeout sobre el explícito: las esperas que corren
+    # en el navegador (execute_async_script) terminan solas antes de que Selenium corte
+    MARGEN_SCRIPT = 5
+
+    # Espera implícita vigente en cada driver (evita comandos repetidos y anidados)
+    _implicitas = weakref.WeakKeyDictionary()
+
+    def __init__(self, implicit=10, explicit=10, poll_frequency=0.5):
+        self.implicit = implicit
+        self.explicit = explicit
+        self.poll_frequency = poll_frequency
+        self.tiempo_esperado = 0.0
+
+    @classmethod
+    def actual(cls):
+        """Devuelve la política vigente (creando una por defecto si no se configuró)."""
+        if cls._actual is None:
+            cls._actual = cls()
+        return cls._actual
+
+    @classmethod
+    def configurar(cls, implicit=10, explicit=10, poll_frequency=0.5):
+        """Define la política vigente para todo el proceso."""
+        cls._actual = cls(implicit, explicit, poll_frequency)
+        return cls._actual
+
+    def aplicar(self, driver):
+        """Aplica la espera implícita y el timeout de scripts asíncronos de la política a un driver."""
+        self._fijar_implicita(driver, self.implicit)
+        driver.set_script_timeout(self.explicit + self.MARGEN_SCRIPT)
+
+    def _wait(self, driver, timeout=None, poll_frequency=None):
+        """Crea un WebDriverWait con los valores de la política (usar siempre vía until)."""
+        return WebDriverWait(
+            driver,
+            self.explicit if timeout is None else timeout,
+            poll_frequency=poll_frequency or self.poll_frequency
+        )
+
+    def until(self, driver, condition, timeout=None, poll_frequency=None):
+        """Espera explícita sin interferencia de la espera implícita."""
+        with self.sin_espera_implicita(driver), self.medir():
+            return self._wait(driver, timeout, poll_frequency).until(condition)
+
+    @contextmanager
+    def sin_espera_implicita(self, driver):
+        """Apaga la espera implícita temporalmente (sondeos negativos rápidos).
+
+        Solo envía comandos al driver si la espera implícita está encendida, así
+        un bloque anidado (por ejemplo un until dentro de otro sin_espera_implicita)
+        no la vuelve a encender antes de tiempo.
+        """
+        anterior = WaitPolicy._implicitas.get(driver, self.implicit)
+        if not anterior:
+            yield
+            return
+        self._fijar_implicita(driver, 0)
+        try:
+            yield
+        finally:
+            self._fijar_implicita(driver, anterior)
+
+    @staticmethod
+    def _fijar_implicita(driver, segundos):
+        """Cambia la espera implícita del driver y recuerda el valor vigente."""
+        driver.implicitly_wait(segundos)
+        try:
+            WaitPolicy._implicitas[driver] = segundos
+        except TypeError: # Objeto sin soporte de weakref: no se recuerda
+            pass
+
+    @contextmanager
+    def medir(self):
+        """Suma al contador del test el tiempo transcurrido dentro del bloque."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tiempo_esperado += time.perf_counter() - inicio
+
+    def reiniciar_contador(self):
+        """Pone en cero el tiempo acumulado en esperas (al iniciar cada test)."""
+        self.tiempo_esperado = 0.0